@@ -0,0 +1,16 @@
+from typing import Optional
+from fastapi import HTTPException, Query, status
+
+from app.utils.pagination import decode_cursor
+
+
+def valid_cursor(
+    cursor: Optional[str] = Query(None, description="Keyset cursor returned with the previous page")
+) -> Optional[str]:
+    """Reject a malformed keyset cursor with 400 before the handler runs"""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return cursor
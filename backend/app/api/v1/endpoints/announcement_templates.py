@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from app.db.database import get_db
@@ -41,12 +41,13 @@ async def get_announcement_templates(
         # Get total count for pagination
         total_count = await announcement_template_service.count_templates(search_params)
         
-        return AnnouncementTemplateListResponse(
+        response = AnnouncementTemplateListResponse(
             templates=templates,
             total_count=total_count,
             page=page,
             limit=limit
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(
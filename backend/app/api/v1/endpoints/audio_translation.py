@@ -14,9 +14,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.database import get_db
+from app.utils.gcp_client import gcp_client_manager
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -264,7 +263,9 @@ async def transcribe_audio(
         # Initialize GCP Speech client
         try:
             logger.info("Initializing GCP Speech client...")
-            client = speech.SpeechClient()
+            client = gcp_client_manager.get_speech_client()
+            if client is None:
+                raise RuntimeError("No GCP credentials available")
             logger.info("GCP Speech client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize GCP Speech client: {e}")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
@@ -14,21 +14,31 @@ from app.schemas.general_announcement import (
     GeneralAnnouncementSearch,
     GeneralAnnouncementStatistics
 )
-from app.services.general_announcement_service import get_general_announcement_service, GeneralAnnouncementService
+from app.services.general_announcement_service import get_general_announcement_service, GeneralAnnouncementService, response_cache
+from app.utils.pagination import encode_cursor
+from app.api.v1.dependencies.pagination import valid_cursor
 
 router = APIRouter()
 
 
 @router.get("/", response_model=GeneralAnnouncementListResponse)
 async def get_announcements(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
     model: Optional[str] = Query(None, description="Filter by model (male/female)"),
     search: Optional[str] = Query(None, description="Search term"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Depends(valid_cursor),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all general announcements with optional filtering and pagination"""
+    # Served from memory until the next create/update/delete clears the cache
+    cache_key = str(request.url)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
         announcement_service = get_general_announcement_service(db)
         
@@ -38,21 +48,23 @@ async def get_announcements(
             category=category,
             model=model,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
         
-        # Get announcements
-        announcements = await announcement_service.search_announcements(search_params)
-        
-        # Get total count for pagination
-        total_count = await announcement_service.count_announcements(search_params)
+        # Get announcements and the total count for pagination
+        announcements, total_count = await announcement_service.combined_search(search_params)
         
-        return GeneralAnnouncementListResponse(
+        response = GeneralAnnouncementListResponse(
             announcements=announcements,
             total_count=total_count,
             page=page,
-            limit=limit
+            limit=limit,
+            next_cursor=encode_cursor(announcements[-1]) if len(announcements) == limit else None
         )
+        content = response.model_dump_json()
+        response_cache[cache_key] = content
+        return Response(content=content, media_type="application/json")
         
     except Exception as e:
         raise HTTPException(
@@ -217,11 +229,9 @@ async def get_categories(
     try:
         announcement_service = get_general_announcement_service(db)
         
-        # Get all announcements to extract unique categories
-        announcements = await announcement_service.get_announcements(limit=1000)
-        categories = list(set([ann.category for ann in announcements if ann.category]))
+        categories = await announcement_service.get_categories()
         
-        return {"categories": sorted(categories)}
+        return {"categories": categories}
         
     except Exception as e:
         raise HTTPException(
@@ -237,16 +247,15 @@ async def stream_announcement_video(
     try:
         # Get the announcement using the service
         service = get_general_announcement_service(db)
-        announcement = await service.get_announcement(announcement_id)
-        if not announcement:
+        found, video_path_str = await service.get_video_path(announcement_id)
+        if not found:
             raise HTTPException(status_code=404, detail="Announcement not found")
         
-        if not announcement.isl_video_path:
+        if not video_path_str:
             raise HTTPException(status_code=404, detail="No video available for this announcement")
         
         # Construct the full path to the video file
         # Handle different path formats dynamically
-        video_path_str = announcement.isl_video_path
         
         # If it's an API endpoint URL, extract the filename and construct the file path
         if video_path_str.startswith('/api/v1/isl-videos/serve/'):
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import logging
@@ -10,6 +10,7 @@ from app.schemas.isl_announcement import (
     ISLAnnouncementVideoUpdate,
     ISLAnnouncementResponse,
     ISLAnnouncementListResponse,
+    ISL_ANNOUNCEMENT_LIST_ADAPTER,
     ISLAnnouncementSearch,
     ISLAnnouncementStatistics,
     ISLAnnouncementVideoGenerationRequest,
@@ -18,6 +19,8 @@ from app.schemas.isl_announcement import (
     ISLAnnouncementVideoSaveResponse
 )
 from app.services.isl_announcement_service import get_isl_announcement_service
+from app.utils.pagination import encode_cursor
+from app.api.v1.dependencies.pagination import valid_cursor
 from app.api.v1.endpoints.isl_video_generation import generate_isl_video, save_isl_video
 
 logger = logging.getLogger(__name__)
@@ -79,6 +82,7 @@ async def get_isl_announcements(
     is_active: Optional[bool] = Query(None),
     is_saved: Optional[bool] = Query(None),
     user_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Depends(valid_cursor),
     db: AsyncSession = Depends(get_db)
 ):
     """Get ISL announcements with filtering and pagination"""
@@ -95,23 +99,26 @@ async def get_isl_announcements(
             video_generation_status=video_generation_status,
             is_active=is_active,
             is_saved=is_saved,
-            user_id=user_id
+            user_id=user_id,
+            cursor=cursor
         )
         
-        # Get announcements and total count
-        announcements = await service.search_announcements(search_params)
-        total_count = await service.count_announcements(search_params)
+        # Get announcements and the total count for pagination
+        announcements, total_count = await service.combined_search(search_params)
         
         # Calculate total pages
         total_pages = (total_count + limit - 1) // limit
         
-        return ISLAnnouncementListResponse(
+        response = ISLAnnouncementListResponse(
             announcements=announcements,
             total_count=total_count,
             page=page,
             limit=limit,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=encode_cursor(announcements[-1]) if len(announcements) == limit else None
         )
+        # Serialize in pydantic-core directly instead of re-encoding the model
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting ISL announcements: {str(e)}")
         raise HTTPException(
@@ -372,13 +379,17 @@ async def get_user_isl_announcements(
     user_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Depends(valid_cursor),
     db: AsyncSession = Depends(get_db)
 ):
     """Get ISL announcements for a specific user"""
     try:
         service = get_isl_announcement_service(db)
-        announcements = await service.get_user_announcements(user_id, skip, limit)
-        return announcements
+        announcements = await service.get_user_announcements(user_id, skip, limit, cursor)
+        # The body stays a bare list, so the next keyset cursor goes in a header
+        headers = {"X-Next-Cursor": encode_cursor(announcements[-1])} if len(announcements) == limit else None
+        announcements = ISL_ANNOUNCEMENT_LIST_ADAPTER.validate_python(announcements, from_attributes=True)
+        return Response(content=ISL_ANNOUNCEMENT_LIST_ADAPTER.dump_json(announcements), media_type="application/json", headers=headers)
     except Exception as e:
         logger.error(f"Error getting user ISL announcements: {str(e)}")
         raise HTTPException(
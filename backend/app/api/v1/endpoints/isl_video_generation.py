@@ -5,6 +5,7 @@ Handles text-to-ISL video generation by stitching individual sign videos
 
 from fastapi import APIRouter, HTTPException, Depends, Form
 from fastapi.responses import FileResponse
+import asyncio
 import os
 import subprocess
 import uuid
@@ -15,8 +16,6 @@ from typing import List, Optional
 from pydantic import BaseModel
 from app.core.config import settings
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -314,10 +313,10 @@ async def generate_isl_video(request: VideoGenerationRequest):
         temp_video_id = str(uuid.uuid4())
         temp_output_path = TEMP_VIDEOS_DIR / f"{temp_video_id}.mp4"
 
-        # Stitch videos using FFmpeg
+        # Stitch videos using FFmpeg in a worker thread so the event loop keeps serving
         logger.info(f"Stitching {len(video_files)} videos...")
-        duration = stitch_videos_with_ffmpeg(
-            video_files, str(temp_output_path))
+        duration = await asyncio.to_thread(
+            stitch_videos_with_ffmpeg, video_files, str(temp_output_path))
 
         # Create preview URL
         preview_url = f"/isl-video-generation/preview/{temp_video_id}"
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select
 from typing import List, Optional
 import os
 import subprocess
@@ -14,7 +13,6 @@ from app.schemas.isl_video import (
     ISLVideoStatistics, DuplicateCheckRequest, DuplicateCheckResponse,
     UploadResponse, SyncRequest, SyncResponse
 )
-from app.models.isl_video import ISLVideo as ISLVideoModel
 from app.services.isl_video_service import get_isl_video_service, ISLVideoService
 
 router = APIRouter()
@@ -233,8 +231,7 @@ async def upload_isl_video(
     # Check if file already exists and get existing video record
     original_path = video_folder / filename
     path_str = str(original_path)
-    result = await db.execute(select(ISLVideoModel).where(ISLVideoModel.video_path == path_str))
-    existing_video = result.scalar_one_or_none()
+    existing_video = await video_service.get_video_by_path(path_str)
 
     try:
         with open(str(original_path), "wb") as buffer:
@@ -326,29 +323,21 @@ async def get_isl_videos(
             offset=(page - 1) * limit
         )
 
-        # Get videos
+        # Get the page and the total count for pagination (queried concurrently)
         print("Search parameters created successfully")
-        videos = await video_service.search_isl_videos(search_params)
+        videos, total_videos = await video_service.search_with_count(search_params)
         print(f"Found {len(videos)} videos")
-
-        # Get total count for pagination
-        total_search_params = ISLVideoSearch(
-            model_type=model_type,
-            search_text=search,
-            limit=100,  # Use maximum allowed limit
-            offset=0
-        )
-        total_videos_list = await video_service.search_isl_videos(total_search_params)
-        total_videos = len(total_videos_list)
         print(f"Total videos: {total_videos}")
 
-        return ISLVideoListResponse(
+        response = ISLVideoListResponse(
             videos=videos,
             total=total_videos,
             page=page,
             limit=limit,
             total_pages=(total_videos + limit - 1) // limit
         )
+        # Serialize in pydantic-core directly instead of re-encoding the model
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as e:
         print(f"Error in get_isl_videos: {e}")
         raise HTTPException(
@@ -1,9 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, status
 from typing import List
 import logging
 
-from app.db.database import get_db
 from app.schemas.live_announcement import (
     LiveAnnouncementRequest,
     LiveAnnouncementResponse,
@@ -19,13 +17,12 @@ router = APIRouter()
 
 @router.post("/generate", response_model=LiveAnnouncementResponse)
 async def generate_live_announcement(
-    request: LiveAnnouncementRequest,
-    db: AsyncSession = Depends(get_db)
+    request: LiveAnnouncementRequest
 ) -> LiveAnnouncementResponse:
     """Generate a live ISL announcement"""
     try:
         # Get live announcement service
-        service = get_live_announcement_service(db, sio)
+        service = get_live_announcement_service(sio)
         
         # Add announcement to queue
         announcement_id = await service.add_announcement(request)
@@ -54,12 +51,10 @@ async def generate_live_announcement(
         )
 
 @router.get("/list", response_model=List[LiveAnnouncementItem])
-async def get_live_announcements(
-    db: AsyncSession = Depends(get_db)
-) -> List[LiveAnnouncementItem]:
+async def get_live_announcements() -> List[LiveAnnouncementItem]:
     """Get all live announcements"""
     try:
-        service = get_live_announcement_service(db, sio)
+        service = get_live_announcement_service(sio)
         announcements = await service.get_announcements()
         
         # Sort by received_at descending (newest first)
@@ -76,12 +71,11 @@ async def get_live_announcements(
 
 @router.get("/{announcement_id}", response_model=LiveAnnouncementItem)
 async def get_live_announcement(
-    announcement_id: str,
-    db: AsyncSession = Depends(get_db)
+    announcement_id: str
 ) -> LiveAnnouncementItem:
     """Get a specific live announcement"""
     try:
-        service = get_live_announcement_service(db, sio)
+        service = get_live_announcement_service(sio)
         announcement = await service.get_announcement(announcement_id)
         
         if not announcement:
@@ -103,12 +97,11 @@ async def get_live_announcement(
 
 @router.get("/status/{announcement_id}")
 async def get_announcement_status(
-    announcement_id: str,
-    db: AsyncSession = Depends(get_db)
+    announcement_id: str
 ):
     """Get the status of a specific announcement"""
     try:
-        service = get_live_announcement_service(db, sio)
+        service = get_live_announcement_service(sio)
         announcement = await service.get_announcement(announcement_id)
         
         if not announcement:
@@ -137,22 +130,16 @@ async def get_announcement_status(
         )
 
 @router.delete("/clear")
-async def clear_live_announcements(
-    db: AsyncSession = Depends(get_db)
-):
+async def clear_live_announcements():
     """Clear all live announcements"""
     try:
-        service = get_live_announcement_service(db, sio)
+        service = get_live_announcement_service(sio)
         
         # Clear all announcements from database
         await service.clear_all_announcements()
         
         # Clear the processing queue
-        while not service.processing_queue.empty():
-            try:
-                service.processing_queue.get_nowait()
-            except:
-                break
+        await service.discard_pending()
         
         logger.info("All live announcements cleared")
         
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from typing import List, Optional
 from app.db.database import get_db
 from app.models.train_route_translation import TrainRouteTranslation
 from app.models.train_route import TrainRoute
+from app.services.train_announcement_service import invalidate_translation_cache
 from app.schemas.train_route_translation import (
     TrainRouteTranslationCreate,
     TrainRouteTranslationUpdate,
     TrainRouteTranslationResponse,
-    TrainRouteWithTranslations
+    TrainRouteWithTranslations,
+    ROUTE_LIST_ADAPTER
 )
 
 router = APIRouter()
@@ -51,6 +53,7 @@ async def create_train_route_translation(
     db_translation = TrainRouteTranslation(**translation.model_dump())
     db.add(db_translation)
     await db.commit()
+    invalidate_translation_cache()
     await db.refresh(db_translation)
 
     return db_translation
@@ -152,6 +155,7 @@ async def update_train_route_translation(
             .values(**update_data)
         )
         await db.commit()
+        invalidate_translation_cache()
 
         # Fetch updated record
         result = await db.execute(
@@ -188,6 +192,7 @@ async def delete_train_route_translation(
             TrainRouteTranslation.id == translation_id)
     )
     await db.commit()
+    invalidate_translation_cache()
 
 
 @router.get("/train-routes/with-translations", response_model=List[TrainRouteWithTranslations])
@@ -228,4 +233,5 @@ async def get_train_routes_with_translations(
         }
         routes_with_translations.append(route_data)
 
-    return routes_with_translations
+    routes = ROUTE_LIST_ADAPTER.validate_python(routes_with_translations)
+    return Response(content=ROUTE_LIST_ADAPTER.dump_json(routes), media_type="application/json")
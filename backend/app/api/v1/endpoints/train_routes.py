@@ -4,6 +4,7 @@ from sqlalchemy import select, update, delete, or_
 from typing import List, Optional
 from app.db.database import get_db
 from app.models.train_route import TrainRoute
+from app.services.train_announcement_service import invalidate_translation_cache
 from app.schemas.train_route import TrainRouteCreate, TrainRouteUpdate, TrainRouteResponse
 
 router = APIRouter()
@@ -32,6 +33,7 @@ async def create_train_route(
     db_train_route = TrainRoute(**train_route.model_dump())
     db.add(db_train_route)
     await db.commit()
+    invalidate_translation_cache()
     await db.refresh(db_train_route)
 
     return db_train_route
@@ -149,6 +151,7 @@ async def update_train_route(
             .values(**update_data)
         )
         await db.commit()
+        invalidate_translation_cache()
 
         # Fetch updated record
         result = await db.execute(
@@ -181,3 +184,4 @@ async def delete_train_route(
     # Delete the train route (cascade will automatically delete translations)
     await db.delete(existing_route)
     await db.commit()
+    invalidate_translation_cache()
@@ -11,7 +11,7 @@ from app.schemas.translation import (
     SupportedLanguagesResponse,
     SupportedLanguage
 )
-from app.services.translation_service import translation_service
+from app.services.translation_service import get_translation_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,7 +40,7 @@ async def translate_text(request: TranslationRequest) -> MultilingualTranslation
         logger.info(f"Translation request: {request.source_language_code} -> {request.target_language_codes}")
         
         # Call the translation service
-        result = translation_service.translate_text(
+        result = await get_translation_service().translate_text(
             text=request.source_text,
             source_language_code=request.source_language_code,
             target_language_codes=request.target_language_codes
@@ -85,7 +85,7 @@ async def get_supported_languages() -> SupportedLanguagesResponse:
         logger.info("Fetching supported languages")
         
         # Get supported languages from the service
-        languages_data = translation_service.get_supported_languages()
+        languages_data = await get_translation_service().get_supported_languages()
         
         if not languages_data:
             logger.warning("No supported languages returned from service")
@@ -127,8 +127,9 @@ async def translation_health_check():
         Status of the translation service
     """
     try:
-        # Try to get supported languages as a health check
-        languages = translation_service.get_supported_languages()
+        # A live supported-languages call, bypassing the cache so broken
+        # credentials or API access show up immediately
+        languages = await get_translation_service().get_supported_languages(use_cache=False)
         
         if languages:
             return {
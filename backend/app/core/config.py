@@ -13,6 +13,19 @@ class Settings(BaseSettings):
     # Server Settings
     HOST: str = "0.0.0.0"
     PORT: int = 5001
+    # When set, run_https.py serves plain HTTP on this UNIX socket and leaves TLS
+    # to an on-host proxy (nginx: proxy_pass http://unix:/run/signverse.sock)
+    UDS_PATH: Optional[str] = None
+    # Worker processes for run_https.py outside DEBUG. Caches and the live
+    # announcement queue are per process, so set REDIS_URL before raising this.
+    WORKERS: int = 1
+    # Longer keep-alive lets clients reuse a TLS connection across requests
+    TIMEOUT_KEEP_ALIVE: int = 30
+    BACKLOG: int = 2048
+    # Unset by default: Socket.IO connections count toward the concurrency limit,
+    # and a single process exits rather than restarting after max requests
+    LIMIT_CONCURRENCY: Optional[int] = None
+    LIMIT_MAX_REQUESTS: Optional[int] = None
 
     # Security Settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -2,10 +2,17 @@ import socketio
 import logging
 from typing import Dict, Any
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# With REDIS_URL set, emits go through Redis pub/sub so clients connected to
+# any worker receive them; otherwise the in-process default manager is used
+client_manager = socketio.AsyncRedisManager(settings.REDIS_URL) if settings.REDIS_URL else None
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(
+    client_manager=client_manager,
     cors_allowed_origins="*",
     logger=True,
     engineio_logger=True,
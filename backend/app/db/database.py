@@ -2,10 +2,36 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
+DATABASE_URL = settings.DATABASE_URL or "sqlite+aiosqlite:///./signverse.db"
+
+engine_options = {}
+if DATABASE_URL.startswith("postgresql+asyncpg"):
+    engine_options = {
+        "connect_args": {
+            # JIT compilation costs more than it saves on these short OLTP queries
+            "server_settings": {"jit": "off"},
+            # Reuse prepared statements (and their plans) across requests
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 1024,
+        },
+        # Keep warm connections ready instead of connecting mid-request
+        "pool_size": 20,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        # Reuse the most recently returned connection so idle ones can age
+        # out and the hot ones keep their prepared statements warm
+        "pool_use_lifo": True,
+    }
+
 # Create async engine
 engine = create_async_engine(
-    settings.DATABASE_URL or "sqlite+aiosqlite:///./signverse.db",
+    DATABASE_URL,
     echo=settings.DEBUG,
+    # Room for every distinct statement shape the services build (the
+    # default of 500 churns once the filtered searches are counted)
+    query_cache_size=1200,
+    **engine_options,
 )
 
 # Create async session factory
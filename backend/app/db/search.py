@@ -0,0 +1,19 @@
+from sqlalchemy import func, literal_column
+
+# Spelled as SQL literals rather than bind parameters so the expression a query
+# builds is identical to the indexed one and PostgreSQL can match the two
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+
+
+def joined_text(columns):
+    """coalesce(col, '') of each column, joined with single spaces.
+
+    Immutable on PostgreSQL (unlike concat_ws), so it can back an expression
+    index, and needs no SQLite 3.44+ functions.
+    """
+    joined = None
+    for column in columns:
+        part = func.coalesce(column, _EMPTY)
+        joined = part if joined is None else joined.concat(_SPACE).concat(part)
+    return joined
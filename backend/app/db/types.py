@@ -0,0 +1,24 @@
+import orjson
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONText(TypeDecorator):
+    """JSON value stored in a TEXT column, encoded and decoded with orjson.
+
+    Kept as TEXT rather than JSON/JSONB so rows written as json.dumps strings
+    by earlier releases read back unchanged on both SQLite and PostgreSQL.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
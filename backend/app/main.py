@@ -4,7 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import socketio
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.utils.logger import setup_logging
+from app.utils.logger import setup_logging, shutdown_logging
 from app.core.socketio import sio
 
 
@@ -14,7 +14,7 @@ async def lifespan(app: FastAPI):
     setup_logging()
     yield
     # Shutdown
-    pass
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -34,6 +34,8 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Keyset cursor for list endpoints whose body is a bare array
+        expose_headers=["X-Next-Cursor"],
     )
 
 # Include API router
@@ -1,7 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Computed, Integer, String, DateTime, Text
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.db.database import Base
 
+SEARCH_BLOB_EXPRESSION = (
+    "lower(coalesce(template_category, '') || ' ' || "
+    "coalesce(template_text_english, '') || ' ' || "
+    "coalesce(template_text_hindi, '') || ' ' || "
+    "coalesce(template_text_gujarati, '') || ' ' || "
+    "coalesce(template_text_marathi, ''))"
+)
+
 
 class AnnouncementTemplateModel(Base):
     __tablename__ = "announcement_templates"
@@ -13,4 +22,8 @@ class AnnouncementTemplateModel(Base):
     template_text_marathi = Column(Text, nullable=True)
     template_text_gujarati = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Lowercased category + all template texts, maintained by the database so
+    # text search is a single LIKE instead of five per-row ILIKEs.
+    # Deferred: only used in WHERE clauses, never loaded with the row.
+    search_blob = deferred(Column(Text, Computed(SEARCH_BLOB_EXPRESSION, persisted=True)))
\ No newline at end of file
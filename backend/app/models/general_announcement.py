@@ -1,6 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, Boolean, Index, column, event
 from sqlalchemy.sql import func
 from app.db.database import Base
+from app.db.search import joined_text
+
+SEARCHABLE_COLUMNS = (
+    "announcement_name",
+    "announcement_text_english",
+    "announcement_text_hindi",
+    "announcement_text_gujarati",
+    "announcement_text_marathi",
+)
 
 
 class GeneralAnnouncement(Base):
@@ -17,4 +26,50 @@ class GeneralAnnouncement(Base):
     announcement_text_marathi = Column(Text, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Fetch server-generated id/timestamps via RETURNING on INSERT, so callers
+    # don't need a refresh() round trip after commit
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Seek key for keyset pagination (newest first)
+        Index("ix_general_announcements_created_at_id", created_at.desc(), id.desc()),
+        # pg_trgm GIN index on the joined texts backs the '%term%' ILIKE
+        # substring search on PostgreSQL; skipped on SQLite, where it would
+        # only be a plain btree
+        Index(
+            "ix_general_announcements_search_text_trgm",
+            joined_text(column(name) for name in SEARCHABLE_COLUMNS).label("search_text"),
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+event.listen(
+    GeneralAnnouncement.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# Full-text search column (PostgreSQL only). Not mapped on the model because
+# tsvector has no SQLite equivalent; queries reference it by name. The
+# 'simple' config avoids English stemming of Hindi/Gujarati/Marathi text.
+SEARCH_TSV_DDL = (
+    "ALTER TABLE general_announcements ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', "
+    + " || ' ' || ".join(f"coalesce({column}, '')" for column in SEARCHABLE_COLUMNS)
+    + ")) STORED"
+)
+SEARCH_TSV_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_general_announcements_search_tsv "
+    "ON general_announcements USING gin (search_tsv)"
+)
+
+for statement in (SEARCH_TSV_DDL, SEARCH_TSV_INDEX_DDL):
+    event.listen(
+        GeneralAnnouncement.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
@@ -1,6 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, Boolean, Float, Index, column, event
 from sqlalchemy.sql import func
 from app.db.database import Base
+from app.db.search import joined_text
+from app.db.types import JSONText
+
+SEARCHABLE_COLUMNS = (
+    "announcement_name",
+    "announcement_text_english",
+    "announcement_text_hindi",
+    "announcement_text_gujarati",
+    "announcement_text_marathi",
+)
 
 
 class ISLAnnouncement(Base):
@@ -25,8 +35,8 @@ class ISLAnnouncement(Base):
     
     # Video generation details
     video_duration = Column(Float, nullable=True)  # Video duration in seconds
-    signs_used = Column(Text, nullable=True)  # JSON string of signs used
-    signs_skipped = Column(Text, nullable=True)  # JSON string of signs skipped
+    signs_used = Column(JSONText, nullable=True)  # JSON list of signs used
+    signs_skipped = Column(JSONText, nullable=True)  # JSON list of signs skipped
     video_generation_status = Column(String(50), nullable=False, default='pending', index=True)  # pending, generating, completed, failed
     
     # User information
@@ -37,3 +47,53 @@ class ISLAnnouncement(Base):
     is_saved = Column(Boolean, nullable=False, default=False, index=True)  # Whether video is saved permanently
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Seek key for keyset pagination (newest first)
+        Index("ix_isl_announcements_created_at_id", created_at.desc(), id.desc()),
+        # Equality filter + newest-first order for the per-user listing and
+        # the status-filtered search, so neither needs a sort step
+        Index("ix_isl_announcements_user_id_created_at_id", user_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_isl_announcements_status_created_at_id",
+            video_generation_status, created_at.desc(), id.desc(),
+        ),
+        # pg_trgm GIN index on the joined texts backs the '%term%' ILIKE
+        # substring search on PostgreSQL; skipped on SQLite, where it would
+        # only be a plain btree
+        Index(
+            "ix_isl_announcements_search_text_trgm",
+            joined_text(column(name) for name in SEARCHABLE_COLUMNS).label("search_text"),
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+event.listen(
+    ISLAnnouncement.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+# Full-text search column (PostgreSQL only). Not mapped on the model because
+# tsvector has no SQLite equivalent; queries reference it by name. The
+# 'simple' config avoids English stemming of Hindi/Gujarati/Marathi text.
+SEARCH_TSV_DDL = (
+    "ALTER TABLE isl_announcements ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', "
+    + " || ' ' || ".join(f"coalesce({column}, '')" for column in SEARCHABLE_COLUMNS)
+    + ")) STORED"
+)
+SEARCH_TSV_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_isl_announcements_search_tsv "
+    "ON isl_announcements USING gin (search_tsv)"
+)
+
+for statement in (SEARCH_TSV_DDL, SEARCH_TSV_INDEX_DDL):
+    event.listen(
+        ISLAnnouncement.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
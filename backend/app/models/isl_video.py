@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text
+from sqlalchemy import DDL, Column, Integer, String, Float, Boolean, DateTime, Text, Index, column, event
 from sqlalchemy.sql import func
 from app.db.database import Base
 
+SEARCHABLE_COLUMNS = ("display_name", "filename", "description", "tags")
+
 
 class ISLVideo(Base):
     __tablename__ = "isl_videos"
@@ -26,3 +28,28 @@ class ISLVideo(Base):
                         server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(
     ), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Model type filter + newest-first order used by the library listing
+        Index("ix_isl_videos_model_type_created_at", model_type, created_at.desc()),
+        # Duplicate checks on upload resolve from the index alone
+        Index("ix_isl_videos_filename_model_type_file_size", filename, model_type, file_size),
+        Index("ix_isl_videos_display_name_model_type", display_name, model_type),
+    ) + tuple(
+        # Functional pg_trgm GIN indexes back the lower(col) LIKE '%term%'
+        # search on PostgreSQL
+        Index(
+            f"ix_isl_videos_{name}_lower_trgm",
+            func.lower(column(name)).label(f"{name}_lower"),
+            postgresql_using="gin",
+            postgresql_ops={f"{name}_lower": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+        for name in SEARCHABLE_COLUMNS
+    )
+
+
+event.listen(
+    ISLVideo.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -22,4 +22,13 @@ class LiveAnnouncement(Base):
     error_message = Column(Text, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     received_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    __table_args__ = (
+        # Partial index: lookups by announcement_id only ever want the active row
+        Index(
+            "ix_live_announcements_active_announcement_id",
+            announcement_id,
+            postgresql_where=is_active,
+            sqlite_where=is_active,
+        ),
+    )
@@ -0,0 +1,12 @@
+from typing import Annotated
+from pydantic import StringConstraints
+
+
+# Shared constrained string types. Reusing one Annotated alias per constraint
+# set lets pydantic build the string schema once instead of per field.
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+Name255 = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Category100 = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+Path500 = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+TrainNumber = Annotated[str, StringConstraints(min_length=5, max_length=5)]
+StationCode = Annotated[str, StringConstraints(max_length=10)]
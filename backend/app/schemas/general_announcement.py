@@ -44,6 +44,7 @@ class GeneralAnnouncementListResponse(BaseModel):
     total_count: int
     page: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class GeneralAnnouncementSearch(BaseModel):
@@ -52,6 +53,7 @@ class GeneralAnnouncementSearch(BaseModel):
     model: Optional[str] = None
     page: int = Field(1, ge=1)
     limit: int = Field(10, ge=1, le=100)
+    cursor: Optional[str] = Field(None, description="Opaque keyset cursor; takes precedence over page")
 
 
 class GeneralAnnouncementStatistics(BaseModel):
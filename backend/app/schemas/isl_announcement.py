@@ -1,16 +1,23 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
+from app.schemas.common import Category100, Name255, NonEmptyStr
 
 
-class ISLAnnouncementBase(BaseModel):
-    announcement_name: str = Field(..., min_length=1, max_length=255)
-    category: str = Field(..., min_length=1, max_length=100)
-    model: str = Field(..., pattern="^(male|female)$")
-    announcement_text_english: str = Field(..., min_length=1)
+class _OptionalTextMixin(BaseModel):
+    """Optional translated announcement texts shared by create and update schemas"""
+    model_config = ConfigDict(defer_build=True)
+
     announcement_text_hindi: Optional[str] = None
     announcement_text_gujarati: Optional[str] = None
     announcement_text_marathi: Optional[str] = None
+
+
+class ISLAnnouncementBase(_OptionalTextMixin):
+    announcement_name: Name255
+    category: Category100
+    model: str = Field(..., pattern="^(male|female)$")
+    announcement_text_english: NonEmptyStr
     user_id: int = Field(..., gt=0)
 
 
@@ -19,15 +26,12 @@ class ISLAnnouncementCreate(ISLAnnouncementBase):
     pass
 
 
-class ISLAnnouncementUpdate(BaseModel):
+class ISLAnnouncementUpdate(_OptionalTextMixin):
     """Schema for updating an ISL announcement"""
-    announcement_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    category: Optional[str] = Field(None, min_length=1, max_length=100)
+    announcement_name: Optional[Name255] = None
+    category: Optional[Category100] = None
     model: Optional[str] = Field(None, pattern="^(male|female)$")
-    announcement_text_english: Optional[str] = Field(None, min_length=1)
-    announcement_text_hindi: Optional[str] = None
-    announcement_text_gujarati: Optional[str] = None
-    announcement_text_marathi: Optional[str] = None
+    announcement_text_english: Optional[NonEmptyStr] = None
     is_active: Optional[bool] = None
 
 
@@ -54,7 +58,8 @@ class ISLAnnouncementResponse(ISLAnnouncementBase):
     video_duration: Optional[float] = None
     signs_used: Optional[List[str]] = None
     signs_skipped: Optional[List[str]] = None
-    video_generation_status: str
+    # Written only by the service layer; input schemas carry the pattern check
+    video_generation_status: SkipValidation[Literal["pending", "generating", "completed", "failed"]]
     is_active: bool
     is_saved: bool
     created_at: datetime
@@ -64,6 +69,10 @@ class ISLAnnouncementResponse(ISLAnnouncementBase):
         from_attributes = True
 
 
+# Built once at import; serializes a whole list in a single pydantic-core call
+ISL_ANNOUNCEMENT_LIST_ADAPTER = TypeAdapter(List[ISLAnnouncementResponse])
+
+
 class ISLAnnouncementListResponse(BaseModel):
     """Schema for paginated ISL announcement list response"""
     announcements: List[ISLAnnouncementResponse]
@@ -71,6 +80,7 @@ class ISLAnnouncementListResponse(BaseModel):
     page: int
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class ISLAnnouncementSearch(BaseModel):
@@ -84,6 +94,7 @@ class ISLAnnouncementSearch(BaseModel):
     is_active: Optional[bool] = None
     is_saved: Optional[bool] = None
     user_id: Optional[int] = None
+    cursor: Optional[str] = Field(None, description="Opaque keyset cursor; takes precedence over page")
 
 
 class ISLAnnouncementStatistics(BaseModel):
@@ -102,7 +113,7 @@ class ISLAnnouncementStatistics(BaseModel):
 class ISLAnnouncementVideoGenerationRequest(BaseModel):
     """Schema for video generation request"""
     announcement_id: int
-    text: str = Field(..., min_length=1)
+    text: NonEmptyStr
     model: str = Field(..., pattern="^(male|female)$")
     user_id: int = Field(..., gt=0)
 
@@ -121,7 +132,7 @@ class ISLAnnouncementVideoGenerationResponse(BaseModel):
 class ISLAnnouncementVideoSaveRequest(BaseModel):
     """Schema for video save request"""
     announcement_id: int
-    temp_video_id: str = Field(..., min_length=1)
+    temp_video_id: NonEmptyStr
     user_id: int = Field(..., gt=0)
 
 
@@ -1,12 +1,13 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.common import Name255, Path500
 
 
 class ISLVideoBase(BaseModel):
-    filename: str = Field(..., min_length=1, max_length=255)
-    display_name: str = Field(..., min_length=1, max_length=255)
-    video_path: str = Field(..., min_length=1, max_length=500)
+    filename: Name255
+    display_name: Name255
+    video_path: Path500
     file_size: int = Field(..., gt=0)
     duration_seconds: Optional[float] = Field(None, ge=0)
     width: Optional[int] = Field(None, gt=0)
@@ -25,9 +26,9 @@ class ISLVideoCreate(ISLVideoBase):
 
 
 class ISLVideoUpdate(BaseModel):
-    filename: Optional[str] = Field(None, min_length=1, max_length=255)
-    display_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    video_path: Optional[str] = Field(None, min_length=1, max_length=500)
+    filename: Optional[Name255] = None
+    display_name: Optional[Name255] = None
+    video_path: Optional[Path500] = None
     file_size: Optional[int] = Field(None, gt=0)
     duration_seconds: Optional[float] = Field(None, ge=0)
     width: Optional[int] = Field(None, gt=0)
@@ -77,10 +78,10 @@ class ISLVideoStatistics(BaseModel):
 
 
 class DuplicateCheckRequest(BaseModel):
-    filename: str = Field(..., min_length=1, max_length=255)
+    filename: Name255
     model_type: str = Field(..., pattern="^(male|female)$")
     file_size: Optional[int] = Field(None, gt=0)
-    display_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    display_name: Optional[Name255] = None
 
 
 class DuplicateCheckResponse(BaseModel):
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, Literal
 from datetime import datetime
 from enum import Enum
@@ -34,7 +35,8 @@ class LiveAnnouncementUpdate(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if failed")
     updated_at: datetime = Field(..., description="When status was updated")
 
-class LiveAnnouncementItem(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class LiveAnnouncementItem:
     announcement_id: str
     train_number: str
     train_name: str
@@ -1,20 +1,20 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.common import StationCode, TrainNumber
 
 
 class TrainRouteBase(BaseModel):
-    train_number: str = Field(..., min_length=5,
-                              max_length=5, description="5-digit train number")
+    train_number: TrainNumber = Field(..., description="5-digit train number")
     train_name: str = Field(..., description="Name of the train")
     from_station_name: str = Field(...,
                                    description="Name of the departure station")
-    from_station_code: str = Field(..., max_length=10,
-                                   description="Code of the departure station")
+    from_station_code: StationCode = Field(...,
+                                           description="Code of the departure station")
     to_station_name: str = Field(...,
                                  description="Name of the destination station")
-    to_station_code: str = Field(..., max_length=10,
-                                 description="Code of the destination station")
+    to_station_code: StationCode = Field(...,
+                                         description="Code of the destination station")
 
 
 class TrainRouteCreate(TrainRouteBase):
@@ -24,9 +24,9 @@ class TrainRouteCreate(TrainRouteBase):
 class TrainRouteUpdate(BaseModel):
     train_name: Optional[str] = None
     from_station_name: Optional[str] = None
-    from_station_code: Optional[str] = Field(None, max_length=10)
+    from_station_code: Optional[StationCode] = None
     to_station_name: Optional[str] = None
-    to_station_code: Optional[str] = Field(None, max_length=10)
+    to_station_code: Optional[StationCode] = None
 
 
 class TrainRouteResponse(TrainRouteBase):
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -70,7 +71,8 @@ class TrainRouteTranslationResponse(TrainRouteTranslationBase):
         from_attributes = True
 
 
-class TrainRouteWithTranslations(BaseModel):
+@dataclass(slots=True, frozen=True, config=ConfigDict(from_attributes=True))
+class TrainRouteWithTranslations:
     """Response model that includes train route with its translations"""
     id: int
     train_number: str
@@ -83,5 +85,6 @@ class TrainRouteWithTranslations(BaseModel):
     updated_at: Optional[datetime] = None
     translations: Optional[TrainRouteTranslationResponse] = None
 
-    class Config:
-        from_attributes = True
+
+# Built once at import; serializes a whole page in a single pydantic-core call
+ROUTE_LIST_ADAPTER = TypeAdapter(List[TrainRouteWithTranslations])
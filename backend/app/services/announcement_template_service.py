@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from typing import List, Optional
+from sqlalchemy import select, func, lambda_stmt
+from typing import List, NamedTuple, Optional
+from cachetools import TTLCache
 from app.models.announcement_template import AnnouncementTemplateModel
 from app.schemas.announcement_template import (
     AnnouncementTemplateCreate,
@@ -8,6 +9,28 @@ from app.schemas.announcement_template import (
     AnnouncementTemplateSearch
 )
 
+# Distinct categories change only when templates are written; serve them from
+# memory for a minute and drop the entry on every create/update/delete
+_CATEGORIES_KEY = "categories"
+_categories_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+# Template texts by category for announcement generation. Plain tuples rather
+# than ORM objects, so entries never reference a closed session.
+_template_texts_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+class TemplateTexts(NamedTuple):
+    template_text_english: str
+    template_text_hindi: Optional[str]
+    template_text_marathi: Optional[str]
+    template_text_gujarati: Optional[str]
+
+
+def _invalidate_template_caches() -> None:
+    """Drop cached categories and template texts after a write"""
+    _categories_cache.clear()
+    _template_texts_cache.clear()
+
 
 class AnnouncementTemplateService:
     def __init__(self, db: AsyncSession):
@@ -29,32 +52,24 @@ class AnnouncementTemplateService:
 
     async def search_templates(self, search_params: AnnouncementTemplateSearch) -> List[AnnouncementTemplateModel]:
         """Search templates with filters"""
-        query = select(AnnouncementTemplateModel)
+        # Built as a lambda statement so SQLAlchemy caches the compiled SQL per
+        # filter combination; closure values are extracted as bound parameters
+        query = lambda_stmt(lambda: select(AnnouncementTemplateModel))
 
         # Filter by category
-        if search_params.template_category:
-            query = query.where(AnnouncementTemplateModel.template_category == search_params.template_category)
-
+        template_category = search_params.template_category
+        if template_category:
+            query += lambda s: s.where(AnnouncementTemplateModel.template_category == template_category)
 
         # Search by text
         if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    AnnouncementTemplateModel.template_category.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_english.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_hindi.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_gujarati.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_marathi.ilike(search_term)
-                )
-            )
-
-        # Order by creation date (newest first)
-        query = query.order_by(AnnouncementTemplateModel.created_at.desc())
+            search_term = f"%{search_params.search_text.lower()}%"
+            query += lambda s: s.where(AnnouncementTemplateModel.search_blob.like(search_term))
 
-        # Apply pagination
+        # Order by creation date (newest first) and apply pagination
         offset = (search_params.page - 1) * search_params.limit
-        query = query.offset(offset).limit(search_params.limit)
+        limit = search_params.limit
+        query += lambda s: s.order_by(AnnouncementTemplateModel.created_at.desc()).offset(offset).limit(limit)
 
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -70,16 +85,8 @@ class AnnouncementTemplateService:
 
         # Search by text
         if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    AnnouncementTemplateModel.template_category.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_english.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_hindi.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_gujarati.ilike(search_term),
-                    AnnouncementTemplateModel.template_text_marathi.ilike(search_term)
-                )
-            )
+            search_term = f"%{search_params.search_text.lower()}%"
+            query = query.where(AnnouncementTemplateModel.search_blob.like(search_term))
 
         result = await self.db.execute(query)
         return result.scalar()
@@ -90,6 +97,7 @@ class AnnouncementTemplateService:
         self.db.add(db_template)
         await self.db.commit()
         await self.db.refresh(db_template)
+        _invalidate_template_caches()
         return db_template
 
     async def update_template(self, template_id: int, template_update: AnnouncementTemplateUpdate) -> Optional[AnnouncementTemplateModel]:
@@ -104,6 +112,7 @@ class AnnouncementTemplateService:
 
         await self.db.commit()
         await self.db.refresh(db_template)
+        _invalidate_template_caches()
         return db_template
 
     async def delete_template(self, template_id: int) -> bool:
@@ -114,35 +123,56 @@ class AnnouncementTemplateService:
 
         await self.db.delete(db_template)
         await self.db.commit()
+        _invalidate_template_caches()
         return True
 
 
     async def get_template_statistics(self) -> dict:
         """Get template statistics"""
-        # Total templates
-        total_result = await self.db.execute(select(func.count(AnnouncementTemplateModel.id)))
-        total_templates = total_result.scalar()
-
-        # Templates by category
+        # Templates by category; template_category is NOT NULL, so the
+        # per-category counts sum to the grand total and one scan covers both
         category_result = await self.db.execute(
             select(
                 AnnouncementTemplateModel.template_category,
                 func.count(AnnouncementTemplateModel.id)
             ).group_by(AnnouncementTemplateModel.template_category)
         )
-        templates_by_category = dict(category_result.fetchall())
+        templates_by_category = {category: count for category, count in category_result}
+        total_templates = sum(templates_by_category.values())
 
         return {
             "total_templates": total_templates,
             "templates_by_category": templates_by_category
         }
 
-    async def get_categories(self) -> List[str]:
-        """Get all unique categories"""
+    async def get_template_texts(self, category: str) -> Optional[TemplateTexts]:
+        """Get the template texts for a category (None if there is no template)"""
+        if category in _template_texts_cache:
+            return _template_texts_cache[category]
+
         result = await self.db.execute(
-            select(AnnouncementTemplateModel.template_category).distinct()
+            select(
+                AnnouncementTemplateModel.template_text_english,
+                AnnouncementTemplateModel.template_text_hindi,
+                AnnouncementTemplateModel.template_text_marathi,
+                AnnouncementTemplateModel.template_text_gujarati
+            ).where(AnnouncementTemplateModel.template_category == category)
         )
-        return [row[0] for row in result.fetchall()]
+        row = result.one_or_none()
+        texts = TemplateTexts(*row) if row is not None else None
+        _template_texts_cache[category] = texts
+        return texts
+
+    async def get_categories(self) -> List[str]:
+        """Get all unique categories"""
+        categories = _categories_cache.get(_CATEGORIES_KEY)
+        if categories is None:
+            result = await self.db.execute(
+                select(AnnouncementTemplateModel.template_category).distinct()
+            )
+            categories = result.scalars().all()
+            _categories_cache[_CATEGORIES_KEY] = categories
+        return list(categories)
 
 
 def get_announcement_template_service(db: AsyncSession) -> AnnouncementTemplateService:
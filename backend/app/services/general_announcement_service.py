@@ -1,10 +1,15 @@
 import os
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, func, select
-from typing import List, Optional
-from app.models.general_announcement import GeneralAnnouncement as GeneralAnnouncementModel
+from sqlalchemy import and_, delete, func, literal_column, or_, select, update
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from cachetools import TTLCache
+from app.models.general_announcement import GeneralAnnouncement as GeneralAnnouncementModel, SEARCHABLE_COLUMNS
+from app.utils.pagination import paginate_newest_first
+from app.db.search import joined_text
 from app.schemas.general_announcement import (
     GeneralAnnouncementCreate, 
     GeneralAnnouncementUpdate, 
@@ -12,6 +17,33 @@ from app.schemas.general_announcement import (
     GeneralAnnouncementStatistics
 )
 
+# AI avatar models accepted by the schemas (model: ^(male|female)$)
+ANNOUNCEMENT_MODELS = ("male", "female")
+
+# Pagination totals keyed by filter hash (page/limit excluded). Only large
+# counts are cached; cheap ones are always recomputed.
+_COUNT_CACHE_THRESHOLD = 1000
+_count_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+# Dashboard statistics, rebuilt on the first read after any write. The TTL
+# only bounds staleness from writes made by other worker processes.
+_STATISTICS_KEY = "statistics"
+_statistics_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+# Serialized GET responses keyed by path + query string, filled by the API layer
+response_cache: TTLCache = TTLCache(maxsize=128, ttl=30)
+
+# Joined searchable texts; the same expression as the trigram index on
+# PostgreSQL, so the substring ILIKE can use it
+_SEARCH_TEXT = joined_text(getattr(GeneralAnnouncementModel, column) for column in SEARCHABLE_COLUMNS)
+
+
+def _invalidate_read_caches() -> None:
+    """Drop cached counts, statistics and responses after a write"""
+    _count_cache.clear()
+    _statistics_cache.clear()
+    response_cache.clear()
+
 
 class GeneralAnnouncementService:
     def __init__(self, db: AsyncSession):
@@ -23,7 +55,7 @@ class GeneralAnnouncementService:
         db_announcement = GeneralAnnouncementModel(**announcement_data.dict())
         self.db.add(db_announcement)
         await self.db.commit()
-        await self.db.refresh(db_announcement)
+        _invalidate_read_caches()
         return db_announcement
 
     async def get_announcement(self, announcement_id: int) -> Optional[GeneralAnnouncementModel]:
@@ -33,93 +65,154 @@ class GeneralAnnouncementService:
         )
         return result.scalar_one_or_none()
 
-    async def get_announcements(self, skip: int = 0, limit: int = 100) -> List[GeneralAnnouncementModel]:
-        """Get all announcements with pagination"""
+    async def get_video_path(self, announcement_id: int) -> Tuple[bool, Optional[str]]:
+        """Return (exists, isl_video_path) without loading the full row"""
+        result = await self.db.execute(
+            select(GeneralAnnouncementModel.isl_video_path).where(GeneralAnnouncementModel.id == announcement_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return False, None
+        return True, row.isl_video_path
+
+    async def get_categories(self) -> List[str]:
+        """Get all unique categories, sorted"""
         result = await self.db.execute(
-            select(GeneralAnnouncementModel)
-            .offset(skip)
-            .limit(limit)
-            .order_by(GeneralAnnouncementModel.created_at.desc())
+            select(GeneralAnnouncementModel.category).distinct().order_by(GeneralAnnouncementModel.category)
         )
         return result.scalars().all()
 
-    async def search_announcements(self, search_params: GeneralAnnouncementSearch) -> List[GeneralAnnouncementModel]:
-        """Search announcements with filters"""
-        query = select(GeneralAnnouncementModel)
+    async def get_announcements(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[GeneralAnnouncementModel]:
+        """Get all announcements with pagination"""
+        query = self._paginate(select(GeneralAnnouncementModel), skip, limit, cursor)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    def _paginate(self, query, skip: int, limit: int, cursor: Optional[str]):
+        """Order newest first and page by keyset cursor when given, else by offset"""
+        return paginate_newest_first(query, GeneralAnnouncementModel, skip, limit, cursor)
+
+    def _text_search_condition(self, search_text: str):
+        """Build the text search predicate for the current database backend"""
+        # One ILIKE over the concatenated texts instead of five per row;
+        # matches partial words on every backend
+        substring = _SEARCH_TEXT.ilike(f"%{search_text}%")
+        if self.db.bind.dialect.name == "postgresql":
+            # Index probe on the generated search_tsv column adds websearch
+            # syntax (quoted phrases, -negation); the trigram-indexed ILIKE keeps
+            # partial terms matching as they do on SQLite
+            return or_(
+                literal_column("search_tsv").op("@@")(
+                    func.websearch_to_tsquery("simple", search_text)
+                ),
+                substring,
+            )
+
+        return substring
+
+    def _filters(self, search_params: GeneralAnnouncementSearch) -> list:
+        """Build the category/model/text filter clauses shared by search and count"""
+        filters = []
 
         # Filter by category
         if search_params.category:
-            query = query.where(GeneralAnnouncementModel.category == search_params.category)
+            filters.append(GeneralAnnouncementModel.category == search_params.category)
 
         # Filter by model
         if search_params.model:
-            query = query.where(GeneralAnnouncementModel.model == search_params.model)
+            filters.append(GeneralAnnouncementModel.model == search_params.model)
 
         # Search by text
         if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    GeneralAnnouncementModel.announcement_name.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_english.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_hindi.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_gujarati.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_marathi.ilike(search_term)
-                )
-            )
+            filters.append(self._text_search_condition(search_params.search_text))
+
+        return filters
 
-        # Order by creation date (newest first)
-        query = query.order_by(GeneralAnnouncementModel.created_at.desc())
+    async def search_announcements(self, search_params: GeneralAnnouncementSearch) -> List[GeneralAnnouncementModel]:
+        """Search announcements with filters"""
+        query = select(GeneralAnnouncementModel).where(*self._filters(search_params))
 
-        # Apply pagination
+        # Order by creation date (newest first) and apply pagination
         offset = (search_params.page - 1) * search_params.limit
-        query = query.offset(offset).limit(search_params.limit)
+        query = self._paginate(query, offset, search_params.limit, search_params.cursor)
 
         result = await self.db.execute(query)
         return result.scalars().all()
 
     async def count_announcements(self, search_params: GeneralAnnouncementSearch) -> int:
         """Count announcements with filters (without pagination)"""
-        query = select(func.count(GeneralAnnouncementModel.id))
+        query = select(func.count(GeneralAnnouncementModel.id)).where(*self._filters(search_params))
 
-        # Filter by category
-        if search_params.category:
-            query = query.where(GeneralAnnouncementModel.category == search_params.category)
+        filter_key = f"{search_params.category}|{search_params.model}|{search_params.search_text}"
 
-        # Filter by model
-        if search_params.model:
-            query = query.where(GeneralAnnouncementModel.model == search_params.model)
+        async def run_count() -> int:
+            result = await self.db.execute(query)
+            return result.scalar()
 
-        # Search by text
-        if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    GeneralAnnouncementModel.announcement_name.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_english.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_hindi.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_gujarati.ilike(search_term),
-                    GeneralAnnouncementModel.announcement_text_marathi.ilike(search_term)
-                )
+        return await self._cached_count(filter_key, run_count)
+
+    async def combined_search(self, search_params: GeneralAnnouncementSearch) -> Tuple[List[GeneralAnnouncementModel], int]:
+        """Search announcements and count all matches in a single query"""
+        if search_params.cursor:
+            # The seek predicate would also narrow count(*) OVER (), so the
+            # total has to come from the (cached) filter-only count
+            return (
+                await self.search_announcements(search_params),
+                await self.count_announcements(search_params),
             )
 
-        result = await self.db.execute(query)
-        return result.scalar()
+        query = select(
+            GeneralAnnouncementModel, func.count().over().label("total")
+        ).where(*self._filters(search_params))
+        offset = (search_params.page - 1) * search_params.limit
+        query = self._paginate(query, offset, search_params.limit, None)
+
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            # Past the last page (or no matches): the window has no rows to report on
+            return [], await self.count_announcements(search_params) if offset else 0
+        return [row[0] for row in rows], rows[0].total
+
+    async def _cached_count(self, filter_key: str, query_factory: Callable[[], Awaitable[int]]) -> int:
+        """Return a cached pagination total, running the count query on a miss"""
+        cache_key = f"count:{hashlib.sha1(filter_key.encode()).hexdigest()}"
+        count = _count_cache.get(cache_key)
+        if count is None:
+            count = await query_factory()
+            if count > _COUNT_CACHE_THRESHOLD:
+                _count_cache[cache_key] = count
+        return count
 
     async def update_announcement(self, announcement_id: int, announcement_update: GeneralAnnouncementUpdate) -> Optional[GeneralAnnouncementModel]:
         """Update announcement"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
-            return None
-
         update_data = announcement_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_announcement, field, value)
+        if not update_data:
+            return await self.get_announcement(announcement_id)
 
+        # Single UPDATE ... RETURNING instead of SELECT, mutate, flush, refresh
+        result = await self.db.execute(
+            update(GeneralAnnouncementModel)
+            .where(GeneralAnnouncementModel.id == announcement_id)
+            .values(**update_data)
+            .returning(GeneralAnnouncementModel)
+            .execution_options(populate_existing=True)
+        )
+        db_announcement = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(db_announcement)
+        if db_announcement:
+            _invalidate_read_caches()
         return db_announcement
 
+    # Stored video path formats and how each maps to a file on disk;
+    # anything else is used as-is
+    _PREFIX_HANDLERS = (
+        # API endpoint URL: /api/v1/isl-videos/serve/<user>/<filename>
+        ('/api/v1/isl-videos/serve/', lambda path: Path(f"uploads/isl-videos/user_1/{path.rsplit('/', 1)[-1]}")),
+        # Repo-relative path; we already run from the backend directory
+        ('backend/', lambda path: Path(path[len('backend/'):])),
+    )
+    _PREFIXES = tuple(prefix for prefix, _ in _PREFIX_HANDLERS)
+
     def _delete_video_file(self, video_path: str) -> bool:
         """Delete the video file associated with an announcement"""
         if not video_path:
@@ -127,25 +220,21 @@ class GeneralAnnouncementService:
         
         try:
             # Handle different path formats
-            if video_path.startswith('/api/v1/isl-videos/serve/'):
-                # Extract filename from API endpoint URL
-                filename = video_path.split('/')[-1]
-                file_path = Path(f"uploads/isl-videos/user_1/{filename}")
-            elif video_path.startswith('backend/'):
-                # Remove 'backend/' prefix
-                file_path = Path(video_path[8:])
+            if video_path.startswith(self._PREFIXES):
+                file_path = next(
+                    resolve(video_path) for prefix, resolve in self._PREFIX_HANDLERS
+                    if video_path.startswith(prefix)
+                )
             else:
-                # Use the path as is
                 file_path = Path(video_path)
             
-            # Check if file exists and delete it
-            if file_path.exists():
+            # Delete the file; a missing file is considered deleted
+            try:
                 file_path.unlink()
                 self.logger.info(f"Deleted video file: {file_path}")
-                return True
-            else:
+            except FileNotFoundError:
                 self.logger.warning(f"Video file not found: {file_path}")
-                return True  # File doesn't exist, consider it deleted
+            return True
                 
         except Exception as e:
             self.logger.error(f"Failed to delete video file {video_path}: {str(e)}")
@@ -153,42 +242,67 @@ class GeneralAnnouncementService:
 
     async def hard_delete_announcement(self, announcement_id: int) -> bool:
         """Permanently delete announcement and its associated video file"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
+        # Delete the database record, getting back only the video path
+        result = await self.db.execute(
+            delete(GeneralAnnouncementModel)
+            .where(GeneralAnnouncementModel.id == announcement_id)
+            .returning(GeneralAnnouncementModel.isl_video_path)
+        )
+        deleted = result.one_or_none()
+        await self.db.commit()
+        if deleted is None:
             return False
+        _invalidate_read_caches()
 
         # Delete the associated video file if it exists
-        if db_announcement.isl_video_path:
-            video_deleted = self._delete_video_file(db_announcement.isl_video_path)
+        isl_video_path = deleted.isl_video_path
+        video_deleted = True
+        if isl_video_path:
+            # Blocking filesystem calls run in a worker thread, off the event loop
+            video_deleted = await asyncio.to_thread(self._delete_video_file, isl_video_path)
             if not video_deleted:
-                self.logger.warning(f"Failed to delete video file for announcement {announcement_id}, but continuing with database deletion")
-
-        # Delete the database record
-        await self.db.delete(db_announcement)
-        await self.db.commit()
+                self.logger.warning(f"Failed to delete video file for announcement {announcement_id} after database deletion")
         
-        self.logger.info(f"Successfully deleted announcement {announcement_id} and its associated video file")
+        if video_deleted:
+            self.logger.info(f"Successfully deleted announcement {announcement_id} and its associated video file")
         return True
 
     async def get_announcement_statistics(self) -> GeneralAnnouncementStatistics:
         """Get announcement statistics"""
-        # Total announcements
-        total_result = await self.db.execute(select(func.count(GeneralAnnouncementModel.id)))
-        total_announcements = total_result.scalar()
-
-        # Announcements by category
-        category_result = await self.db.execute(
-            select(GeneralAnnouncementModel.category, func.count(GeneralAnnouncementModel.id))
-            .group_by(GeneralAnnouncementModel.category)
+        statistics = _statistics_cache.get(_STATISTICS_KEY)
+        if statistics is None:
+            statistics = await self._compute_announcement_statistics()
+            _statistics_cache[_STATISTICS_KEY] = statistics
+        return statistics.model_copy(deep=True)
+
+    async def _compute_announcement_statistics(self) -> GeneralAnnouncementStatistics:
+        """Aggregate announcement statistics from the base table"""
+        # One scan: group by the open-ended category and split each group by
+        # the bounded model set with FILTER. category is NOT NULL, so the
+        # per-category counts also sum to the grand total.
+        model_counts = [
+            func.count(GeneralAnnouncementModel.id)
+            .filter(GeneralAnnouncementModel.model == model)
+            .label(model)
+            for model in ANNOUNCEMENT_MODELS
+        ]
+        result = await self.db.execute(
+            select(
+                GeneralAnnouncementModel.category,
+                func.count(GeneralAnnouncementModel.id).label("count"),
+                *model_counts
+            ).group_by(GeneralAnnouncementModel.category)
         )
-        announcements_by_category = {row[0]: row[1] for row in category_result.fetchall()}
 
-        # Announcements by model
-        model_result = await self.db.execute(
-            select(GeneralAnnouncementModel.model, func.count(GeneralAnnouncementModel.id))
-            .group_by(GeneralAnnouncementModel.model)
-        )
-        announcements_by_model = {row[0]: row[1] for row in model_result.fetchall()}
+        announcements_by_category: Dict[str, int] = {}
+        announcements_by_model: Dict[str, int] = {}
+        for row in result:
+            announcements_by_category[row.category] = row.count
+            for model in ANNOUNCEMENT_MODELS:
+                count = row._mapping[model]
+                if count:
+                    announcements_by_model[model] = announcements_by_model.get(model, 0) + count
+        total_announcements = sum(announcements_by_category.values())
 
         return GeneralAnnouncementStatistics(
             total_announcements=total_announcements,
@@ -200,13 +314,17 @@ class GeneralAnnouncementService:
 
     async def update_video_path(self, announcement_id: int, video_path: str) -> Optional[GeneralAnnouncementModel]:
         """Update the ISL video path for an announcement"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
-            return None
-
-        db_announcement.isl_video_path = video_path
+        result = await self.db.execute(
+            update(GeneralAnnouncementModel)
+            .where(GeneralAnnouncementModel.id == announcement_id)
+            .values(isl_video_path=video_path)
+            .returning(GeneralAnnouncementModel)
+            .execution_options(populate_existing=True)
+        )
+        db_announcement = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(db_announcement)
+        if db_announcement:
+            _invalidate_read_caches()
         return db_announcement
 
 
@@ -1,46 +1,264 @@
 import os
+import errno
+import gzip
+import asyncio
+import hashlib
 import shutil
 import logging
-import json
+import orjson
+from string import Template
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional, Set, Tuple, Union
+from cachetools import LRUCache
 from app.schemas.html_generation import SimpleHTMLGenerationRequest, HTMLGenerationResponse
 
 logger = logging.getLogger(__name__)
 
+_COPY_CHUNK_SIZE = 1 << 20
+_ETAG_XATTR = "user.etag"
+# Errors meaning "this fast path is not supported here", as opposed to I/O failures
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+# Hard link impossible: another filesystem, no link support, or link count limit
+_LINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK})
+
+# Rendered (page bytes, digest) keyed by their inputs; the same announcement is
+# typically displayed repeatedly with identical speed/text settings
+_html_cache: LRUCache = LRUCache(maxsize=32)
+
+# ((source path, size, mtime_ns, destination), published inode) of the last
+# video put in the web root; service instances are per call, so it lives here
+_published_video: Optional[Tuple[Tuple[str, int, int, str], int]] = None
+
+# Web roots already created and given the player assets by this process;
+# skips a mkdir and asset check per request
+_ready_web_roots: Set[Path] = set()
+
+
+# Page templates live in backend/templates and are read once at import
+_TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
+
+
+def _load_template(name: str) -> str:
+    """Read a page template; the editor's trailing newline is not part of the markup"""
+    return (_TEMPLATES_DIR / name).read_text(encoding="utf-8").rstrip("\n")
+
+
+# Invariant page skeleton; only the $-placeholders vary per request
+_HTML_TEMPLATE = Template(_load_template("isl_display.html"))
+
+# Footer added only when there is text to show
+_TEXT_SECTION_HTML = _load_template("isl_text_section.html")
+
+
+def _player_asset(name: str, suffix: str) -> Tuple[str, bytes]:
+    """Return a content-hashed filename and the bytes of a static player asset"""
+    content = (_TEMPLATES_DIR / name).read_bytes()
+    return f"player.{hashlib.blake2b(content, digest_size=6).hexdigest()}.{suffix}", content
+
+
+# Styles and scripts shared by every page, published once per web root under
+# content-hashed names so browsers can cache them indefinitely
+_PLAYER_CSS_NAME, _PLAYER_CSS_BYTES = _player_asset("isl_player.css", "css")
+_PLAYER_JS_NAME, _PLAYER_JS_BYTES = _player_asset("isl_player.js", "js")
+
+
+def _split_template(template: Template) -> Tuple[Union[bytes, str], ...]:
+    """Split a Template into pre-encoded literal chunks and placeholder names"""
+    segments: List[Union[bytes, str]] = []
+    position = 0
+    for match in template.pattern.finditer(template.template):
+        segments.append(template.template[position:match.start()].encode("utf-8"))
+        if match.group("escaped") is not None:
+            segments.append(b"$")
+        else:
+            segments.append(match.group("named") or match.group("braced"))
+        position = match.end()
+    segments.append(template.template[position:].encode("utf-8"))
+    return tuple(segment for segment in segments if segment)
+
+
+# Encoded once so rendering only encodes the values that actually vary
+_HTML_SEGMENTS = _split_template(_HTML_TEMPLATE)
+_TEXT_SECTION_HTML_BYTES = _TEXT_SECTION_HTML.encode("utf-8")
+
+
+def _copy_video(source: Path, destination: Path) -> None:
+    """Copy a video and flush it to disk so it can be renamed into place"""
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        _copy_contents(fsrc, fdst)
+        os.fsync(fdst.fileno())
+
+
+def _reset_destination(dst_fd: int, size: int) -> None:
+    """Empty the destination and preallocate it for a byte-by-byte copy"""
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    os.ftruncate(dst_fd, 0)
+    # Contiguous extents up front instead of growing the file per write;
+    # not done before copy_file_range, which may reflink instead of writing
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(dst_fd, 0, size)
+        except OSError as e:
+            logger.debug(f"posix_fallocate unavailable ({e})")
+
+
+def _copy_contents(fsrc: BinaryIO, fdst: BinaryIO) -> None:
+    """Copy between open files in kernel space, falling back to a buffered copy where unsupported"""
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    size = os.fstat(src_fd).st_size
+    if hasattr(os, "copy_file_range"):
+        try:
+            # copy_file_range can reflink on CoW filesystems (XFS/Btrfs)
+            offset = 0
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+                if not copied:
+                    break
+                offset += copied
+            return
+        except OSError as e:
+            # e.g. EXDEV on older kernels or unsupported filesystems; real
+            # I/O errors such as ENOSPC or EIO are not worth retrying
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            logger.debug(f"copy_file_range unavailable ({e}), falling back to sendfile")
+
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    _reset_destination(dst_fd, size)
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+        return
+    except OSError as e:
+        if e.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+        logger.debug(f"sendfile unavailable ({e}), falling back to copyfileobj")
+
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    _reset_destination(dst_fd, size)
+    shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK_SIZE)
+
+
+def _content_digest(content: bytes) -> bytes:
+    """ETag-style digest of file content, as stored in the _ETAG_XATTR attribute"""
+    return hashlib.blake2b(content, digest_size=16).hexdigest().encode()
+
+
+def _write_if_changed(path: Path, content: bytes, digest: Optional[bytes] = None) -> bool:
+    """Atomically write content unless the file already holds it"""
+    if digest is None:
+        digest = _content_digest(content)
+    try:
+        if os.getxattr(path, _ETAG_XATTR) == digest:
+            return False
+    except (OSError, AttributeError):
+        # Missing file, no xattr yet, or xattrs unsupported: compare bytes
+        try:
+            if path.read_bytes() == content:
+                return False
+        except OSError:
+            pass
+
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    try:
+        os.setxattr(path, _ETAG_XATTR, digest)
+    except (OSError, AttributeError):
+        pass
+    return True
+
+
+def _write_with_gzip(path: Path, content: bytes, digest: Optional[bytes] = None) -> bool:
+    """Write content plus a precompressed .gz sibling for nginx gzip_static"""
+    changed = _write_if_changed(path, content, digest)
+    gz_path = path.with_name(f"{path.name}.gz")
+    if changed or not gz_path.exists():
+        # mtime=0 keeps the archive deterministic, so unchanged content
+        # compresses to identical bytes and the rewrite is skipped too
+        _write_if_changed(gz_path, gzip.compress(content, compresslevel=9, mtime=0))
+    return changed
+
+
+def _write_page_files(writes: List[Tuple[Path, bytes, Optional[bytes]]]) -> None:
+    """Write (path, content, digest) entries in order within one worker thread hop"""
+    for path, content, digest in writes:
+        _write_with_gzip(path, content, digest)
+
+
+def _publish_video(source: Path, destination: Path) -> None:
+    """Hard-link the video into the web root, copying only across filesystems"""
+    # A hard link is O(1) and, unlike a symlink, keeps serving the video
+    # after temporary source files are cleaned up
+    temp_path = destination.with_name(f".{destination.name}.tmp")
+    temp_path.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(source, temp_path)
+        except OSError as e:
+            # Other failures (e.g. the source vanished) would fail the copy too
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+            logger.debug(f"Hard link unavailable ({e}), copying video instead")
+            _copy_video(source, temp_path)
+        # Atomic swap: the web server never sees a missing or partial file, and
+        # the previously published inode (possibly another video) is left intact
+        os.replace(temp_path, destination)
+    except BaseException:
+        # Don't leave a half-written copy behind in the web root
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 class HTMLGenerationService:
     def __init__(self):
         self.web_root = Path("/var/www/html")
         self.video_filename = "isl.mp4"
         self.html_filename = "index.html"
+        self.messages_filename = "messages.json"
     
     async def generate_html_page(self, request: SimpleHTMLGenerationRequest) -> HTMLGenerationResponse:
         """Generate HTML page with ISL video"""
         try:
-            # Ensure web root directory exists
-            self.web_root.mkdir(parents=True, exist_ok=True)
+            # Ensure web root directory and player assets exist (once per process; see except below)
+            if self.web_root not in _ready_web_roots:
+                await asyncio.to_thread(self._prepare_web_root)
+                _ready_web_roots.add(self.web_root)
             
             # Copy video file to web root
             video_copied = await self._copy_video_file(request.video_path)
             if not video_copied:
+                _ready_web_roots.discard(self.web_root)
                 return HTMLGenerationResponse(
                     success=False,
                     message="Failed to copy video file",
                     error="Video file not found or could not be copied"
                 )
             
-            # Generate HTML content with playback speed and text options
-            html_content = self._generate_html_content(
-                request.playback_speed, 
-                request.show_text, 
-                request.text_messages
-            )
+            # The page only depends on whether there is text to show; the
+            # messages themselves go to a sibling JSON file fetched by the page
+            available_messages = self._filter_messages(request.show_text, request.text_messages)
+            html_bytes, html_digest = self._get_html_page(request.playback_speed, bool(available_messages))
             
-            # Write HTML file
+            # Write the files (each skipped when unchanged so its mtime/ETag stay stable);
+            # messages first so a freshly written page never fetches stale text
             html_path = self.web_root / self.html_filename
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            writes = []
+            if available_messages:
+                writes.append((self.web_root / self.messages_filename, orjson.dumps(available_messages), None))
+            writes.append((html_path, html_bytes, html_digest))
+            await asyncio.to_thread(_write_page_files, writes)
             
             logger.info(f"HTML page generated successfully at {html_path}")
             
@@ -53,419 +271,110 @@ class HTMLGenerationService:
             
         except Exception as e:
             logger.error(f"Failed to generate HTML page: {str(e)}")
+            # Re-check the directory next time in case it was removed
+            _ready_web_roots.discard(self.web_root)
             return HTMLGenerationResponse(
                 success=False,
                 message="Failed to generate HTML page",
                 error=str(e)
             )
     
+    def _prepare_web_root(self) -> None:
+        """Create the web root and publish the static player stylesheet and script"""
+        self.web_root.mkdir(parents=True, exist_ok=True)
+        _write_page_files([
+            (self.web_root / _PLAYER_CSS_NAME, _PLAYER_CSS_BYTES, None),
+            (self.web_root / _PLAYER_JS_NAME, _PLAYER_JS_BYTES, None),
+        ])
+    
     async def _copy_video_file(self, source_path: str) -> bool:
         """Copy video file to web root directory"""
         try:
             source_file = Path(source_path)
-            if not source_file.exists():
+            destination = self.web_root / self.video_filename
+            
+            # Check and link/copy in one worker thread hop so the event loop is not blocked
+            if not await asyncio.to_thread(self._sync_copy, source_file, destination):
                 logger.error(f"Source video file not found: {source_path}")
                 return False
             
-            destination = self.web_root / self.video_filename
-            
-            # Copy the file
-            shutil.copy2(source_file, destination)
-            logger.info(f"Video file copied from {source_path} to {destination}")
+            logger.debug(f"Video file copied from {source_path} to {destination}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to copy video file: {str(e)}")
             return False
     
-    def _generate_html_content(self, playback_speed: float = 1.0, show_text: bool = True, text_messages: List[Dict[str, str]] = None) -> str:
-        """Generate HTML content with responsive video player and specified playback speed"""
-        
-        logger.info(f"Generating HTML with show_text={show_text}, text_messages={text_messages}")
-        
-        # Generate text section HTML if show_text is True and messages exist
-        text_section_html = ""
-        text_script = ""
-        text_css = ""
-        
-        if show_text and text_messages:
-            logger.info(f"Processing {len(text_messages)} text messages")
-            # Filter out empty messages and create text display
-            available_messages = []
-            for message in text_messages:
-                filtered_message = {k: v for k, v in message.items() if v and v.strip()}
-                if filtered_message:
-                    available_messages.append(filtered_message)
-                    logger.info(f"Added message with languages: {list(filtered_message.keys())}")
-            
-            logger.info(f"Total available messages: {len(available_messages)}")
-            if available_messages:
-                text_section_html = f"""
-    <footer class="footer">
-        <div class="footer-text-container">
-            <div class="footer-text-content active" id="textContent">
-                <!-- Text will be populated by JavaScript -->
-            </div>
-        </div>
-    </footer>"""
-                
-                # Generate CSS for text section
-                text_css = """
-        .footer {
-            width: 100%;
-            background-color: #000;
-            padding: 10px 20px;
-            border-top: 2px solid #333;
-            height: 120px;
-            overflow: hidden;
-        }
-        
-        .footer {
-            width: 100%;
-            
-            text-align: center;
-            height: 100%;
-        }
-        
-        .footer-text-content {
-            width: 100%;
-            min-height: 60px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: opacity 0.5s ease-in-out;
-        }
-        
-        .language-text {
-            font-size: 20px;
-            font-weight: bold;
-            line-height: 1.2;
-            text-align: center;
-            padding: 5px;
-            max-height: 90px;
-            overflow: hidden;
-            opacity: 0;
-            transition: opacity 1s ease-in-out;
-        }
-        
-        .language-text.active {
-            opacity: 1;
-        }
-        
-        .footer-text-content .language-text {
-            opacity: 1;
-        }
+    @staticmethod
+    def _sync_copy(source_file: Path, destination: Path) -> bool:
+        """Blocking half of _copy_video_file; returns False if the source is missing"""
+        global _published_video
+        try:
+            source_stat = source_file.stat()
+        except FileNotFoundError:
+            return False
         
-        .language-text.english {
-            font-weight: bold;
-            color: #ffffff;
-        }
+        # Repeat requests for an unchanged source skip the link/copy entirely,
+        # as long as the published file is still the one we put there
+        fingerprint = (str(source_file), source_stat.st_size, source_stat.st_mtime_ns, str(destination))
+        if _published_video is not None and _published_video[0] == fingerprint:
+            try:
+                if destination.stat().st_ino == _published_video[1]:
+                    return True
+            except FileNotFoundError:
+                pass
         
-        .language-text.hindi {
-            color: #ffd700;
-        }
+        _publish_video(source_file, destination)
+        _published_video = (fingerprint, destination.stat().st_ino)
+        return True
+    
+    def _filter_messages(self, show_text: bool, text_messages: List[Dict[str, str]] = None) -> List[Dict[str, str]]:
+        """Return the messages to display, without blank translations"""
+        if not (show_text and text_messages):
+            logger.debug(f"Text section not generated - show_text: {show_text}, has_messages: {bool(text_messages)}")
+            return []
         
-        .language-text.marathi {
-            color: #00ff00;
-        }
+        # Drop blank translations, then messages left with no text at all
+        available_messages = [
+            filtered_message for message in text_messages
+            if (filtered_message := {k: v for k, v in message.items() if v and v.strip()})
+        ]
         
-        .language-text.gujarati {
-            color: #ff6b6b;
-        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Total available messages: {len(available_messages)} of {len(text_messages)}")
+        return available_messages
+    
+    def _get_html_page(self, playback_speed: float, show_text: bool) -> Tuple[bytes, bytes]:
+        """Return the UTF-8 encoded page and its digest, rendering only for unseen inputs"""
+        # Formatted once: all eight $playback_speed markers share the same bytes
+        speed = format(playback_speed, "g")
+        key = (self.video_filename, speed, show_text)
+        page = _html_cache.get(key)
+        if page is None:
+            html_bytes = b"".join(self._iter_html_content_bytes(speed, show_text))
+            # Digest kept with the bytes so repeat writes don't rehash the page
+            page = (html_bytes, _content_digest(html_bytes))
+            _html_cache[key] = page
+        return page
+
+    def _iter_html_content_bytes(self, playback_speed: str = "1", show_text: bool = True) -> Iterator[bytes]:
+        """Yield the UTF-8 page in chunks; only the per-request values are encoded here"""
+        logger.debug(f"Generating HTML with playback_speed={playback_speed}, show_text={show_text}")
         
-        /* Responsive design for text */
-        @media (max-width: 768px) {
-            .footer {
-                width: 100%;
-            min-height: 60px;
-                padding: 8px 15px;
-            }
-            
-            .footer-text-content {
-                height: 80px;
-            }
-            
-            .language-text {
-                font-size: 18px;
-                max-height: 70px;
-            }
+        values = {
+            "player_css": (_PLAYER_CSS_NAME.encode(),),
+            "player_js": (_PLAYER_JS_NAME.encode(),),
+            "playback_speed": (playback_speed.encode(),),
+            "show_text": (b"true" if show_text else b"false",),
+            "video_filename": (self.video_filename.encode(),),
+            # Footer only when there is text to show
+            "text_section_html": (_TEXT_SECTION_HTML_BYTES,) if show_text else (),
         }
-        
-        @media (max-width: 480px) {
-            .footer {
-                height: 80px;
-                padding: 5px 10px;
-            }
-            
-            .footer-text-content {
-                height: 60px;
-            }
-            
-            .language-text {
-                font-size: 16px;
-                max-height: 50px;
-            }
-        }"""
-                
-                # Create JavaScript for text rotation
-                # Properly escape the messages for JavaScript
-                messages_json = json.dumps(available_messages, ensure_ascii=False)
-                text_script = f"""
-        // Text rotation functionality
-        const textMessages = {messages_json};
-        let currentMessageIndex = 0;
-        let currentLanguageIndex = 0;
-        const languages = ['english', 'hindi', 'marathi', 'gujarati'];
-        const languageColors = {{
-            'english': '#ffffff',
-            'hindi': '#ffd700',
-            'marathi': '#00ff00',
-            'gujarati': '#ff6b6b'
-        }};
-        
-        function displayCurrentText() {{
-            if (textMessages.length === 0) return;
-            
-            const currentMessage = textMessages[currentMessageIndex];
-            const currentLanguage = languages[currentLanguageIndex];
-            const textElement = document.getElementById('textContent');
-            
-            if (currentMessage[currentLanguage]) {{
-                // Create the new text element
-                const newTextElement = document.createElement('div');
-                newTextElement.className = `language-text ${{currentLanguage}}`;
-                newTextElement.style.color = languageColors[currentLanguage];
-                newTextElement.textContent = currentMessage[currentLanguage];
-                
-                // Add fade effect by removing the active class before replacing the text
-                const currentTextElement = textElement.querySelector('.language-text');
-                if (currentTextElement) {{
-                    currentTextElement.classList.remove('active');
-                    
-                    // Wait for fade-out to complete before switching text
-                    setTimeout(() => {{
-                        textElement.innerHTML = '';
-                        textElement.appendChild(newTextElement);
-                        
-                        // Make text visible again
-                        setTimeout(() => {{
-                            newTextElement.classList.add('active');
-                        }}, 50);
-                    }}, 500); // Fade-out time (in ms)
-                }} else {{
-                    // First time - just add the text
-                    textElement.appendChild(newTextElement);
-                    setTimeout(() => {{
-                        newTextElement.classList.add('active');
-                    }}, 50);
-                }}
-            }} else {{
-                // Find next available language for this message
-                let nextLanguageIndex = (currentLanguageIndex + 1) % languages.length;
-                let attempts = 0;
-                while (!currentMessage[languages[nextLanguageIndex]] && attempts < languages.length) {{
-                    nextLanguageIndex = (nextLanguageIndex + 1) % languages.length;
-                    attempts++;
-                }}
-                
-                if (currentMessage[languages[nextLanguageIndex]]) {{
-                    currentLanguageIndex = nextLanguageIndex;
-                    const language = languages[currentLanguageIndex];
-                    
-                    // Create the new text element
-                    const newTextElement = document.createElement('div');
-                    newTextElement.className = `language-text ${{language}}`;
-                    newTextElement.style.color = languageColors[language];
-                    newTextElement.textContent = currentMessage[language];
-                    
-                    // Add fade effect
-                    const currentTextElement = textElement.querySelector('.language-text');
-                    if (currentTextElement) {{
-                        currentTextElement.classList.remove('active');
-                        
-                        setTimeout(() => {{
-                            textElement.innerHTML = '';
-                            textElement.appendChild(newTextElement);
-                            
-                            setTimeout(() => {{
-                                newTextElement.classList.add('active');
-                            }}, 50);
-                        }}, 500);
-                    }} else {{
-                        textElement.appendChild(newTextElement);
-                        setTimeout(() => {{
-                            newTextElement.classList.add('active');
-                        }}, 50);
-                    }}
-                }}
-            }}
-            
-            // Move to next language
-            currentLanguageIndex = (currentLanguageIndex + 1) % languages.length;
-            
-            // If we've shown all languages for this message, move to next message
-            if (currentLanguageIndex === 0) {{
-                currentMessageIndex = (currentMessageIndex + 1) % textMessages.length;
-            }}
-        }}
-        
-        // Start text rotation
-        displayCurrentText();
-        setInterval(displayCurrentText, 10000); // 10 seconds per language"""
+        for segment in _HTML_SEGMENTS:
+            if isinstance(segment, bytes):
+                yield segment
             else:
-                logger.info("No available messages found, skipping text section")
-        else:
-            logger.info(f"Text section not generated - show_text: {show_text}, has_messages: {bool(text_messages)}")
-        
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ISL Announcement Display</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            background-color: #000;
-            color: #fff;
-            font-family: Arial, sans-serif;
-            display: flex;
-            flex-direction: column;
-            min-height: 100vh;
-        }}
-        
-        .main-content {{
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .footer {{
-            background-color: #000;
-            border-top: 2px solid #333;
-            padding: 15px 20px;
-            margin-top: auto;
-        }}
-        
-        .video-container {{
-            position: relative;
-            width: 100%;
-            max-width: 1200px;
-            height: auto;
-            max-height: calc(100vh - 120px);
-            background-color: #000;
-            margin: 0 auto;
-            margin-top: 40px;
-            margin-bottom: 20px;
-        }}
-        
-        .video-container video {{
-            width: 100%;
-            height: auto;
-            display: block;
-            object-fit: contain;
-        }}
-        
-        /* Responsive design */
-        @media (max-width: 768px) {{
-            .video-container {{
-                max-width: 100%;
-                max-height: calc(100vh - 100px);
-                padding: 10px;
-                margin-top: 30px;
-                margin-bottom: 15px;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .video-container {{
-                max-height: calc(100vh - 80px);
-                padding: 5px;
-                margin-top: 20px;
-                margin-bottom: 10px;
-            }}
-        }}
-{text_css}
-        
-    </style>
-</head>
-<body>
-    <div class="main-content">
-        <div class="video-container">
-            <video 
-                id="islVideo" 
-                autoplay 
-                muted 
-                loop 
-                playsinline
-            >
-                <source src="{self.video_filename}" type="video/mp4">
-                Your browser does not support the video tag.
-            </video>
-        </div>
-    </div>
-{text_section_html}
-
-    <script>
-        // Ensure video plays automatically with specified playback speed
-        document.addEventListener('DOMContentLoaded', function() {{
-            const video = document.getElementById('islVideo');
-            if (video) {{
-                // Set playback speed immediately
-                video.playbackRate = {playback_speed};
-                console.log('Video playback speed set to:', {playback_speed} + 'x');
-                
-                // Also set playback speed when video is ready
-                video.addEventListener('loadedmetadata', function() {{
-                    video.playbackRate = {playback_speed};
-                    console.log('Playback speed re-applied on loadedmetadata:', {playback_speed} + 'x');
-                }});
-                
-                video.addEventListener('canplay', function() {{
-                    video.playbackRate = {playback_speed};
-                    console.log('Playback speed re-applied on canplay:', {playback_speed} + 'x');
-                }});
-                
-                video.play().catch(function(error) {{
-                    console.log('Autoplay failed:', error);
-                    // Try to play again after user interaction
-                    document.addEventListener('click', function() {{
-                        video.play();
-                    }}, {{ once: true }});
-                }});
-            }}
-        }});
-        
-        // Additional safety: Set playback speed on any video event
-        document.addEventListener('DOMContentLoaded', function() {{
-            const video = document.getElementById('islVideo');
-            if (video) {{
-                // Set playback speed on multiple events to ensure it sticks
-                const setPlaybackSpeed = function() {{
-                    video.playbackRate = {playback_speed};
-                    console.log('Playback speed enforced:', {playback_speed} + 'x');
-                }};
-                
-                video.addEventListener('loadstart', setPlaybackSpeed);
-                video.addEventListener('loadeddata', setPlaybackSpeed);
-                video.addEventListener('loadedmetadata', setPlaybackSpeed);
-                video.addEventListener('canplay', setPlaybackSpeed);
-                video.addEventListener('canplaythrough', setPlaybackSpeed);
-                video.addEventListener('play', setPlaybackSpeed);
-                video.addEventListener('playing', setPlaybackSpeed);
-            }}
-        }});
-{text_script}
-    </script>
-</body>
-</html>"""
-        
-        return html_content
+                yield from values[segment]
 
 
 def get_html_generation_service() -> HTMLGenerationService:
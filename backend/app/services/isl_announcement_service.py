@@ -1,11 +1,14 @@
 import os
-import json
+import asyncio
 import logging
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, func, select
-from typing import List, Optional, Dict, Any
-from app.models.isl_announcement import ISLAnnouncement as ISLAnnouncementModel
+from sqlalchemy import String, and_, bindparam, cast, delete, func, insert, literal, literal_column, or_, select, union_all, update
+from typing import List, Optional, Dict, Any, Tuple
+from cachetools import TTLCache
+from app.models.isl_announcement import ISLAnnouncement as ISLAnnouncementModel, SEARCHABLE_COLUMNS
+from app.utils.pagination import paginate_newest_first
+from app.db.search import joined_text
 from app.schemas.isl_announcement import (
     ISLAnnouncementCreate, 
     ISLAnnouncementUpdate, 
@@ -14,6 +17,120 @@ from app.schemas.isl_announcement import (
     ISLAnnouncementStatistics
 )
 
+# Pagination totals keyed by the filter values (page/limit excluded). Only
+# large counts are cached; cheap ones are always recomputed.
+_COUNT_CACHE_THRESHOLD = 1000
+_count_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+# Dashboard statistics, cached with the write generation they were computed
+# at. Inserts and deletes adjust the cached counters in place; updates touching
+# a counted column drop them for a rebuild. The TTL only bounds staleness from
+# writes made by other worker processes.
+_STATISTICS_KEY = "statistics"
+_statistics_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+# Bumped before every write that can change the statistics. A computation is
+# only cached if no such write started while it ran, and a write only adjusts
+# counters computed before it started; anything else may already include it.
+_statistics_generation = 0
+_STATISTICS_COLUMNS = frozenset(
+    ("category", "model", "video_generation_status", "user_id", "is_active", "is_saved")
+)
+# Returned by deletes so the removed rows can be subtracted from the counters
+_STATISTICS_RETURNING = tuple(getattr(ISLAnnouncementModel, name) for name in sorted(_STATISTICS_COLUMNS))
+
+# Joined searchable texts; the same expression as the trigram index on
+# PostgreSQL, so the substring ILIKE can use it
+_SEARCH_TEXT = joined_text(getattr(ISLAnnouncementModel, column) for column in SEARCHABLE_COLUMNS)
+
+# Primary-key lookup, built once at import and executed with a bound parameter
+_GET_ANNOUNCEMENT_BY_ID = select(ISLAnnouncementModel).where(
+    ISLAnnouncementModel.id == bindparam("announcement_id")
+)
+
+
+def _count_filter_key(search_params: ISLAnnouncementSearch) -> tuple:
+    """Key for _count_cache: every filter value, without page/limit/cursor"""
+    return (
+        search_params.category,
+        search_params.model,
+        search_params.video_generation_status,
+        search_params.is_active,
+        search_params.is_saved,
+        search_params.user_id,
+        search_params.search_text,
+    )
+
+
+def _begin_statistics_write() -> int:
+    """Mark the start of a write that changes the statistics; returns its generation"""
+    global _statistics_generation
+    _statistics_generation += 1
+    return _statistics_generation
+
+
+def _invalidate_read_caches(statistics_changed: bool = True) -> None:
+    """Drop cached counts, and statistics unless the write left them valid"""
+    _count_cache.clear()
+    if statistics_changed:
+        _statistics_cache.clear()
+
+
+def _apply_row_changes(rows, delta: int, generation: int) -> None:
+    """Record inserted (delta=1) or deleted (delta=-1) rows in the read caches"""
+    _count_cache.clear()
+    cached = _statistics_cache.get(_STATISTICS_KEY)
+    if cached is None:
+        return
+    computed_generation, statistics = cached
+    if computed_generation >= generation:
+        # Computed while this write was in flight, so it may already count the rows
+        _statistics_cache.clear()
+        return
+
+    for row in rows:
+        statistics.total_announcements += delta
+        if row.is_active:
+            statistics.active_announcements += delta
+        else:
+            statistics.inactive_announcements += delta
+        if row.is_saved:
+            statistics.saved_announcements += delta
+        else:
+            statistics.unsaved_announcements += delta
+
+        for counts, key in (
+            (statistics.announcements_by_category, row.category),
+            (statistics.announcements_by_model, row.model),
+            (statistics.announcements_by_status, row.video_generation_status),
+            (statistics.announcements_by_user, str(row.user_id)),
+        ):
+            # Empty groups are dropped, matching what GROUP BY returns
+            count = counts.get(key, 0) + delta
+            if count:
+                counts[key] = count
+            else:
+                counts.pop(key, None)
+
+
+# Stored video path formats and how each maps to a file on disk;
+# anything else is used as-is
+_PREFIX_HANDLERS = (
+    # API endpoint URL: /api/v1/isl-videos/serve/<user>/<filename>
+    ('/api/v1/isl-videos/serve/', lambda path: Path(f"uploads/isl-videos/user_1/{path.rsplit('/', 1)[-1]}")),
+    # Repo-relative path; we already run from the backend directory
+    ('backend/', lambda path: Path(path[len('backend/'):])),
+)
+_PREFIXES = tuple(prefix for prefix, _ in _PREFIX_HANDLERS)
+
+
+def _resolve_video_path(video_path: str) -> Path:
+    """Map a stored video path to the file it refers to on disk"""
+    if video_path.startswith(_PREFIXES):
+        for prefix, resolve in _PREFIX_HANDLERS:
+            if video_path.startswith(prefix):
+                return resolve(video_path)
+    return Path(video_path)
+
 
 class ISLAnnouncementService:
     def __init__(self, db: AsyncSession):
@@ -24,152 +141,182 @@ class ISLAnnouncementService:
         """Create a new ISL announcement record"""
         db_announcement = ISLAnnouncementModel(**announcement_data.dict())
         self.db.add(db_announcement)
+        generation = _begin_statistics_write()
         await self.db.commit()
         await self.db.refresh(db_announcement)
+        _apply_row_changes([db_announcement], 1, generation)
         return db_announcement
 
+    async def create_announcements_bulk(self, items: List[ISLAnnouncementCreate]) -> List[ISLAnnouncementModel]:
+        """Create several ISL announcement records with one INSERT ... RETURNING"""
+        if not items:
+            return []
+
+        generation = _begin_statistics_write()
+        result = await self.db.scalars(
+            insert(ISLAnnouncementModel).returning(ISLAnnouncementModel),
+            [item.dict() for item in items]
+        )
+        db_announcements = result.all()
+        await self.db.commit()
+        _apply_row_changes(db_announcements, 1, generation)
+        return db_announcements
+
     async def get_announcement(self, announcement_id: int) -> Optional[ISLAnnouncementModel]:
         """Get announcement by ID"""
-        result = await self.db.execute(
-            select(ISLAnnouncementModel).where(ISLAnnouncementModel.id == announcement_id)
-        )
+        result = await self.db.execute(_GET_ANNOUNCEMENT_BY_ID, {"announcement_id": announcement_id})
         return result.scalar_one_or_none()
 
-    async def get_announcements(self, skip: int = 0, limit: int = 100) -> List[ISLAnnouncementModel]:
+    async def get_announcements(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[ISLAnnouncementModel]:
         """Get all announcements with pagination"""
-        result = await self.db.execute(
-            select(ISLAnnouncementModel)
-            .offset(skip)
-            .limit(limit)
-            .order_by(ISLAnnouncementModel.created_at.desc())
-        )
+        query = paginate_newest_first(select(ISLAnnouncementModel), ISLAnnouncementModel, skip, limit, cursor)
+        result = await self.db.execute(query)
         return result.scalars().all()
 
-    async def search_announcements(self, search_params: ISLAnnouncementSearch) -> List[ISLAnnouncementModel]:
-        """Search announcements with filters"""
-        query = select(ISLAnnouncementModel)
+    def _text_search_condition(self, search_text: str):
+        """Build the text search predicate for the current database backend"""
+        # One ILIKE over the joined texts instead of one LIKE per column;
+        # matches partial words on every backend
+        substring = _SEARCH_TEXT.ilike(f"%{search_text}%")
+        if self.db.bind.dialect.name == "postgresql":
+            # Index probe on the generated search_tsv column adds websearch
+            # syntax (quoted phrases, -negation); the trigram-indexed ILIKE keeps
+            # partial terms matching as they do on SQLite
+            return or_(
+                literal_column("search_tsv").op("@@")(
+                    func.websearch_to_tsquery("simple", search_text)
+                ),
+                substring,
+            )
+
+        return substring
+
+    def _filters(self, search_params: ISLAnnouncementSearch) -> list:
+        """Build the filter clauses shared by search, count and iteration"""
+        filters = []
 
         # Filter by category
         if search_params.category:
-            query = query.where(ISLAnnouncementModel.category == search_params.category)
+            filters.append(ISLAnnouncementModel.category == search_params.category)
 
         # Filter by model
         if search_params.model:
-            query = query.where(ISLAnnouncementModel.model == search_params.model)
+            filters.append(ISLAnnouncementModel.model == search_params.model)
 
         # Filter by video generation status
         if search_params.video_generation_status:
-            query = query.where(ISLAnnouncementModel.video_generation_status == search_params.video_generation_status)
+            filters.append(ISLAnnouncementModel.video_generation_status == search_params.video_generation_status)
 
         # Filter by active status
         if search_params.is_active is not None:
-            query = query.where(ISLAnnouncementModel.is_active == search_params.is_active)
+            filters.append(ISLAnnouncementModel.is_active == search_params.is_active)
 
         # Filter by saved status
         if search_params.is_saved is not None:
-            query = query.where(ISLAnnouncementModel.is_saved == search_params.is_saved)
+            filters.append(ISLAnnouncementModel.is_saved == search_params.is_saved)
 
         # Filter by user
         if search_params.user_id:
-            query = query.where(ISLAnnouncementModel.user_id == search_params.user_id)
+            filters.append(ISLAnnouncementModel.user_id == search_params.user_id)
 
         # Search by text
         if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    ISLAnnouncementModel.announcement_name.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_english.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_hindi.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_gujarati.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_marathi.ilike(search_term)
-                )
-            )
+            filters.append(self._text_search_condition(search_params.search_text))
 
-        # Order by creation date (newest first)
-        query = query.order_by(ISLAnnouncementModel.created_at.desc())
+        return filters
 
-        # Apply pagination
+    async def search_announcements(self, search_params: ISLAnnouncementSearch) -> List[ISLAnnouncementModel]:
+        """Search announcements with filters"""
+        query = select(ISLAnnouncementModel).where(*self._filters(search_params))
+
+        # Order by creation date (newest first) and apply pagination
         offset = (search_params.page - 1) * search_params.limit
-        query = query.offset(offset).limit(search_params.limit)
+        query = paginate_newest_first(query, ISLAnnouncementModel, offset, search_params.limit, search_params.cursor)
 
         result = await self.db.execute(query)
         return result.scalars().all()
 
     async def count_announcements(self, search_params: ISLAnnouncementSearch) -> int:
         """Count announcements with filters (without pagination)"""
-        query = select(func.count(ISLAnnouncementModel.id))
-
-        # Apply same filters as search_announcements
-        if search_params.category:
-            query = query.where(ISLAnnouncementModel.category == search_params.category)
-
-        if search_params.model:
-            query = query.where(ISLAnnouncementModel.model == search_params.model)
-
-        if search_params.video_generation_status:
-            query = query.where(ISLAnnouncementModel.video_generation_status == search_params.video_generation_status)
-
-        if search_params.is_active is not None:
-            query = query.where(ISLAnnouncementModel.is_active == search_params.is_active)
+        filter_key = _count_filter_key(search_params)
+        count = _count_cache.get(filter_key)
+        if count is None:
+            query = select(func.count(ISLAnnouncementModel.id)).where(*self._filters(search_params))
+            result = await self.db.execute(query)
+            count = result.scalar()
+            if count > _COUNT_CACHE_THRESHOLD:
+                _count_cache[filter_key] = count
+        return count
+
+    async def _update_fields(self, announcement_id: int, update_data: Dict[str, Any]) -> Optional[ISLAnnouncementModel]:
+        """Apply column values with a single UPDATE ... RETURNING round trip"""
+        if not update_data:
+            return await self.get_announcement(announcement_id)
+
+        statistics_changed = not _STATISTICS_COLUMNS.isdisjoint(update_data)
+        if statistics_changed:
+            _begin_statistics_write()
+        # Instead of SELECT, mutate, flush, refresh
+        result = await self.db.execute(
+            update(ISLAnnouncementModel)
+            .where(ISLAnnouncementModel.id == announcement_id)
+            .values(**update_data)
+            .returning(ISLAnnouncementModel)
+            .execution_options(populate_existing=True)
+        )
+        db_announcement = result.scalar_one_or_none()
+        await self.db.commit()
+        if db_announcement:
+            _invalidate_read_caches(statistics_changed=statistics_changed)
+        return db_announcement
 
-        if search_params.is_saved is not None:
-            query = query.where(ISLAnnouncementModel.is_saved == search_params.is_saved)
+    async def search_with_count(self, search_params: ISLAnnouncementSearch) -> Tuple[List[ISLAnnouncementModel], int]:
+        """Run the page query and the total count concurrently"""
+        # A session can't run two statements at once, so the count gets its own
+        # (it only checks out a connection if the count isn't cached)
+        async with AsyncSession(self.db.bind, expire_on_commit=False) as count_session:
+            return await asyncio.gather(
+                self.search_announcements(search_params),
+                ISLAnnouncementService(count_session).count_announcements(search_params),
+            )
 
-        if search_params.user_id:
-            query = query.where(ISLAnnouncementModel.user_id == search_params.user_id)
+    async def combined_search(self, search_params: ISLAnnouncementSearch) -> Tuple[List[ISLAnnouncementModel], int]:
+        """Search announcements and count all matches in a single query"""
+        if search_params.cursor or _count_filter_key(search_params) in _count_cache:
+            # The seek predicate would also narrow count(*) OVER (), and a
+            # cached total makes the plain page query the cheaper one
+            return await self.search_with_count(search_params)
 
-        if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
-                or_(
-                    ISLAnnouncementModel.announcement_name.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_english.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_hindi.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_gujarati.ilike(search_term),
-                    ISLAnnouncementModel.announcement_text_marathi.ilike(search_term)
-                )
-            )
+        query = select(
+            ISLAnnouncementModel, func.count().over().label("total")
+        ).where(*self._filters(search_params))
+        offset = (search_params.page - 1) * search_params.limit
+        query = paginate_newest_first(query, ISLAnnouncementModel, offset, search_params.limit, None)
 
-        result = await self.db.execute(query)
-        return result.scalar()
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            # Past the last page (or no matches): the window has no rows to report on
+            return [], await self.count_announcements(search_params) if offset else 0
+        total = rows[0].total
+        if total > _COUNT_CACHE_THRESHOLD:
+            _count_cache[_count_filter_key(search_params)] = total
+        return [row[0] for row in rows], total
 
     async def update_announcement(self, announcement_id: int, announcement_update: ISLAnnouncementUpdate) -> Optional[ISLAnnouncementModel]:
         """Update announcement"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
-            return None
-
-        update_data = announcement_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_announcement, field, value)
-
-        await self.db.commit()
-        await self.db.refresh(db_announcement)
-        return db_announcement
+        return await self._update_fields(announcement_id, announcement_update.dict(exclude_unset=True))
 
     async def update_video_info(self, announcement_id: int, video_update: ISLAnnouncementVideoUpdate) -> Optional[ISLAnnouncementModel]:
         """Update video-related information"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
-            return None
-
         update_data = video_update.dict(exclude_unset=True)
         
-        # Handle JSON fields
-        if update_data.get('signs_used'):
-            db_announcement.signs_used = json.dumps(update_data['signs_used'])
-        if update_data.get('signs_skipped'):
-            db_announcement.signs_skipped = json.dumps(update_data['signs_skipped'])
-        
-        # Update other fields
-        for field, value in update_data.items():
-            if field not in ['signs_used', 'signs_skipped']:
-                setattr(db_announcement, field, value)
+        # JSON fields are serialized by the column type; empty lists leave
+        # the column as is
+        for field in ('signs_used', 'signs_skipped'):
+            if not update_data.get(field):
+                update_data.pop(field, None)
 
-        await self.db.commit()
-        await self.db.refresh(db_announcement)
-        return db_announcement
+        return await self._update_fields(announcement_id, update_data)
 
     def _delete_video_file(self, video_path: str) -> bool:
         """Delete the video file associated with an announcement"""
@@ -177,26 +324,15 @@ class ISLAnnouncementService:
             return True  # No video file to delete
         
         try:
-            # Handle different path formats
-            if video_path.startswith('/api/v1/isl-videos/serve/'):
-                # Extract filename from API endpoint URL
-                filename = video_path.split('/')[-1]
-                file_path = Path(f"uploads/isl-videos/user_1/{filename}")
-            elif video_path.startswith('backend/'):
-                # Remove 'backend/' prefix
-                file_path = Path(video_path[8:])
-            else:
-                # Use the path as is
-                file_path = Path(video_path)
-            
-            # Check if file exists and delete it
-            if file_path.exists():
+            file_path = _resolve_video_path(video_path)
+
+            # Delete the file; a missing file is considered deleted
+            try:
                 file_path.unlink()
                 self.logger.info(f"Deleted video file: {file_path}")
-                return True
-            else:
+            except FileNotFoundError:
                 self.logger.warning(f"Video file not found: {file_path}")
-                return True  # File doesn't exist, consider it deleted
+            return True
                 
         except Exception as e:
             self.logger.error(f"Failed to delete video file {video_path}: {str(e)}")
@@ -204,70 +340,111 @@ class ISLAnnouncementService:
 
     async def hard_delete_announcement(self, announcement_id: int) -> bool:
         """Permanently delete announcement and its associated video file"""
-        db_announcement = await self.get_announcement(announcement_id)
-        if not db_announcement:
+        # Delete the database record, getting back the video path and the
+        # counted columns
+        generation = _begin_statistics_write()
+        result = await self.db.execute(
+            delete(ISLAnnouncementModel)
+            .where(ISLAnnouncementModel.id == announcement_id)
+            .returning(ISLAnnouncementModel.final_video_path, *_STATISTICS_RETURNING)
+        )
+        deleted = result.one_or_none()
+        await self.db.commit()
+        if deleted is None:
             return False
+        _apply_row_changes([deleted], -1, generation)
 
         # Delete the associated video file if it exists
-        if db_announcement.final_video_path:
-            video_deleted = self._delete_video_file(db_announcement.final_video_path)
+        final_video_path = deleted.final_video_path
+        video_deleted = True
+        if final_video_path:
+            # Blocking filesystem calls run in a worker thread, off the event loop
+            video_deleted = await asyncio.to_thread(self._delete_video_file, final_video_path)
             if not video_deleted:
-                self.logger.warning(f"Failed to delete video file for announcement {announcement_id}, but continuing with database deletion")
+                self.logger.warning(f"Failed to delete video file for announcement {announcement_id} after database deletion")
 
-        # Delete the database record
-        await self.db.delete(db_announcement)
-        await self.db.commit()
-        
-        self.logger.info(f"Successfully deleted ISL announcement {announcement_id} and its associated video file")
+        if video_deleted:
+            self.logger.info(f"Successfully deleted ISL announcement {announcement_id} and its associated video file")
         return True
 
-    async def get_announcement_statistics(self) -> ISLAnnouncementStatistics:
-        """Get announcement statistics"""
-        # Total announcements
-        total_result = await self.db.execute(select(func.count(ISLAnnouncementModel.id)))
-        total_announcements = total_result.scalar()
+    async def hard_delete_announcements_bulk(self, announcement_ids: List[int]) -> int:
+        """Permanently delete several announcements and their video files; returns the number deleted"""
+        if not announcement_ids:
+            return 0
 
-        # Active/Inactive announcements
-        active_result = await self.db.execute(
-            select(func.count(ISLAnnouncementModel.id)).where(ISLAnnouncementModel.is_active == True)
-        )
-        active_announcements = active_result.scalar()
-        inactive_announcements = total_announcements - active_announcements
-
-        # Saved/Unsaved announcements
-        saved_result = await self.db.execute(
-            select(func.count(ISLAnnouncementModel.id)).where(ISLAnnouncementModel.is_saved == True)
+        generation = _begin_statistics_write()
+        result = await self.db.execute(
+            delete(ISLAnnouncementModel)
+            .where(ISLAnnouncementModel.id.in_(announcement_ids))
+            .returning(ISLAnnouncementModel.id, ISLAnnouncementModel.final_video_path, *_STATISTICS_RETURNING)
         )
-        saved_announcements = saved_result.scalar()
-        unsaved_announcements = total_announcements - saved_announcements
-
-        # Announcements by category
-        category_result = await self.db.execute(
-            select(ISLAnnouncementModel.category, func.count(ISLAnnouncementModel.id))
-            .group_by(ISLAnnouncementModel.category)
+        deleted = result.all()
+        await self.db.commit()
+        if not deleted:
+            return 0
+        _apply_row_changes(deleted, -1, generation)
+
+        # Unlink the files concurrently in worker threads
+        video_paths = [row.final_video_path for row in deleted if row.final_video_path]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._delete_video_file, path) for path in video_paths)
         )
-        announcements_by_category = {row[0]: row[1] for row in category_result.fetchall()}
+        failed = results.count(False)
+        if failed:
+            self.logger.warning(f"Failed to delete {failed} video file(s) during bulk ISL announcement deletion")
 
-        # Announcements by model
-        model_result = await self.db.execute(
-            select(ISLAnnouncementModel.model, func.count(ISLAnnouncementModel.id))
-            .group_by(ISLAnnouncementModel.model)
-        )
-        announcements_by_model = {row[0]: row[1] for row in model_result.fetchall()}
+        self.logger.info(f"Deleted {len(deleted)} ISL announcements in bulk")
+        return len(deleted)
 
-        # Announcements by status
-        status_result = await self.db.execute(
-            select(ISLAnnouncementModel.video_generation_status, func.count(ISLAnnouncementModel.id))
-            .group_by(ISLAnnouncementModel.video_generation_status)
+    async def get_announcement_statistics(self) -> ISLAnnouncementStatistics:
+        """Get announcement statistics"""
+        cached = _statistics_cache.get(_STATISTICS_KEY)
+        if cached is not None:
+            return cached[1].model_copy(deep=True)
+
+        generation = _statistics_generation
+        statistics = await self._compute_announcement_statistics()
+        if generation == _statistics_generation:
+            _statistics_cache[_STATISTICS_KEY] = (generation, statistics)
+        return statistics.model_copy(deep=True)
+
+    async def _compute_announcement_statistics(self) -> ISLAnnouncementStatistics:
+        """Aggregate announcement statistics from the base table"""
+        # Total, active and saved counts in a single pass
+        counts_result = await self.db.execute(
+            select(
+                func.count(ISLAnnouncementModel.id).label("total"),
+                func.count(ISLAnnouncementModel.id).filter(ISLAnnouncementModel.is_active == True).label("active"),
+                func.count(ISLAnnouncementModel.id).filter(ISLAnnouncementModel.is_saved == True).label("saved")
+            )
         )
-        announcements_by_status = {row[0]: row[1] for row in status_result.fetchall()}
+        counts = counts_result.one()
+        total_announcements = counts.total
+        active_announcements = counts.active
+        inactive_announcements = total_announcements - active_announcements
+        saved_announcements = counts.saved
+        unsaved_announcements = total_announcements - saved_announcements
 
-        # Announcements by user
-        user_result = await self.db.execute(
-            select(ISLAnnouncementModel.user_id, func.count(ISLAnnouncementModel.id))
-            .group_by(ISLAnnouncementModel.user_id)
-        )
-        announcements_by_user = {str(row[0]): row[1] for row in user_result.fetchall()}
+        # Announcements by category, model, status and user in one round trip
+        dimensions = {
+            "category": ISLAnnouncementModel.category,
+            "model": ISLAnnouncementModel.model,
+            "status": ISLAnnouncementModel.video_generation_status,
+            "user": ISLAnnouncementModel.user_id,
+        }
+        grouped_query = union_all(*[
+            select(
+                literal(name).label("dimension"),
+                cast(column, String).label("key"),
+                func.count(ISLAnnouncementModel.id).label("count")
+            ).group_by(column)
+            for name, column in dimensions.items()
+        ])
+        grouped_result = await self.db.execute(grouped_query)
+
+        grouped_counts: Dict[str, Dict[str, int]] = {name: {} for name in dimensions}
+        for dimension, key, count in grouped_result.fetchall():
+            grouped_counts[dimension][key] = count
 
         return ISLAnnouncementStatistics(
             total_announcements=total_announcements,
@@ -275,21 +452,19 @@ class ISLAnnouncementService:
             inactive_announcements=inactive_announcements,
             saved_announcements=saved_announcements,
             unsaved_announcements=unsaved_announcements,
-            announcements_by_category=announcements_by_category,
-            announcements_by_model=announcements_by_model,
-            announcements_by_status=announcements_by_status,
-            announcements_by_user=announcements_by_user
+            announcements_by_category=grouped_counts["category"],
+            announcements_by_model=grouped_counts["model"],
+            announcements_by_status=grouped_counts["status"],
+            announcements_by_user=grouped_counts["user"]
         )
 
-    async def get_user_announcements(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ISLAnnouncementModel]:
+    async def get_user_announcements(self, user_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[ISLAnnouncementModel]:
         """Get announcements for a specific user"""
-        result = await self.db.execute(
-            select(ISLAnnouncementModel)
-            .where(ISLAnnouncementModel.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(ISLAnnouncementModel.created_at.desc())
+        query = paginate_newest_first(
+            select(ISLAnnouncementModel).where(ISLAnnouncementModel.user_id == user_id),
+            ISLAnnouncementModel, skip, limit, cursor
         )
+        result = await self.db.execute(query)
         return result.scalars().all()
 
 
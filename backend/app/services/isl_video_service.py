@@ -1,9 +1,52 @@
+import os
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, func, select
-from typing import List, Optional
+from sqlalchemy import and_, bindparam, delete, insert, or_, func, select, update
+from typing import List, Optional, Tuple
+from cachetools import TTLCache
 from app.models.isl_video import ISLVideo as ISLVideoModel
 from app.schemas.isl_video import ISLVideoCreate, ISLVideoUpdate, ISLVideoSearch, ISLVideoStatistics
 
+# Library statistics, rebuilt on the first read after any write. The TTL
+# only bounds staleness from writes made by other worker processes.
+_STATISTICS_KEY = "statistics"
+_statistics_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+# Hot key lookups, built once at import and executed with bound parameters
+_GET_VIDEO_BY_ID = select(ISLVideoModel).where(ISLVideoModel.id == bindparam("video_id"))
+_GET_VIDEO_BY_PATH = select(ISLVideoModel).where(ISLVideoModel.video_path == bindparam("video_path"))
+_DUPLICATE_VIDEO_CRITERIA = and_(
+    ISLVideoModel.filename == bindparam("filename"),
+    ISLVideoModel.model_type == bindparam("model_type"),
+    ISLVideoModel.file_size == bindparam("file_size")
+)
+_DUPLICATE_DISPLAY_NAME_CRITERIA = and_(
+    ISLVideoModel.display_name == bindparam("display_name"),
+    ISLVideoModel.model_type == bindparam("model_type")
+)
+# LIMIT 1: the first match answers the question, and several existing
+# duplicates must not make scalar_one_or_none() raise; ordering by id always
+# reports the oldest one
+_FIND_DUPLICATE_VIDEO = (
+    select(ISLVideoModel).where(_DUPLICATE_VIDEO_CRITERIA).order_by(ISLVideoModel.id).limit(1)
+)
+_FIND_DUPLICATE_DISPLAY_NAME = (
+    select(ISLVideoModel).where(_DUPLICATE_DISPLAY_NAME_CRITERIA).order_by(ISLVideoModel.id).limit(1)
+)
+
+
+def _remove_video_file(video_path: str) -> None:
+    """Delete a video file from disk, reporting rather than raising on failure"""
+    try:
+        # One syscall instead of exists() + remove(); missing files are fine
+        os.remove(video_path)
+        print(f"✅ Deleted video file: {video_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(
+            f"⚠️ Warning: Could not delete video file {video_path}: {e}")
+
 
 class ISLVideoService:
     def __init__(self, db: AsyncSession):
@@ -15,13 +58,26 @@ class ISLVideoService:
         self.db.add(db_video)
         await self.db.commit()
         await self.db.refresh(db_video)
+        _statistics_cache.clear()
         return db_video
 
+    async def create_isl_videos_bulk(self, items: List[ISLVideoCreate]) -> List[ISLVideoModel]:
+        """Create several ISL video records with one INSERT ... RETURNING"""
+        if not items:
+            return []
+
+        result = await self.db.scalars(
+            insert(ISLVideoModel).returning(ISLVideoModel),
+            [item.dict() for item in items]
+        )
+        db_videos = result.all()
+        await self.db.commit()
+        _statistics_cache.clear()
+        return db_videos
+
     async def get_isl_video(self, video_id: int) -> Optional[ISLVideoModel]:
         """Get ISL video by ID"""
-        result = await self.db.execute(
-            select(ISLVideoModel).where(ISLVideoModel.id == video_id)
-        )
+        result = await self.db.execute(_GET_VIDEO_BY_ID, {"video_id": video_id})
         return result.scalar_one_or_none()
 
     async def get_isl_videos(self, skip: int = 0, limit: int = 100) -> List[ISLVideoModel]:
@@ -31,29 +87,36 @@ class ISLVideoService:
         )
         return result.scalars().all()
 
-    async def search_isl_videos(self, search_params: ISLVideoSearch) -> List[ISLVideoModel]:
-        """Search ISL videos with filters"""
-        query = select(ISLVideoModel)
+    def _filters(self, search_params: ISLVideoSearch) -> list:
+        """Build the model type/text filter clauses shared by search and count"""
+        filters = []
 
         # Filter by model type
         if search_params.model_type:
-            query = query.where(ISLVideoModel.model_type ==
-                                search_params.model_type)
+            filters.append(ISLVideoModel.model_type == search_params.model_type)
 
         # All videos are considered active (no inactive filtering)
 
         # Search by text
         if search_params.search_text:
-            search_term = f"%{search_params.search_text}%"
-            query = query.where(
+            # lower(col) LIKE can use the functional lower() trigram indexes on
+            # PostgreSQL; the term is lowercased once here rather than per row
+            search_term = f"%{search_params.search_text.lower()}%"
+            filters.append(
                 or_(
-                    ISLVideoModel.display_name.ilike(search_term),
-                    ISLVideoModel.filename.ilike(search_term),
-                    ISLVideoModel.description.ilike(search_term),
-                    ISLVideoModel.tags.ilike(search_term)
+                    func.lower(ISLVideoModel.display_name).like(search_term),
+                    func.lower(ISLVideoModel.filename).like(search_term),
+                    func.lower(ISLVideoModel.description).like(search_term),
+                    func.lower(ISLVideoModel.tags).like(search_term)
                 )
             )
 
+        return filters
+
+    async def search_isl_videos(self, search_params: ISLVideoSearch) -> List[ISLVideoModel]:
+        """Search ISL videos with filters"""
+        query = select(ISLVideoModel).where(*self._filters(search_params))
+
         # Order by creation date (newest first)
         query = query.order_by(ISLVideoModel.created_at.desc())
 
@@ -63,114 +126,144 @@ class ISLVideoService:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def count_isl_videos(self, search_params: ISLVideoSearch) -> int:
+        """Count ISL videos with filters (without pagination)"""
+        result = await self.db.execute(
+            select(func.count(ISLVideoModel.id)).where(*self._filters(search_params))
+        )
+        return result.scalar()
+
+    async def search_with_count(self, search_params: ISLVideoSearch) -> Tuple[List[ISLVideoModel], int]:
+        """Run the page query and the total count concurrently"""
+        # A session can't run two statements at once, so the count gets its own
+        async with AsyncSession(self.db.bind, expire_on_commit=False) as count_session:
+            return await asyncio.gather(
+                self.search_isl_videos(search_params),
+                ISLVideoService(count_session).count_isl_videos(search_params),
+            )
+
     async def update_isl_video(self, video_id: int, video_update: ISLVideoUpdate) -> Optional[ISLVideoModel]:
         """Update ISL video"""
-        db_video = await self.get_isl_video(video_id)
-        if not db_video:
-            return None
-
         update_data = video_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_video, field, value)
+        if not update_data:
+            return await self.get_isl_video(video_id)
 
+        # Single UPDATE ... RETURNING instead of SELECT, mutate, flush, refresh
+        result = await self.db.execute(
+            update(ISLVideoModel)
+            .where(ISLVideoModel.id == video_id)
+            .values(**update_data)
+            .returning(ISLVideoModel)
+            .execution_options(populate_existing=True)
+        )
+        db_video = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(db_video)
+        if db_video:
+            _statistics_cache.clear()
         return db_video
 
     async def delete_isl_video(self, video_id: int) -> bool:
         """Soft delete ISL video (mark as inactive)"""
-        db_video = await self.get_isl_video(video_id)
-        if not db_video:
-            return False
-
-        db_video.is_active = False
+        result = await self.db.execute(
+            update(ISLVideoModel)
+            .where(ISLVideoModel.id == video_id)
+            .values(is_active=False)
+            .returning(ISLVideoModel.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await self.db.commit()
-        return True
+        return deleted
 
     async def hard_delete_isl_video(self, video_id: int) -> bool:
         """Permanently delete ISL video"""
-        db_video = await self.get_isl_video(video_id)
-        if not db_video:
+        # Delete the database record, getting back only the file path
+        result = await self.db.execute(
+            delete(ISLVideoModel)
+            .where(ISLVideoModel.id == video_id)
+            .returning(ISLVideoModel.video_path)
+        )
+        video_path = result.scalar_one_or_none()
+        await self.db.commit()
+        if video_path is None:
             return False
+        _statistics_cache.clear()
 
-        # Delete the physical video file
-        try:
-            import os
-            if os.path.exists(db_video.video_path):
-                os.remove(db_video.video_path)
-                print(f"✅ Deleted video file: {db_video.video_path}")
-        except Exception as e:
-            print(
-                f"⚠️ Warning: Could not delete video file {db_video.video_path}: {e}")
-
-        # Delete the database record
-        await self.db.delete(db_video)
-        await self.db.commit()
+        # Delete the physical video file in a worker thread, off the event loop
+        await asyncio.to_thread(_remove_video_file, video_path)
         return True
 
+    async def hard_delete_isl_videos_bulk(self, video_ids: List[int]) -> int:
+        """Permanently delete several ISL videos and their files; returns the number deleted"""
+        if not video_ids:
+            return 0
+
+        result = await self.db.execute(
+            delete(ISLVideoModel)
+            .where(ISLVideoModel.id.in_(video_ids))
+            .returning(ISLVideoModel.video_path)
+        )
+        video_paths = result.scalars().all()
+        await self.db.commit()
+        if not video_paths:
+            return 0
+        _statistics_cache.clear()
+
+        # Unlink the files concurrently in worker threads
+        await asyncio.gather(
+            *(asyncio.to_thread(_remove_video_file, path) for path in video_paths)
+        )
+        return len(video_paths)
+
     async def check_duplicate_video(self, filename: str, model_type: str, file_size: int) -> Optional[ISLVideoModel]:
         """Check for exact duplicate video (same filename, model type, and file size)"""
         result = await self.db.execute(
-            select(ISLVideoModel).where(
-                and_(
-                    ISLVideoModel.filename == filename,
-                    ISLVideoModel.model_type == model_type,
-                    ISLVideoModel.file_size == file_size
-                )
-            )
+            _FIND_DUPLICATE_VIDEO,
+            {"filename": filename, "model_type": model_type, "file_size": file_size}
         )
         return result.scalar_one_or_none()
 
     async def check_duplicate_by_display_name(self, display_name: str, model_type: str) -> Optional[ISLVideoModel]:
         """Check for duplicate by display name and model type"""
         result = await self.db.execute(
-            select(ISLVideoModel).where(
-                and_(
-                    ISLVideoModel.display_name == display_name,
-                    ISLVideoModel.model_type == model_type
-                )
-            )
+            _FIND_DUPLICATE_DISPLAY_NAME,
+            {"display_name": display_name, "model_type": model_type}
         )
         return result.scalar_one_or_none()
 
     async def get_video_statistics(self) -> ISLVideoStatistics:
         """Get ISL video statistics"""
-        # Total videos
-        total_result = await self.db.execute(select(func.count(ISLVideoModel.id)))
-        total_videos = total_result.scalar()
-
-        # Male videos
-        male_result = await self.db.execute(
-            select(func.count(ISLVideoModel.id)).where(
-                ISLVideoModel.model_type == 'male')
-        )
-        male_videos = male_result.scalar()
-
-        # Female videos
-        female_result = await self.db.execute(
-            select(func.count(ISLVideoModel.id)).where(
-                ISLVideoModel.model_type == 'female')
+        statistics = _statistics_cache.get(_STATISTICS_KEY)
+        if statistics is None:
+            statistics = await self._compute_video_statistics()
+            _statistics_cache[_STATISTICS_KEY] = statistics
+        return statistics.model_copy(deep=True)
+
+    async def _compute_video_statistics(self) -> ISLVideoStatistics:
+        """Aggregate ISL video statistics from the base table"""
+        # Counts, total size and average duration in a single pass
+        result = await self.db.execute(
+            select(
+                func.count(ISLVideoModel.id).label("total"),
+                func.count(ISLVideoModel.id).filter(ISLVideoModel.model_type == 'male').label("male"),
+                func.count(ISLVideoModel.id).filter(ISLVideoModel.model_type == 'female').label("female"),
+                func.sum(ISLVideoModel.file_size).label("total_size"),
+                # avg() already ignores NULL durations
+                func.avg(ISLVideoModel.duration_seconds).label("average_duration"),
+            )
         )
-        female_videos = female_result.scalar()
+        stats = result.one()
+        total_videos = stats.total
+        male_videos = stats.male
+        female_videos = stats.female
+        total_size_bytes = stats.total_size or 0
+        average_duration_seconds = stats.average_duration
+        if average_duration_seconds:
+            average_duration_seconds = float(average_duration_seconds)
 
         # All videos are considered active (no inactive tracking)
         active_videos = total_videos
         inactive_videos = 0
 
-        # Get total file size
-        total_size_result = await self.db.execute(select(func.sum(ISLVideoModel.file_size)))
-        total_size_bytes = total_size_result.scalar() or 0
-
-        # Get average duration
-        avg_duration_result = await self.db.execute(
-            select(func.avg(ISLVideoModel.duration_seconds)).where(
-                ISLVideoModel.duration_seconds.isnot(None)
-            )
-        )
-        average_duration_seconds = avg_duration_result.scalar()
-        if average_duration_seconds:
-            average_duration_seconds = float(average_duration_seconds)
-
         return ISLVideoStatistics(
             total_videos=total_videos,
             male_videos=male_videos,
@@ -192,9 +285,7 @@ class ISLVideoService:
 
     async def get_video_by_path(self, video_path: str) -> Optional[ISLVideoModel]:
         """Get video by file path"""
-        result = await self.db.execute(
-            select(ISLVideoModel).where(ISLVideoModel.video_path == video_path)
-        )
+        result = await self.db.execute(_GET_VIDEO_BY_PATH, {"video_path": video_path})
         return result.scalar_one_or_none()
 
 
@@ -1,11 +1,13 @@
 import asyncio
+import threading
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import select, delete, insert, update
 import socketio
 import logging
+import redis.asyncio as redis
 
 from app.schemas.live_announcement import (
     LiveAnnouncementRequest,
@@ -16,114 +18,208 @@ from app.schemas.live_announcement import (
 from app.services.train_announcement_service import get_train_announcement_service
 from app.schemas.train_announcement import TrainAnnouncementRequest
 from app.models.live_announcement import LiveAnnouncement as LiveAnnouncementModel
+from app.db.database import AsyncSessionLocal
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Redis lists used to hand the pending announcement to exactly one worker
+_PENDING_KEY = "live_announcements:pending"
+_PROCESSING_KEY = "live_announcements:processing"
+
+# Socket.IO events waiting to be sent; the oldest are dropped beyond this
+_MAX_PENDING_EMITS = 100
+
+# Intermediate progress updates for an announcement are written at most this often
+_STATUS_FLUSH_INTERVAL = 0.1
+
+# Statuses written straight away instead of waiting for the next flush
+_FINAL_STATUSES = frozenset({AnnouncementStatus.COMPLETED.value, AnnouncementStatus.ERROR.value})
+
+# Fields the processor needs, returned by the UPDATE that marks the row as processing
+_GENERATION_COLUMNS = (
+    LiveAnnouncementModel.train_number,
+    LiveAnnouncementModel.train_name,
+    LiveAnnouncementModel.from_station,
+    LiveAnnouncementModel.to_station,
+    LiveAnnouncementModel.platform_number,
+    LiveAnnouncementModel.announcement_category,
+    LiveAnnouncementModel.ai_avatar_model,
+)
+
+# Active announcements as plain rows, one column per LiveAnnouncementItem field
+_SELECT_ACTIVE_ITEMS = select(
+    LiveAnnouncementModel.announcement_id,
+    *_GENERATION_COLUMNS,
+    LiveAnnouncementModel.status,
+    LiveAnnouncementModel.message,
+    LiveAnnouncementModel.progress_percentage,
+    LiveAnnouncementModel.video_url,
+    LiveAnnouncementModel.error_message,
+    LiveAnnouncementModel.received_at,
+    LiveAnnouncementModel.updated_at,
+).where(LiveAnnouncementModel.is_active == True)
+
 class LiveAnnouncementService:
-    def __init__(self, db: AsyncSession, sio: socketio.AsyncServer):
-        self.db = db
+    """Process-wide live announcement queue.
+
+    The instance outlives any single request, so every method opens its own
+    session from session_factory instead of holding a request's session.
+    When a Redis client is given, the pending announcement id is shared
+    through a Redis list so any worker can enqueue and one worker processes it.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        sio: socketio.AsyncServer,
+        redis_client: Optional[redis.Redis] = None
+    ):
+        self.session_factory = session_factory
         self.sio = sio
-        self.processing_queue: asyncio.Queue = asyncio.Queue()
-        self.is_processing = False
+        self.redis = redis_client
+        # Only one announcement is ever waiting: a newer one replaces it
+        self._pending_id: Optional[str] = None
+        self._wake = asyncio.Event()
+        self._processor: Optional[asyncio.Task] = None
+        # Announcements being generated; kept referenced until they finish
+        self._in_flight: set = set()
+        # Status events are sent by a background task so DB progress is not
+        # held up by socket writes; one sender keeps them in order
+        self._emits: asyncio.Queue = asyncio.Queue(maxsize=_MAX_PENDING_EMITS)
+        self._emitter: Optional[asyncio.Task] = None
+        # Latest unwritten status values per announcement, merged until flushed
+        self._latest_update: Dict[str, dict] = {}
+        self._status_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
 
     async def add_announcement(self, request: LiveAnnouncementRequest) -> str:
         """Add a new live announcement to the queue (replaces any existing announcement)"""
         announcement_id = str(uuid.uuid4())
         
-        # Clear any existing announcements (only one at a time)
-        await self._clear_existing_announcements()
-        
-        # Clear the processing queue
-        while not self.processing_queue.empty():
-            try:
-                self.processing_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-        
-        # Create database record
-        db_announcement = LiveAnnouncementModel(
-            announcement_id=announcement_id,
-            train_number=request.train_number,
-            train_name=request.train_name,
-            from_station=request.from_station,
-            to_station=request.to_station,
-            platform_number=request.platform_number,
-            announcement_category=request.announcement_category,
-            ai_avatar_model=request.ai_avatar_model,
-            status=AnnouncementStatus.RECEIVED.value,
-            message="Announcement received and queued for processing"
-        )
-        
-        # Save to database
-        self.db.add(db_announcement)
-        await self.db.commit()
-        await self.db.refresh(db_announcement)
+        # Replace the active announcement in one transaction so readers never
+        # see an empty queue and concurrent adds cannot clear each other's row
+        async with self.session_factory() as db, db.begin():
+            # Clear any existing announcements (only one at a time)
+            await db.execute(
+                delete(LiveAnnouncementModel).where(LiveAnnouncementModel.is_active == True)
+            )
+
+            # Create database record, reading received_at back in the same statement
+            result = await db.execute(
+                insert(LiveAnnouncementModel)
+                .values(
+                    announcement_id=announcement_id,
+                    train_number=request.train_number,
+                    train_name=request.train_name,
+                    from_station=request.from_station,
+                    to_station=request.to_station,
+                    platform_number=request.platform_number,
+                    announcement_category=request.announcement_category,
+                    ai_avatar_model=request.ai_avatar_model,
+                    status=AnnouncementStatus.RECEIVED.value,
+                    message="Announcement received and queued for processing"
+                )
+                .returning(LiveAnnouncementModel.received_at)
+            )
+            received_at = result.scalar_one()
         
-        # Add to processing queue
-        await self.processing_queue.put(announcement_id)
+        # Queue for processing, replacing any announcement still waiting
+        if self.redis is not None:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                await pipe.delete(_PENDING_KEY).lpush(_PENDING_KEY, announcement_id).execute()
+        else:
+            # The previous announcement's row is gone, so stop generating its video
+            self._cancel_in_flight()
+            self._pending_id = announcement_id
+            self._wake.set()
         
         # Emit real-time update
-        await self.sio.emit('announcement_received', {
+        self._emit_bg('announcement_received', {
             'announcement_id': announcement_id,
             'status': AnnouncementStatus.RECEIVED.value,
             'message': "Announcement received and queued for processing",
-            'received_at': db_announcement.received_at.isoformat()
+            'received_at': received_at.isoformat()
         })
         
-        # Start processing if not already running
-        if not self.is_processing:
-            asyncio.create_task(self._process_queue())
+        # Start the processor if not already running
+        if self._processor is None or self._processor.done():
+            self._processor = asyncio.create_task(self._process_queue())
         
         logger.info(f"Live announcement {announcement_id} added to queue")
         return announcement_id
 
-    async def _clear_existing_announcements(self):
-        """Clear all existing announcements from database"""
-        try:
-            # Mark all existing announcements as inactive
-            await self.db.execute(
-                delete(LiveAnnouncementModel).where(LiveAnnouncementModel.is_active == True)
-            )
-            await self.db.commit()
-            logger.info("Cleared existing live announcements")
-        except Exception as e:
-            logger.error(f"Error clearing existing announcements: {str(e)}")
-            await self.db.rollback()
-
     async def _process_queue(self):
-        """Process the announcement queue"""
-        self.is_processing = True
-        
+        """Process the pending announcement each time one is queued"""
+        if self.redis is not None:
+            await self._process_redis_queue()
+            return
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            announcement_id, self._pending_id = self._pending_id, None
+            if not announcement_id:
+                continue
+            # Run each announcement as its own task so a newer one is not
+            # held behind a video that is still being generated; add_announcement
+            # cancels it once it has been replaced
+            task = asyncio.create_task(self._run_announcement(announcement_id))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _run_announcement(self, announcement_id: str):
+        """Process one announcement, logging instead of raising"""
         try:
-            while not self.processing_queue.empty():
-                announcement_id = await self.processing_queue.get()
-                await self._process_announcement(announcement_id)
+            await self._process_announcement(announcement_id)
         except Exception as e:
             logger.error(f"Error processing announcement queue: {str(e)}")
-        finally:
-            self.is_processing = False
+
+    async def _process_redis_queue(self):
+        """Take pending announcements from Redis; each id goes to one worker"""
+        while True:
+            try:
+                announcement_id = await self.redis.brpoplpush(_PENDING_KEY, _PROCESSING_KEY, timeout=0)
+            except Exception as e:
+                logger.error(f"Error reading announcement queue from Redis: {str(e)}")
+                await asyncio.sleep(1)
+                continue
+            try:
+                await self._process_announcement(announcement_id)
+            except Exception as e:
+                logger.error(f"Error processing announcement queue: {str(e)}")
+            finally:
+                await self.redis.lrem(_PROCESSING_KEY, 1, announcement_id)
+
+    def _cancel_in_flight(self):
+        """Cancel generation of announcements that have been replaced or cleared"""
+        for task in self._in_flight:
+            task.cancel()
+
+    async def discard_pending(self):
+        """Drop the announcement waiting to be processed, if any"""
+        if self.redis is not None:
+            await self.redis.delete(_PENDING_KEY)
+        self._pending_id = None
+        self._cancel_in_flight()
 
     async def _process_announcement(self, announcement_id: str):
         """Process a single announcement"""
-        # Get announcement from database
-        result = await self.db.execute(
-            select(LiveAnnouncementModel).where(LiveAnnouncementModel.announcement_id == announcement_id)
-        )
-        db_announcement = result.scalar_one_or_none()
+        # Update status to processing, reading back the announcement in the same statement
+        async with self._status_lock:
+            db_announcement = await self._write_status(
+                announcement_id,
+                {
+                    'status': AnnouncementStatus.PROCESSING.value,
+                    'message': "Processing announcement...",
+                    'progress_percentage': 10
+                },
+                *_GENERATION_COLUMNS
+            )
         
         if not db_announcement:
-            logger.warning(f"Announcement {announcement_id} not found in database")
             return
         
         try:
-            # Update status to processing
-            await self._update_status(
-                announcement_id,
-                AnnouncementStatus.PROCESSING,
-                "Processing announcement...",
-                10
-            )
-            
             # Create train announcement request
             train_request = TrainAnnouncementRequest(
                 train_number=db_announcement.train_number,
@@ -145,11 +241,12 @@ class LiveAnnouncementService:
             )
             
             # Generate ISL announcement
-            train_service = get_train_announcement_service(self.db)
             logger.info(f"Generating train announcement for {announcement_id} with request: {train_request.dict()}")
             
             try:
-                response = await train_service.generate_train_announcement(train_request, save_to_general_announcements=False)
+                async with self.session_factory() as db:
+                    train_service = get_train_announcement_service(db)
+                    response = await train_service.generate_train_announcement(train_request, save_to_general_announcements=False)
                 logger.info(f"Train announcement response for {announcement_id}: success={response.success}, error={response.error}, preview_url={response.preview_url}")
                 
                 if response.success and response.preview_url:
@@ -200,124 +297,140 @@ class LiveAnnouncementService:
         video_url: Optional[str] = None,
         error_message: Optional[str] = None
     ):
-        """Update announcement status and emit real-time update"""
-        # Get announcement from database
-        result = await self.db.execute(
-            select(LiveAnnouncementModel).where(LiveAnnouncementModel.announcement_id == announcement_id)
-        )
-        db_announcement = result.scalar_one_or_none()
-        
-        if not db_announcement:
-            logger.warning(f"Announcement {announcement_id} not found for status update")
-            return
-        
-        # Update database record
-        db_announcement.status = status.value
-        db_announcement.message = message
-        
+        """Update announcement status and emit real-time update.
+
+        Intermediate updates are coalesced and flushed every
+        _STATUS_FLUSH_INTERVAL seconds; final statuses are written at once.
+        """
+        values = {'status': status.value, 'message': message}
         if progress_percentage is not None:
-            db_announcement.progress_percentage = progress_percentage
+            values['progress_percentage'] = progress_percentage
         if video_url is not None:
-            db_announcement.video_url = video_url
+            values['video_url'] = video_url
         if error_message is not None:
-            db_announcement.error_message = error_message
-        
-        await self.db.commit()
-        await self.db.refresh(db_announcement)
+            values['error_message'] = error_message
+
+        if status.value not in _FINAL_STATUSES:
+            self._latest_update.setdefault(announcement_id, {}).update(values)
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush_status_updates())
+            return
+
+        async with self._status_lock:
+            # Fold in anything still pending so it cannot land after the final status
+            pending = self._latest_update.pop(announcement_id, {})
+            await self._write_status(announcement_id, {**pending, **values})
+
+    async def _flush_status_updates(self):
+        """Write the coalesced updates until none are left"""
+        while self._latest_update:
+            await asyncio.sleep(_STATUS_FLUSH_INTERVAL)
+            async with self._status_lock:
+                pending, self._latest_update = self._latest_update, {}
+                for announcement_id, values in pending.items():
+                    try:
+                        await self._write_status(announcement_id, values)
+                    except Exception as e:
+                        logger.error(f"Error writing status for {announcement_id}: {str(e)}")
+
+    async def _write_status(self, announcement_id: str, values: dict, *columns):
+        """Write status values for one announcement and emit the update.
+
+        Returns the row of updated_at plus any extra columns, or None when
+        the announcement no longer exists.
+        """
+        # Single UPDATE ... RETURNING instead of SELECT, mutate, commit, refresh
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(LiveAnnouncementModel)
+                .where(LiveAnnouncementModel.announcement_id == announcement_id)
+                .values(**values)
+                .returning(LiveAnnouncementModel.updated_at, *columns)
+            )
+            row = result.one_or_none()
+            await db.commit()
+
+        if row is None:
+            logger.warning(f"Announcement {announcement_id} not found for status update")
+            return None
         
         # Emit real-time update
-        update = LiveAnnouncementUpdate(
+        status_update = LiveAnnouncementUpdate(
             announcement_id=announcement_id,
-            status=status,
-            message=message,
-            progress_percentage=progress_percentage,
-            video_url=video_url,
-            error_message=error_message,
-            updated_at=db_announcement.updated_at
+            status=AnnouncementStatus(values['status']),
+            message=values['message'],
+            progress_percentage=values.get('progress_percentage'),
+            video_url=values.get('video_url'),
+            error_message=values.get('error_message'),
+            updated_at=row.updated_at
         )
         
-        # Convert datetime to ISO string for JSON serialization
-        update_data = update.dict()
-        update_data['updated_at'] = update_data['updated_at'].isoformat()
-        await self.sio.emit('announcement_update', update_data)
+        # mode='json' turns datetimes into ISO strings in the same pass
+        self._emit_bg('announcement_update', status_update.model_dump(mode='json'))
+        return row
+
+    def _emit_bg(self, event: str, data: dict):
+        """Queue a Socket.IO event without waiting for it to be sent"""
+        if self._emits.full():
+            dropped_event, _ = self._emits.get_nowait()
+            logger.warning(f"Emit queue full, dropped pending '{dropped_event}' event")
+        self._emits.put_nowait((event, data))
+        if self._emitter is None or self._emitter.done():
+            self._emitter = asyncio.create_task(self._send_emits())
+
+    async def _send_emits(self):
+        """Send queued Socket.IO events in the order they were queued"""
+        while True:
+            event, data = await self._emits.get()
+            try:
+                await self.sio.emit(event, data)
+            except Exception as e:
+                logger.error(f"Error emitting '{event}': {str(e)}")
 
     async def get_announcements(self) -> List[LiveAnnouncementItem]:
         """Get all active announcements"""
-        result = await self.db.execute(
-            select(LiveAnnouncementModel).where(LiveAnnouncementModel.is_active == True)
-        )
-        db_announcements = result.scalars().all()
+        async with self.session_factory() as db:
+            result = await db.execute(_SELECT_ACTIVE_ITEMS)
         
-        return [
-            LiveAnnouncementItem(
-                announcement_id=ann.announcement_id,
-                train_number=ann.train_number,
-                train_name=ann.train_name,
-                from_station=ann.from_station,
-                to_station=ann.to_station,
-                platform_number=ann.platform_number,
-                announcement_category=ann.announcement_category,
-                ai_avatar_model=ann.ai_avatar_model,
-                status=AnnouncementStatus(ann.status),
-                message=ann.message,
-                progress_percentage=ann.progress_percentage,
-                video_url=ann.video_url,
-                error_message=ann.error_message,
-                received_at=ann.received_at,
-                updated_at=ann.updated_at
-            )
-            for ann in db_announcements
-        ]
+        return [LiveAnnouncementItem(**row._mapping) for row in result]
 
     async def get_announcement(self, announcement_id: str) -> Optional[LiveAnnouncementItem]:
         """Get a specific announcement"""
-        result = await self.db.execute(
-            select(LiveAnnouncementModel).where(
-                LiveAnnouncementModel.announcement_id == announcement_id,
-                LiveAnnouncementModel.is_active == True
+        async with self.session_factory() as db:
+            result = await db.execute(
+                _SELECT_ACTIVE_ITEMS.where(LiveAnnouncementModel.announcement_id == announcement_id)
             )
-        )
-        db_announcement = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not db_announcement:
+        if not row:
             return None
         
-        return LiveAnnouncementItem(
-            announcement_id=db_announcement.announcement_id,
-            train_number=db_announcement.train_number,
-            train_name=db_announcement.train_name,
-            from_station=db_announcement.from_station,
-            to_station=db_announcement.to_station,
-            platform_number=db_announcement.platform_number,
-            announcement_category=db_announcement.announcement_category,
-            ai_avatar_model=db_announcement.ai_avatar_model,
-            status=AnnouncementStatus(db_announcement.status),
-            message=db_announcement.message,
-            progress_percentage=db_announcement.progress_percentage,
-            video_url=db_announcement.video_url,
-            error_message=db_announcement.error_message,
-            received_at=db_announcement.received_at,
-            updated_at=db_announcement.updated_at
-        )
+        return LiveAnnouncementItem(**row._mapping)
 
     async def clear_all_announcements(self):
         """Clear all live announcements"""
-        try:
-            await self.db.execute(
-                delete(LiveAnnouncementModel).where(LiveAnnouncementModel.is_active == True)
-            )
-            await self.db.commit()
-            logger.info("Cleared all live announcements")
-        except Exception as e:
-            logger.error(f"Error clearing live announcements: {str(e)}")
-            await self.db.rollback()
+        async with self.session_factory() as db:
+            try:
+                await db.execute(
+                    delete(LiveAnnouncementModel).where(LiveAnnouncementModel.is_active == True)
+                )
+                await db.commit()
+                logger.info("Cleared all live announcements")
+            except Exception as e:
+                logger.error(f"Error clearing live announcements: {str(e)}")
+                await db.rollback()
 
 # Global service instance
 _live_announcement_service: Optional[LiveAnnouncementService] = None
+_live_announcement_service_lock = threading.Lock()
 
-def get_live_announcement_service(db: AsyncSession, sio: socketio.AsyncServer) -> LiveAnnouncementService:
+def get_live_announcement_service(sio: socketio.AsyncServer) -> LiveAnnouncementService:
     """Get or create live announcement service instance"""
     global _live_announcement_service
     if _live_announcement_service is None:
-        _live_announcement_service = LiveAnnouncementService(db, sio)
-    return _live_announcement_service
\ No newline at end of file
+        # Double-checked so concurrent first calls still build a single instance
+        with _live_announcement_service_lock:
+            if _live_announcement_service is None:
+                redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True) if settings.REDIS_URL else None
+                _live_announcement_service = LiveAnnouncementService(AsyncSessionLocal, sio, redis_client)
+    return _live_announcement_service
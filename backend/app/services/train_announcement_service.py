@@ -1,10 +1,12 @@
 import re
+import asyncio
 import logging
 from typing import Optional, Dict, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.announcement_template import AnnouncementTemplateModel
+from cachetools import TTLCache
 from app.models.general_announcement import GeneralAnnouncement
+from app.models.train_route import TrainRoute
 from app.models.train_route_translation import TrainRouteTranslation
 from app.schemas.train_announcement import (
     TrainAnnouncementRequest,
@@ -13,11 +15,41 @@ from app.schemas.train_announcement import (
     TemplateSubstitutionResponse
 )
 from app.schemas.general_announcement import GeneralAnnouncementCreate
-from app.services.announcement_template_service import get_announcement_template_service
+from app.services.announcement_template_service import TemplateTexts, get_announcement_template_service
 from app.services.general_announcement_service import get_general_announcement_service
+from app.api.v1.endpoints.isl_video_generation import generate_isl_video, VideoGenerationRequest
 
 logger = logging.getLogger(__name__)
 
+# Matches template placeholders such as {train_number}; used when a template
+# is not valid str.format syntax (stray braces, format specs)
+_PLACEHOLDER_RE = re.compile(r'\{[^}]+\}')
+
+
+class _SafeDict(dict):
+    """format_map mapping that leaves unknown placeholders in place"""
+
+    def __missing__(self, key: str) -> str:
+        logger.warning(f"Unknown placeholder found: {{{key}}}")
+        return '{' + key + '}'
+
+# Route translations by train number; they change only through the train
+# route and translation endpoints, which call invalidate_translation_cache()
+_translation_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+# (template language, translation key suffix); English has no translations
+_LANGUAGES = (
+    ('english', None),
+    ('hindi', 'hi'),
+    ('marathi', 'mr'),
+    ('gujarati', 'gu'),
+)
+
+
+def invalidate_translation_cache() -> None:
+    """Drop cached route translations after a train route or translation write"""
+    _translation_cache.clear()
+
 
 class TrainAnnouncementService:
     def __init__(self, db: AsyncSession):
@@ -32,68 +64,56 @@ class TrainAnnouncementService:
     ) -> TrainAnnouncementResponse:
         """
         Generate a complete train announcement with ISL video in multiple languages
+
+        Responses are assembled from already-validated request, template and
+        video-generation data, so they are built with model_construct to skip
+        re-validation. Never use this for user-supplied payloads.
         """
         try:
             logger.info(f"Generating train announcement for {request.train_number} - {request.train_name}")
 
-            # Step 1: Get announcement template
-            template = await self._get_announcement_template(request.announcement_category)
+            # Steps 1-2: Get the announcement template and train route translations
+            # concurrently. A session can't run two statements at once, so the
+            # translations lookup gets its own.
+            async with AsyncSession(self.db.bind, expire_on_commit=False) as translations_db:
+                template, train_translations = await asyncio.gather(
+                    self._get_announcement_template(request.announcement_category),
+                    self._get_train_route_translations(request.train_number, translations_db)
+                )
             if not template:
-                return TrainAnnouncementResponse(
+                return TrainAnnouncementResponse.model_construct(
                     success=False,
                     error=f"No template found for category: {request.announcement_category}"
                 )
 
-            # Step 2: Get train route translations
-            train_translations = await self._get_train_route_translations(request.train_number)
-            
             # Step 3: Generate announcements in all languages
-            english_text = self._substitute_template_placeholders(
-                template.template_text_english,
-                request.train_number,
-                request.train_name,
-                request.from_station_name,
-                request.to_station_name,
-                request.platform,
-                train_translations
-            )
-
-            hindi_text = None
-            marathi_text = None
-            gujarati_text = None
-
-            if template.template_text_hindi and train_translations:
-                hindi_text = self._substitute_template_placeholders(
-                    template.template_text_hindi,
+            texts: Dict[str, Optional[str]] = {}
+            for language, suffix in _LANGUAGES:
+                template_text = getattr(template, f'template_text_{language}')
+                texts[language] = None
+                if suffix is None:
+                    # English uses the names from the request as they are
+                    names = (request.train_name, request.from_station_name, request.to_station_name)
+                elif template_text and train_translations:
+                    names = (
+                        train_translations.get(f'train_name_{suffix}', request.train_name),
+                        train_translations.get(f'from_station_name_{suffix}', request.from_station_name),
+                        train_translations.get(f'to_station_name_{suffix}', request.to_station_name),
+                    )
+                else:
+                    continue
+                texts[language] = self._substitute_template_placeholders(
+                    template_text,
                     request.train_number,
-                    train_translations.get('train_name_hi', request.train_name),
-                    train_translations.get('from_station_name_hi', request.from_station_name),
-                    train_translations.get('to_station_name_hi', request.to_station_name),
+                    *names,
                     request.platform,
                     train_translations
                 )
 
-            if template.template_text_marathi and train_translations:
-                marathi_text = self._substitute_template_placeholders(
-                    template.template_text_marathi,
-                    request.train_number,
-                    train_translations.get('train_name_mr', request.train_name),
-                    train_translations.get('from_station_name_mr', request.from_station_name),
-                    train_translations.get('to_station_name_mr', request.to_station_name),
-                    request.platform,
-                    train_translations
-                )
-
-            if template.template_text_gujarati and train_translations:
-                gujarati_text = self._substitute_template_placeholders(
-                    template.template_text_gujarati,
-                    request.train_number,
-                    train_translations.get('train_name_gu', request.train_name),
-                    train_translations.get('from_station_name_gu', request.from_station_name),
-                    train_translations.get('to_station_name_gu', request.to_station_name),
-                    request.platform,
-                    train_translations
-                )
+            english_text = texts['english']
+            hindi_text = texts['hindi']
+            marathi_text = texts['marathi']
+            gujarati_text = texts['gujarati']
 
             # Step 4: Create announcement name
             announcement_name = f"{request.train_number} {request.train_name} - {request.announcement_category}"
@@ -114,7 +134,7 @@ class TrainAnnouncementService:
                 # Create the announcement record
                 announcement = await self.general_announcement_service.create_announcement(announcement_data)
                 if not announcement:
-                    return TrainAnnouncementResponse(
+                    return TrainAnnouncementResponse.model_construct(
                         success=False,
                         error="Failed to create announcement record"
                     )
@@ -125,8 +145,6 @@ class TrainAnnouncementService:
 
             # Step 6: Generate ISL video
             try:
-                from app.api.v1.endpoints.isl_video_generation import generate_isl_video, VideoGenerationRequest
-                
                 video_request = VideoGenerationRequest(
                     text=english_text,
                     model=request.model,
@@ -151,7 +169,7 @@ class TrainAnnouncementService:
                         except Exception as update_error:
                             logger.error(f"Failed to update video path for announcement {announcement.id}: {str(update_error)}")
                     
-                    return TrainAnnouncementResponse(
+                    return TrainAnnouncementResponse.model_construct(
                         success=True,
                         announcement_id=announcement_id,
                         announcement_name=announcement_name,
@@ -167,7 +185,7 @@ class TrainAnnouncementService:
                     )
                 else:
                     logger.error(f"ISL video generation failed: {video_response.error}")
-                    return TrainAnnouncementResponse(
+                    return TrainAnnouncementResponse.model_construct(
                         success=True,
                         announcement_id=announcement_id,
                         announcement_name=announcement_name,
@@ -180,7 +198,7 @@ class TrainAnnouncementService:
                     
             except Exception as video_error:
                 logger.error(f"Exception during ISL video generation: {str(video_error)}")
-                return TrainAnnouncementResponse(
+                return TrainAnnouncementResponse.model_construct(
                     success=True,
                     announcement_id=announcement.id,
                     announcement_name=announcement_name,
@@ -193,56 +211,49 @@ class TrainAnnouncementService:
 
         except Exception as e:
             logger.error(f"Error generating train announcement: {str(e)}")
-            return TrainAnnouncementResponse(
+            return TrainAnnouncementResponse.model_construct(
                 success=False,
                 error=f"Internal error: {str(e)}"
             )
 
-    async def _get_announcement_template(self, category: str) -> Optional[AnnouncementTemplateModel]:
+    async def _get_announcement_template(self, category: str) -> Optional[TemplateTexts]:
         """
-        Get announcement template by category
+        Get announcement template texts by category
         """
         try:
-            result = await self.db.execute(
-                select(AnnouncementTemplateModel).where(
-                    AnnouncementTemplateModel.template_category == category
-                )
-            )
-            return result.scalar_one_or_none()
+            return await self.announcement_template_service.get_template_texts(category)
         except Exception as e:
             logger.error(f"Error fetching template for category {category}: {str(e)}")
             return None
 
-    async def _get_train_route_translations(self, train_number: str) -> Optional[Dict[str, str]]:
+    async def _get_train_route_translations(
+        self,
+        train_number: str,
+        db: Optional[AsyncSession] = None
+    ) -> Optional[Dict[str, str]]:
         """
-        Get train route translations by train number
+        Get train route translations by train number, on db if given (else the service session)
         """
-        try:
-            # First get the train route by train number
-            from app.models.train_route import TrainRoute
-            train_route_result = await self.db.execute(
-                select(TrainRoute).where(TrainRoute.train_number == train_number)
-            )
-            train_route = train_route_result.scalar_one_or_none()
-            
-            if not train_route:
-                logger.warning(f"Train route not found for train number: {train_number}")
-                return None
+        if train_number in _translation_cache:
+            return _translation_cache[train_number]
 
-            # Get translations for this train route
-            translation_result = await self.db.execute(
-                select(TrainRouteTranslation).where(
-                    TrainRouteTranslation.train_route_id == train_route.id
-                )
+        db = db or self.db
+        try:
+            # Resolve the route and its translations in one joined query
+            translation_result = await db.execute(
+                select(TrainRouteTranslation)
+                .join(TrainRoute, TrainRoute.id == TrainRouteTranslation.train_route_id)
+                .where(TrainRoute.train_number == train_number)
             )
             translation = translation_result.scalar_one_or_none()
-            
+
             if not translation:
-                logger.warning(f"No translations found for train route: {train_number}")
+                logger.warning(f"No train route translations found for train number: {train_number}")
+                _translation_cache[train_number] = None
                 return None
 
             # Return translations as dictionary
-            return {
+            translations = {
                 'train_name_hi': translation.train_name_hi,
                 'from_station_name_hi': translation.from_station_name_hi,
                 'to_station_name_hi': translation.to_station_name_hi,
@@ -253,6 +264,8 @@ class TrainAnnouncementService:
                 'from_station_name_gu': translation.from_station_name_gu,
                 'to_station_name_gu': translation.to_station_name_gu,
             }
+            _translation_cache[train_number] = translations
+            return translations
         except Exception as e:
             logger.error(f"Error fetching train route translations for {train_number}: {str(e)}")
             return None
@@ -272,32 +285,24 @@ class TrainAnnouncementService:
         """
         try:
             # Define placeholder mappings
-            placeholders = {
-                '{train_number}': train_number,
-                '{train_name}': train_name,
-                '{from_station}': from_station,
-                '{to_station}': to_station,
-                '{from_station_name}': from_station,  # Alternative naming
-                '{to_station_name}': to_station,      # Alternative naming
-                '{start_station}': from_station,      # Alternative naming used in existing templates
-                '{end_station}': to_station,          # Alternative naming used in existing templates
-                '{platform}': str(platform),
-            }
-
-            # Find all placeholders in the template
-            placeholder_pattern = r'\{[^}]+\}'
-            found_placeholders = re.findall(placeholder_pattern, template_text)
-            
-            # Substitute placeholders
-            substituted_text = template_text
-            
-            for placeholder in found_placeholders:
-                if placeholder in placeholders:
-                    substituted_text = substituted_text.replace(placeholder, placeholders[placeholder])
-                else:
-                    logger.warning(f"Unknown placeholder found: {placeholder}")
+            placeholders = _SafeDict(
+                train_number=train_number,
+                train_name=train_name,
+                from_station=from_station,
+                to_station=to_station,
+                from_station_name=from_station,  # Alternative naming
+                to_station_name=to_station,      # Alternative naming
+                start_station=from_station,      # Alternative naming used in existing templates
+                end_station=to_station,          # Alternative naming used in existing templates
+                platform=str(platform),
+            )
 
-            return substituted_text
+            # Substitute every placeholder in one pass over the template
+            try:
+                return template_text.format_map(placeholders)
+            except (ValueError, IndexError, AttributeError, TypeError):
+                return _PLACEHOLDER_RE.sub(
+                    lambda match: placeholders[match.group(0)[1:-1]], template_text)
 
         except Exception as e:
             logger.error(f"Error substituting template placeholders: {str(e)}")
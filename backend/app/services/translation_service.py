@@ -3,54 +3,101 @@ GCP Cloud Translation Service
 Handles multilingual text translation using Google Cloud Translation API
 """
 
-import os
+import re
+import asyncio
+import hashlib
+from functools import lru_cache
 from typing import List, Dict, Any
-from pathlib import Path
 from google.cloud import translate_v3
-from google.oauth2 import service_account
+from cachetools import LRUCache, TTLCache
+from app.utils.gcp_client import gcp_client_manager
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Successful translations keyed by (text or its digest, source, target); train and
+# station names repeat heavily, so most lookups never reach the API
+_translation_cache: LRUCache = LRUCache(maxsize=10_000)
+
+
+# Chunks stay well under the v3 per-request limit, where latency is lowest
+_MAX_CHUNK_CODEPOINTS = 4500
+
+# Sentence ends: . ? ! or the Devanagari danda, followed by whitespace
+_SENTENCE_END_RE = re.compile(r'(?<=[.?!\u0964])\s+')
+
+
+def _split_into_chunks(text: str, max_codepoints: int = _MAX_CHUNK_CODEPOINTS) -> List[str]:
+    """Greedily pack whole sentences into chunks of at most max_codepoints"""
+    if len(text) <= max_codepoints:
+        return [text]
+
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        # A single sentence longer than the limit is cut at the limit
+        while len(sentence) > max_codepoints:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_codepoints])
+            sentence = sentence[max_codepoints:]
+        if current and len(current) + 1 + len(sentence) > max_codepoints:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# The supported-language list changes on the order of weeks
+_supported_languages_cache: TTLCache = TTLCache(maxsize=1, ttl=3600)
+
+
+# Texts up to this length key the cache directly: str hashes are computed
+# once and cached by Python, so short names skip encoding and digesting
+_INLINE_KEY_MAX_LENGTH = 512
+
+
+def _cache_key(text: str, source_language_code: str, target_lang: str) -> tuple:
+    if len(text) <= _INLINE_KEY_MAX_LENGTH:
+        return (text, source_language_code, target_lang)
+    # Long texts are digested so cache entries stay small
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    return (digest, source_language_code, target_lang)
+
 
 class TranslationService:
     def __init__(self):
         self.project_id = "aipower-467603"  # From the credentials file
-        # Get the absolute path to the credentials file
-        current_dir = Path(__file__).parent
-        project_root = current_dir.parent.parent.parent  # Go up to project root
-        self.credentials_path = project_root / "backend" / \
-            "credentials" / "secrets" / "isl.json"
         self.client = None
         self._initialize_client()
 
     def _initialize_client(self):
         """Initialize the Google Cloud Translation client"""
         try:
-            # Convert Path object to string for environment variable
-            credentials_path_str = str(self.credentials_path)
-
-            # Set the credentials file path
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path_str
+            # Share the credentials object (and its parsed private key) that
+            # every other GCP client uses instead of building another one
+            credentials = gcp_client_manager.get_scoped_credentials(
+                ["https://www.googleapis.com/auth/cloud-translation"])
+            if credentials is None:
+                raise Exception("No GCP credentials available")
 
-            # Create credentials from service account file
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path_str,
-                scopes=["https://www.googleapis.com/auth/cloud-translation"]
-            )
-
-            # Initialize the client
-            self.client = translate_v3.TranslationServiceClient(
+            # Initialize the client; the async client multiplexes concurrent
+            # per-target requests over one channel on the event loop
+            self.client = translate_v3.TranslationServiceAsyncClient(
                 credentials=credentials)
             logger.info(
                 "Google Cloud Translation client initialized successfully")
 
         except Exception as e:
             logger.error(
-                f"Failed to initialize Google Cloud Translation client: {str(e)}")
+                "Failed to initialize Google Cloud Translation client: %s", e)
             raise
 
-    def translate_text(
+    async def translate_text(
         self,
         text: str,
         source_language_code: str,
@@ -72,43 +119,27 @@ class TranslationService:
                 raise Exception("Translation client not initialized")
 
             parent = f"projects/{self.project_id}/locations/global"
-            mime_type = "text/plain"
 
             # Prepare the response structure
             translations = {}
 
-            # Translate to each target language
-            for target_lang in target_language_codes:
-                try:
-                    response = self.client.translate_text(
-                        contents=[text],
-                        parent=parent,
-                        mime_type=mime_type,
-                        source_language_code=source_language_code,
-                        target_language_code=target_lang,
-                    )
-
-                    # Extract the translated text
-                    if response.translations:
-                        translated_text = response.translations[0].translated_text
-                        translations[target_lang] = {
-                            "translated_text": translated_text,
-                            "detected_language": response.translations[0].detected_language_code,
-                            "confidence": getattr(response.translations[0], 'confidence', None)
-                        }
-                    else:
-                        translations[target_lang] = {
-                            "translated_text": text,  # Fallback to original text
-                            "error": "No translation returned"
-                        }
-
-                except Exception as e:
-                    logger.error(
-                        f"Error translating to {target_lang}: {str(e)}")
+            # Each distinct target is requested once and a target equal to
+            # the source needs no call; the rest go out concurrently
+            targets = []
+            for target_lang in dict.fromkeys(target_language_codes):
+                if target_lang == source_language_code:
                     translations[target_lang] = {
-                        "translated_text": text,  # Fallback to original text
-                        "error": f"Translation failed: {str(e)}"
+                        "translated_text": text,
+                        "detected_language": source_language_code
                     }
+                else:
+                    targets.append(target_lang)
+
+            results = await asyncio.gather(*(
+                self._translate_to(text, parent, source_language_code, target_lang)
+                for target_lang in targets
+            ))
+            translations.update(zip(targets, results))
 
             return {
                 "source_text": text,
@@ -119,7 +150,7 @@ class TranslationService:
             }
 
         except Exception as e:
-            logger.error(f"Translation service error: {str(e)}")
+            logger.error("Translation service error: %s", e)
             return {
                 "source_text": text,
                 "source_language": source_language_code,
@@ -129,20 +160,177 @@ class TranslationService:
                 "error": str(e)
             }
 
-    def get_supported_languages(self) -> List[Dict[str, str]]:
+    async def translate_batch(
+        self,
+        strings: List[str],
+        source_language_code: str,
+        target_language_codes: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Translate many short strings, each distinct string only once
+
+        Announcement fields repeat heavily (station, train and category
+        names), so the input is deduplicated and every target gets one
+        request carrying all uncached strings as separate contents.
+
+        Args:
+            strings: Texts to translate; duplicates are allowed
+            source_language_code: Source language code (e.g., 'en')
+            target_language_codes: List of target language codes
+
+        Returns:
+            Mapping of each distinct input string to {target_lang: translated_text};
+            a string that cannot be translated maps to itself
+        """
+        unique = [text for text in dict.fromkeys(strings) if text]
+        results = {text: {} for text in unique}
+        targets = [lang for lang in dict.fromkeys(target_language_codes)
+                   if lang != source_language_code]
+        if source_language_code in target_language_codes:
+            for text in unique:
+                results[text][source_language_code] = text
+        if not unique or not targets:
+            return results
+
+        if not self.client:
+            logger.error("Translation client not initialized")
+            for text in unique:
+                results[text].update(dict.fromkeys(targets, text))
+            return results
+
+        parent = f"projects/{self.project_id}/locations/global"
+        per_target = await asyncio.gather(*(
+            self._translate_batch_to(unique, parent, source_language_code, target_lang)
+            for target_lang in targets
+        ))
+        for target_lang, translated in zip(targets, per_target):
+            for text in unique:
+                results[text][target_lang] = translated.get(text, text)
+        return results
+
+    async def _translate_batch_to(
+        self,
+        unique: List[str],
+        parent: str,
+        source_language_code: str,
+        target_lang: str
+    ) -> Dict[str, str]:
+        """Translate distinct strings into one target, reusing cached results"""
+        translated = {}
+        misses = []
+        for text in unique:
+            cached = _translation_cache.get(
+                _cache_key(text, source_language_code, target_lang))
+            if cached is not None:
+                translated[text] = cached["translated_text"]
+            else:
+                misses.append(text)
+
+        # Pack misses into requests that stay under the per-request size
+        batches = []
+        size = 0
+        for text in misses:
+            if not batches or size + len(text) > _MAX_CHUNK_CODEPOINTS:
+                batches.append([])
+                size = 0
+            batches[-1].append(text)
+            size += len(text)
+
+        responses = await asyncio.gather(*(
+            self.client.translate_text(
+                contents=batch,
+                parent=parent,
+                mime_type="text/plain",
+                source_language_code=source_language_code,
+                target_language_code=target_lang,
+            )
+            for batch in batches
+        ), return_exceptions=True)
+
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                logger.error(
+                    "Error batch translating to %s: %s", target_lang, response)
+                continue
+
+            for text, translation in zip(batch, response.translations):
+                translated[text] = translation.translated_text
+                _translation_cache[_cache_key(text, source_language_code, target_lang)] = {
+                    "translated_text": translation.translated_text,
+                    "detected_language": translation.detected_language_code,
+                    "confidence": getattr(translation, 'confidence', None)
+                }
+        return translated
+
+    async def _translate_to(
+        self,
+        text: str,
+        parent: str,
+        source_language_code: str,
+        target_lang: str
+    ) -> Dict[str, Any]:
+        """Translate text into a single target language, falling back to the source text"""
+        key = _cache_key(text, source_language_code, target_lang)
+        cached = _translation_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Long inputs go as several sentence-aligned contents in one request
+            response = await self.client.translate_text(
+                contents=_split_into_chunks(text),
+                parent=parent,
+                mime_type="text/plain",
+                source_language_code=source_language_code,
+                target_language_code=target_lang,
+            )
+
+            # Extract the translated text
+            if response.translations:
+                result = {
+                    "translated_text": " ".join(
+                        t.translated_text for t in response.translations),
+                    "detected_language": response.translations[0].detected_language_code,
+                    "confidence": getattr(response.translations[0], 'confidence', None)
+                }
+                _translation_cache[key] = result
+                return result
+            return {
+                "translated_text": text,  # Fallback to original text
+                "error": "No translation returned"
+            }
+
+        except Exception as e:
+            logger.error(
+                "Error translating to %s: %s", target_lang, e)
+            return {
+                "translated_text": text,  # Fallback to original text
+                "error": f"Translation failed: {str(e)}"
+            }
+
+    async def get_supported_languages(self, use_cache: bool = True) -> List[Dict[str, str]]:
         """
         Get list of supported languages
 
+        Args:
+            use_cache: Serve a list fetched within the last hour; pass False
+                to always call the API (the result still refreshes the cache)
+
         Returns:
             List of dictionaries containing language codes and names
         """
+        if use_cache:
+            cached = _supported_languages_cache.get(self.project_id)
+            if cached is not None:
+                return cached
+
         try:
             if not self.client:
                 raise Exception("Translation client not initialized")
 
             parent = f"projects/{self.project_id}/locations/global"
 
-            response = self.client.get_supported_languages(parent=parent)
+            response = await self.client.get_supported_languages(parent=parent)
 
             languages = []
             for language in response.languages:
@@ -153,12 +341,21 @@ class TranslationService:
                     "support_target": language.support_target
                 })
 
+            # Errors return [] above and are retried on the next call
+            if languages:
+                _supported_languages_cache[self.project_id] = languages
             return languages
 
         except Exception as e:
-            logger.error(f"Error getting supported languages: {str(e)}")
+            logger.error("Error getting supported languages: %s", e)
             return []
 
 
-# Create a singleton instance
-translation_service = TranslationService()
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    """Get the shared translation service, creating its client on first use.
+
+    Importing this module no longer loads credentials or opens a channel;
+    a failed initialization is not cached and is retried on the next call.
+    """
+    return TranslationService()
@@ -1,12 +1,21 @@
 import os
-import json
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from app.core.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# GCP service account files looked for in the secrets directory, in order
+GCP_CREDENTIAL_FILENAMES = (
+    "gcp_service_account.json",
+    "isl.json",  # Your existing file
+    "service_account.json",
+)
+
 
 class CredentialManager:
     """Secure credential management utility"""
@@ -14,6 +23,11 @@ class CredentialManager:
     def __init__(self):
         self.credentials_dir = Path(settings.CREDENTIALS_DIR)
         self.secrets_dir = Path(settings.SECRETS_DIR)
+        # Parsed GCP service account info, loaded once per process
+        self._gcp_credentials: Optional[Dict[str, Any]] = None
+        self._gcp_credentials_lock = threading.Lock()
+        # Credential file found by the first scan; False once a scan found none
+        self._gcp_credentials_file: Union[Path, bool, None] = None
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
@@ -36,7 +50,7 @@ class CredentialManager:
 
         if api_key:
             logger.debug(
-                f"Loaded {service_name} API key from environment variable")
+                "Loaded %s API key from environment variable", service_name)
             return api_key
 
         # Try credential file
@@ -46,18 +60,36 @@ class CredentialManager:
                 with open(credential_file, 'r') as f:
                     api_key = f.read().strip()
                 logger.debug(
-                    f"Loaded {service_name} API key from credential file")
+                    "Loaded %s API key from credential file", service_name)
                 return api_key
             except Exception as e:
                 logger.error(
-                    f"Failed to read {service_name} API key from file: {e}")
+                    "Failed to read %s API key from file: %s", service_name, e)
 
-        logger.warning(f"No API key found for {service_name}")
+        logger.warning("No API key found for %s", service_name)
         return None
 
     def get_gcp_credentials(self) -> Optional[Dict[str, Any]]:
         """
-        Get GCP credentials from environment variable or credential file
+        Get GCP credentials, loading them on first use and caching the result.
+        A miss is not cached, but a credential file added later is only found
+        after invalidate_gcp_credentials() (store_gcp_credentials calls it).
+        """
+        if self._gcp_credentials is None:
+            with self._gcp_credentials_lock:
+                if self._gcp_credentials is None:
+                    self._gcp_credentials = self._load_gcp_credentials()
+        return self._gcp_credentials
+
+    def invalidate_gcp_credentials(self) -> None:
+        """Drop the cached GCP credentials so the next call reloads them"""
+        with self._gcp_credentials_lock:
+            self._gcp_credentials = None
+            self._gcp_credentials_file = None
+
+    def _load_gcp_credentials(self) -> Optional[Dict[str, Any]]:
+        """
+        Load GCP credentials from environment variable or credential file
 
         Priority:
         1. Environment variable GOOGLE_APPLICATION_CREDENTIALS (file path)
@@ -68,47 +100,56 @@ class CredentialManager:
         gcp_creds_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
         if gcp_creds_path and Path(gcp_creds_path).exists():
             try:
-                with open(gcp_creds_path, 'r') as f:
-                    credentials = json.load(f)
+                with open(gcp_creds_path, 'rb') as f:
+                    credentials = orjson.loads(f.read())
                 logger.debug(
                     "Loaded GCP credentials from GOOGLE_APPLICATION_CREDENTIALS")
                 return credentials
             except Exception as e:
                 logger.error(
-                    f"Failed to read GCP credentials from GOOGLE_APPLICATION_CREDENTIALS: {e}")
+                    "Failed to read GCP credentials from GOOGLE_APPLICATION_CREDENTIALS: %s", e)
 
         # Try GCP_SERVICE_ACCOUNT_KEY environment variable (JSON string)
         gcp_key_json = os.getenv('GCP_SERVICE_ACCOUNT_KEY')
         if gcp_key_json:
             try:
-                credentials = json.loads(gcp_key_json)
+                credentials = orjson.loads(gcp_key_json)
                 logger.debug(
                     "Loaded GCP credentials from GCP_SERVICE_ACCOUNT_KEY environment variable")
                 return credentials
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(
-                    f"Failed to parse GCP credentials from environment variable: {e}")
+                    "Failed to parse GCP credentials from environment variable: %s", e)
+
+        # Try credential files (check multiple possible names). The file that
+        # worked, or the fact that none did, is remembered so later loads
+        # skip the scan; invalidate_gcp_credentials() forgets it.
+        if self._gcp_credentials_file is False:
+            logger.warning("No GCP credentials found")
+            return None
 
-        # Try credential files (check multiple possible names)
-        credential_files = [
-            self.secrets_dir / "gcp_service_account.json",
-            self.secrets_dir / "isl.json",  # Your existing file
-            self.secrets_dir / "service_account.json"
-        ]
+        if self._gcp_credentials_file:
+            credential_files = [self._gcp_credentials_file]
+        else:
+            credential_files = [
+                self.secrets_dir / name for name in GCP_CREDENTIAL_FILENAMES]
 
         for credential_file in credential_files:
             if credential_file.exists():
                 try:
-                    with open(credential_file, 'r') as f:
-                        credentials = json.load(f)
+                    with open(credential_file, 'rb') as f:
+                        credentials = orjson.loads(f.read())
                     logger.debug(
-                        f"Loaded GCP credentials from {credential_file.name}")
+                        "Loaded GCP credentials from %s", credential_file.name)
+                    self._gcp_credentials_file = credential_file
                     return credentials
                 except Exception as e:
                     logger.error(
-                        f"Failed to read GCP credentials from {credential_file.name}: {e}")
+                        "Failed to read GCP credentials from %s: %s", credential_file.name, e)
                     continue
 
+        # A remembered file that stopped working triggers a full rescan next time
+        self._gcp_credentials_file = None if self._gcp_credentials_file else False
         logger.warning("No GCP credentials found")
         return None
 
@@ -122,10 +163,10 @@ class CredentialManager:
                 f.write(api_key)
             # Set restrictive permissions
             os.chmod(credential_file, 0o600)  # Read/write for owner only
-            logger.info(f"Stored {service_name} API key in credential file")
+            logger.info("Stored %s API key in credential file", service_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to store {service_name} API key: {e}")
+            logger.error("Failed to store %s API key: %s", service_name, e)
             return False
 
     def store_gcp_credentials(self, credentials: Dict[str, Any]) -> bool:
@@ -134,29 +175,35 @@ class CredentialManager:
         """
         try:
             credential_file = self.secrets_dir / "gcp_service_account.json"
-            with open(credential_file, 'w') as f:
-                json.dump(credentials, f, indent=2)
+            with open(credential_file, 'wb') as f:
+                f.write(orjson.dumps(credentials, option=orjson.OPT_INDENT_2))
             # Set restrictive permissions
             os.chmod(credential_file, 0o600)  # Read/write for owner only
+            self.invalidate_gcp_credentials()
             logger.info("Stored GCP credentials in credential file")
             return True
         except Exception as e:
-            logger.error(f"Failed to store GCP credentials: {e}")
+            logger.error("Failed to store GCP credentials: %s", e)
             return False
 
     def list_available_credentials(self) -> Dict[str, bool]:
         """List which credentials are available"""
-        available = {}
-
-        # Check API keys
         services = ['openai', 'anthropic', 'google',
                     'stripe', 'sendgrid', 'twilio']
-        for service in services:
-            available[f"{service}_api_key"] = self.get_api_key(
-                service) is not None
 
-        # Check GCP credentials
-        available['gcp_credentials'] = self.get_gcp_credentials() is not None
+        # Each check may stat and read a file; run them side by side
+        with ThreadPoolExecutor(max_workers=len(services) + 1) as executor:
+            gcp_future = executor.submit(self.get_gcp_credentials)
+            api_keys = executor.map(self.get_api_key, services)
+
+            # Check API keys
+            available = {
+                f"{service}_api_key": api_key is not None
+                for service, api_key in zip(services, api_keys)
+            }
+
+            # Check GCP credentials
+            available['gcp_credentials'] = gcp_future.result() is not None
 
         return available
 
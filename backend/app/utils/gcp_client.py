@@ -1,5 +1,5 @@
-from typing import Optional, Dict, Any
-from google.cloud import storage, vision, texttospeech
+from typing import Optional, Dict, Any, List
+from google.cloud import storage, vision, texttospeech, speech
 from google.cloud import translate_v2 as translate
 from google.oauth2 import service_account
 from app.utils.credentials import credential_manager
@@ -9,10 +9,15 @@ logger = get_logger(__name__)
 
 
 class GCPClientManager:
-    """GCP client manager for various services"""
+    """GCP client manager for various services.
+
+    Credentials are parsed once and each client is built on first use and
+    then reused, so its gRPC/HTTP channel stays open across requests.
+    """
 
     def __init__(self):
         self._credentials = None
+        self._credentials_obj = None
         self._project_id = None
         self._clients = {}
 
@@ -24,78 +29,122 @@ class GCPClientManager:
                 self._project_id = self._credentials.get('project_id')
         return self._credentials
 
+    def _get_credentials_object(self) -> Optional[service_account.Credentials]:
+        """Get the service account credentials object, built once"""
+        if self._credentials_obj is None:
+            credentials = self._get_credentials()
+            if credentials:
+                self._credentials_obj = service_account.Credentials.from_service_account_info(
+                    credentials)
+        return self._credentials_obj
+
+    def get_scoped_credentials(self, scopes: List[str]) -> Optional[service_account.Credentials]:
+        """Get the shared credentials narrowed to scopes, reusing the parsed key"""
+        credentials_obj = self._get_credentials_object()
+        if credentials_obj is None:
+            return None
+        return credentials_obj.with_scopes(scopes)
+
     def get_storage_client(self) -> Optional[storage.Client]:
         """Get Google Cloud Storage client"""
+        client = self._clients.get("storage")
+        if client is not None:
+            return client
         try:
-            credentials = self._get_credentials()
-            if not credentials:
+            credentials_obj = self._get_credentials_object()
+            if not credentials_obj:
                 logger.warning(
                     "No GCP credentials available for Storage client")
                 return None
 
-            credentials_obj = service_account.Credentials.from_service_account_info(
-                credentials)
             client = storage.Client(
                 credentials=credentials_obj, project=self._project_id)
+            self._clients["storage"] = client
             logger.debug("Created GCP Storage client")
             return client
         except Exception as e:
-            logger.error(f"Failed to create GCP Storage client: {e}")
+            logger.error("Failed to create GCP Storage client: %s", e)
             return None
 
     def get_translate_client(self) -> Optional[translate.Client]:
         """Get Google Cloud Translation client"""
+        client = self._clients.get("translate")
+        if client is not None:
+            return client
         try:
-            credentials = self._get_credentials()
-            if not credentials:
+            credentials_obj = self._get_credentials_object()
+            if not credentials_obj:
                 logger.warning(
                     "No GCP credentials available for Translation client")
                 return None
 
-            credentials_obj = service_account.Credentials.from_service_account_info(
-                credentials)
             client = translate.Client(credentials=credentials_obj)
+            self._clients["translate"] = client
             logger.debug("Created GCP Translation client")
             return client
         except Exception as e:
-            logger.error(f"Failed to create GCP Translation client: {e}")
+            logger.error("Failed to create GCP Translation client: %s", e)
             return None
 
     def get_vision_client(self) -> Optional[vision.ImageAnnotatorClient]:
         """Get Google Cloud Vision client"""
+        client = self._clients.get("vision")
+        if client is not None:
+            return client
         try:
-            credentials = self._get_credentials()
-            if not credentials:
+            credentials_obj = self._get_credentials_object()
+            if not credentials_obj:
                 logger.warning(
                     "No GCP credentials available for Vision client")
                 return None
 
-            credentials_obj = service_account.Credentials.from_service_account_info(
-                credentials)
             client = vision.ImageAnnotatorClient(credentials=credentials_obj)
+            self._clients["vision"] = client
             logger.debug("Created GCP Vision client")
             return client
         except Exception as e:
-            logger.error(f"Failed to create GCP Vision client: {e}")
+            logger.error("Failed to create GCP Vision client: %s", e)
             return None
 
     def get_text_to_speech_client(self) -> Optional[texttospeech.TextToSpeechClient]:
         """Get Google Cloud Text-to-Speech client"""
+        client = self._clients.get("text_to_speech")
+        if client is not None:
+            return client
         try:
-            credentials = self._get_credentials()
-            if not credentials:
+            credentials_obj = self._get_credentials_object()
+            if not credentials_obj:
                 logger.warning(
                     "No GCP credentials available for Text-to-Speech client")
                 return None
 
-            credentials_obj = service_account.Credentials.from_service_account_info(
-                credentials)
             client = texttospeech.TextToSpeechClient(
                 credentials=credentials_obj)
+            self._clients["text_to_speech"] = client
             logger.debug("Created GCP Text-to-Speech client")
             return client
         except Exception as e:
-            logger.error(f"Failed to create GCP Text-to-Speech client: {e}")
+            logger.error("Failed to create GCP Text-to-Speech client: %s", e)
+            return None
+
+    def get_speech_client(self) -> Optional[speech.SpeechClient]:
+        """Get Google Cloud Speech-to-Text client"""
+        client = self._clients.get("speech")
+        if client is not None:
+            return client
+        try:
+            credentials_obj = self._get_credentials_object()
+            if not credentials_obj:
+                logger.warning(
+                    "No GCP credentials available for Speech client")
+                return None
+
+            client = speech.SpeechClient(credentials=credentials_obj)
+            self._clients["speech"] = client
+            logger.debug("Created GCP Speech client")
+            return client
+        except Exception as e:
+            logger.error("Failed to create GCP Speech client: %s", e)
             return None
 
 
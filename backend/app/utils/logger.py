@@ -1,19 +1,52 @@
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 from app.core.config import settings
 
+# Writes queued records to stdout on its own thread so request handlers never block on the stream
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 
 def setup_logging() -> None:
     """Setup logging configuration"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ]
-    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    log_queue = queue.SimpleQueue()
+    # Only merge args into the message here; stream_handler adds the prefix
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    # Replace direct stream handlers (e.g. from an earlier basicConfig) so
+    # records only reach the stream through the listener thread
+    for handler in list(root.handlers):
+        if type(handler) is logging.StreamHandler:
+            root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(log_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        _listener = None
+        _queue_handler = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import DateTime, literal, tuple_
+from sqlalchemy.dialects import sqlite
+
+# created_at comes from CURRENT_TIMESTAMP, which SQLite stores without
+# microseconds; bind seek values in the same text format so ties compare equal
+_SeekTimestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
+
+
+def encode_cursor(row: Any) -> str:
+    """Encode the keyset position after a row with created_at and id"""
+    raw = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a keyset cursor; raises ValueError if it is malformed"""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def paginate_newest_first(query, model, skip: int, limit: int, cursor: Optional[str]):
+    """Order by (created_at, id) descending and page by keyset cursor when given, else by offset"""
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(model.created_at, model.id)
+            < tuple_(literal(created_at, _SeekTimestamp), literal(row_id))
+        )
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
@@ -13,10 +13,12 @@ from app.models.isl_video import ISLVideo
 from app.models.general_announcement import GeneralAnnouncement
 from app.models.announcement_template import AnnouncementTemplateModel
 from app.models.isl_announcement import ISLAnnouncement
-from app.db.database import engine, AsyncSessionLocal, Base
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import engine, Base
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import asyncio
 import sys
+from typing import Awaitable
 from pathlib import Path
 
 # Add the app directory to the Python path
@@ -26,50 +28,41 @@ sys.path.append(str(Path(__file__).parent))
 logger = get_logger(__name__)
 
 
-async def create_tables():
-    """Create all database tables."""
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+async def create_tables_and_admin(hashed_password: Awaitable[str]):
+    """Create all database tables and the default admin user if it doesn't exist."""
     logger.info("Creating database tables...")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables created successfully!")
-
-
-async def create_default_admin():
-    """Create default admin user if it doesn't exist."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Check if admin user already exists
-            from sqlalchemy import select
-            result = await session.execute(
-                select(User).where(User.username == "admin")
-            )
-            existing_admin = result.scalar_one_or_none()
-
-            if existing_admin:
-                logger.info("Admin user already exists, skipping creation.")
-                return
-
-            # Create admin user
-            admin_user = User(
+        logger.info("Database tables created successfully!")
+
+        # A single INSERT ... ON CONFLICT DO NOTHING replaces the
+        # SELECT / INSERT / COMMIT / refresh sequence
+        insert = _UPSERT_INSERTS[conn.dialect.name]
+        result = await conn.execute(
+            insert(User)
+            .values(
                 username="admin",
-                hashed_password=get_password_hash("admin"),
+                hashed_password=await hashed_password,
                 is_active=True,
                 is_superuser=True
             )
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User.id)
+        )
+        admin_id = result.scalar_one_or_none()
 
-            session.add(admin_user)
-            await session.commit()
-            await session.refresh(admin_user)
+    if admin_id is None:
+        logger.info("Admin user already exists, skipping creation.")
+        return
 
-            logger.info(f"Default admin user created successfully!")
-            logger.info(f"Username: admin")
-            logger.info(f"Password: admin")
-            logger.info(f"User ID: {admin_user.id}")
-
-        except Exception as e:
-            logger.error(f"Error creating admin user: {e}")
-            await session.rollback()
-            raise
+    logger.info(f"Default admin user created successfully!")
+    logger.info(f"Username: admin")
+    logger.info(f"Password: admin")
+    logger.info(f"User ID: {admin_id}")
 
 
 async def init_database():
@@ -77,11 +70,11 @@ async def init_database():
     try:
         logger.info("Starting database initialization...")
 
-        # Create tables
-        await create_tables()
-
-        # Create default admin user
-        await create_default_admin()
+        # bcrypt is CPU-bound: hash the admin password on a thread while
+        # the tables are created, then insert the admin in the same transaction
+        hashed_password = asyncio.ensure_future(
+            asyncio.to_thread(get_password_hash, "admin"))
+        await create_tables_and_admin(hashed_password)
 
         logger.info("Database initialization completed successfully!")
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the search and pagination indexes (and, on PostgreSQL, the
+full-text search_tsv column) on general_announcements.
+Fresh databases get them from init_db.py; run this once on existing databases.
+"""
+
+from app.utils.logger import get_logger
+from app.models.general_announcement import GeneralAnnouncement, SEARCHABLE_COLUMNS, SEARCH_TSV_DDL, SEARCH_TSV_INDEX_DDL
+from app.db.database import engine
+from sqlalchemy import text
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+logger = get_logger(__name__)
+
+
+async def create_search_indexes():
+    """Create the general announcement indexes that do not exist yet."""
+    logger.info("Creating general announcement search indexes...")
+    try:
+        async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.execute(text(SEARCH_TSV_DDL))
+                await conn.execute(text(SEARCH_TSV_INDEX_DDL))
+                # Per-column trigram indexes superseded by the one on the joined texts
+                for column in SEARCHABLE_COLUMNS:
+                    await conn.execute(text(f"DROP INDEX IF EXISTS ix_general_announcements_{column}_trgm"))
+            for index in GeneralAnnouncement.__table__.indexes:
+                # Dialect-specific indexes (ddl_if) are skipped automatically
+                await conn.run_sync(lambda sync_conn: index.create(sync_conn, checkfirst=True))
+        logger.info("General announcement search indexes created successfully!")
+    except Exception as e:
+        logger.error(f"Error creating general announcement search indexes: {e}")
+        raise
+
+
+async def migrate_database():
+    """Run the migration."""
+    try:
+        logger.info("Starting general announcement index migration...")
+        await create_search_indexes()
+        logger.info("General announcement index migration completed successfully!")
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_database())
@@ -6,8 +6,8 @@ This script creates the new isl_announcements table without affecting existing d
 
 from app.utils.logger import get_logger
 from app.models.isl_announcement import ISLAnnouncement
-from app.db.database import engine, AsyncSessionLocal, Base
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import engine, Base
+from sqlalchemy import inspect
 import asyncio
 import sys
 from pathlib import Path
@@ -18,40 +18,29 @@ sys.path.append(str(Path(__file__).parent))
 logger = get_logger(__name__)
 
 
+def _create_and_verify(sync_conn) -> bool:
+    """Create the ISL announcements table and report whether it now exists."""
+    # Create only the ISL announcements table; model.metadata is the
+    # shared Base.metadata, so without tables= every table is checked
+    Base.metadata.create_all(sync_conn, tables=[ISLAnnouncement.__table__])
+    return inspect(sync_conn).has_table(ISLAnnouncement.__tablename__)
+
+
 async def create_isl_announcements_table():
-    """Create the ISL announcements table."""
+    """Create the ISL announcements table and verify it on the same connection."""
     logger.info("Creating ISL announcements table...")
     try:
         async with engine.begin() as conn:
-            # Create only the ISL announcements table
-            await conn.run_sync(ISLAnnouncement.metadata.create_all)
+            table_exists = await conn.run_sync(_create_and_verify)
+        if not table_exists:
+            logger.error("ISL announcements table was not created!")
+            raise Exception("Table creation verification failed")
         logger.info("ISL announcements table created successfully!")
     except Exception as e:
         logger.error(f"Error creating ISL announcements table: {e}")
         raise
 
 
-async def verify_table_creation():
-    """Verify that the table was created successfully."""
-    logger.info("Verifying table creation...")
-    try:
-        async with AsyncSessionLocal() as session:
-            # Try to query the table to verify it exists
-            from sqlalchemy import text
-            result = await session.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='isl_announcements'"))
-            table_exists = result.fetchone() is not None
-            
-            if table_exists:
-                logger.info("ISL announcements table verified successfully!")
-            else:
-                logger.error("ISL announcements table was not created!")
-                raise Exception("Table creation verification failed")
-                
-    except Exception as e:
-        logger.error(f"Error verifying table creation: {e}")
-        raise
-
-
 async def migrate_database():
     """Run the migration."""
     try:
@@ -60,9 +49,6 @@ async def migrate_database():
         # Create the table
         await create_isl_announcements_table()
         
-        # Verify the table was created
-        await verify_table_creation()
-        
         logger.info("ISL announcements table migration completed successfully!")
         
     except Exception as e:
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the search and pagination indexes on isl_announcements and
+isl_videos (and, on PostgreSQL, the full-text search_tsv column on isl_announcements).
+Fresh databases get them from init_db.py; run this once on existing databases.
+"""
+
+from app.utils.logger import get_logger
+from app.models.isl_announcement import ISLAnnouncement, SEARCH_TSV_DDL, SEARCH_TSV_INDEX_DDL
+from app.models.isl_announcement import SEARCHABLE_COLUMNS as ANNOUNCEMENT_SEARCH_COLUMNS
+from app.models.isl_video import ISLVideo
+from app.models.isl_video import SEARCHABLE_COLUMNS as VIDEO_SEARCH_COLUMNS
+from app.db.database import engine
+from sqlalchemy import text
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+logger = get_logger(__name__)
+
+
+async def create_search_indexes():
+    """Create the ISL announcement and video indexes that do not exist yet."""
+    logger.info("Creating ISL search indexes...")
+    try:
+        async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.execute(text(SEARCH_TSV_DDL))
+                await conn.execute(text(SEARCH_TSV_INDEX_DDL))
+                # Plain-column trigram indexes superseded by the lower(col) ones on
+                # isl_videos, and the per-column ones on isl_announcements, which
+                # now has a single index on its joined texts
+                for column in VIDEO_SEARCH_COLUMNS:
+                    await conn.execute(text(f"DROP INDEX IF EXISTS ix_isl_videos_{column}_trgm"))
+                for column in ANNOUNCEMENT_SEARCH_COLUMNS:
+                    await conn.execute(text(f"DROP INDEX IF EXISTS ix_isl_announcements_{column}_trgm"))
+                    await conn.execute(text(f"DROP INDEX IF EXISTS ix_isl_announcements_{column}_lower_trgm"))
+            for model in (ISLAnnouncement, ISLVideo):
+                for index in model.__table__.indexes:
+                    # Dialect-specific indexes (ddl_if) are skipped automatically
+                    await conn.run_sync(lambda sync_conn: index.create(sync_conn, checkfirst=True))
+        logger.info("ISL search indexes created successfully!")
+    except Exception as e:
+        logger.error(f"Error creating ISL search indexes: {e}")
+        raise
+
+
+async def migrate_database():
+    """Run the migration."""
+    try:
+        logger.info("Starting ISL search index migration...")
+        await create_search_indexes()
+        logger.info("ISL search index migration completed successfully!")
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_database())
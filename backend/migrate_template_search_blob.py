@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the generated search_blob column to announcement_templates.
+Fresh databases get the column from init_db.py; run this once on existing databases.
+"""
+
+from app.utils.logger import get_logger
+from app.models.announcement_template import SEARCH_BLOB_EXPRESSION
+from app.db.database import engine
+from sqlalchemy import inspect, text
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+logger = get_logger(__name__)
+
+
+async def add_search_blob_column():
+    """Add the search_blob generated column (and trigram index on PostgreSQL)."""
+    logger.info("Adding search_blob column to announcement_templates...")
+    try:
+        async with engine.begin() as conn:
+            columns = await conn.run_sync(
+                lambda sync_conn: [c["name"] for c in inspect(sync_conn).get_columns("announcement_templates")]
+            )
+            if "search_blob" in columns:
+                logger.info("search_blob column already exists, skipping.")
+                return
+
+            if conn.dialect.name == "postgresql":
+                await conn.execute(text(
+                    "ALTER TABLE announcement_templates ADD COLUMN search_blob TEXT "
+                    f"GENERATED ALWAYS AS ({SEARCH_BLOB_EXPRESSION}) STORED"
+                ))
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_announcement_templates_search_blob "
+                    "ON announcement_templates USING gin (search_blob gin_trgm_ops)"
+                ))
+            else:
+                # SQLite cannot ALTER TABLE ADD a STORED generated column; VIRTUAL
+                # is computed on read, which is still a single expression per row
+                await conn.execute(text(
+                    "ALTER TABLE announcement_templates ADD COLUMN search_blob TEXT "
+                    f"GENERATED ALWAYS AS ({SEARCH_BLOB_EXPRESSION}) VIRTUAL"
+                ))
+        logger.info("search_blob column added successfully!")
+    except Exception as e:
+        logger.error(f"Error adding search_blob column: {e}")
+        raise
+
+
+async def migrate_database():
+    """Run the migration."""
+    try:
+        logger.info("Starting announcement template search_blob migration...")
+        await add_search_blob_column()
+        logger.info("Announcement template search_blob migration completed successfully!")
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_database())
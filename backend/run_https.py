@@ -1,19 +1,41 @@
 import uvicorn
-import os
-from app.main import asgi_app
+from pathlib import Path
 from app.core.config import settings
 
+# Resolved once at import from the project root
+CERT_DIR = Path(__file__).resolve().parents[1] / "scripts" / "certs"
+SSL_KEYFILE = str(CERT_DIR / "server.key")
+SSL_CERTFILE = str(CERT_DIR / "server.crt")
+
 if __name__ == "__main__":
-    # Get the project root directory dynamically
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    cert_dir = os.path.join(project_root, "scripts", "certs")
+    if settings.UDS_PATH:
+        # The reverse proxy terminates TLS
+        bind = {"uds": settings.UDS_PATH}
+    else:
+        bind = {
+            "host": settings.HOST,
+            "port": settings.PORT,
+            "ssl_keyfile": SSL_KEYFILE,
+            "ssl_certfile": SSL_CERTFILE,
+            # Forward-secret AEAD suites only. uvicorn builds one context per worker
+            # and OpenSSL leaves session tickets on, so returning clients resume.
+            "ssl_ciphers": "ECDHE+AESGCM:ECDHE+CHACHA20",
+        }
 
     uvicorn.run(
         "app.main:asgi_app",
-        host=settings.HOST,
-        port=settings.PORT,
+        **bind,
         reload=settings.DEBUG,
+        # The reloader only supports a single process
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        # C event loop and HTTP parser from uvicorn[standard]
+        loop="uvloop",
+        http="httptools",
         log_level="debug" if settings.DEBUG else "info",
-        ssl_keyfile=os.path.join(cert_dir, "server.key"),
-        ssl_certfile=os.path.join(cert_dir, "server.crt")
+        # One log line per request is pure overhead in production
+        access_log=settings.DEBUG,
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE,
+        backlog=settings.BACKLOG,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        limit_max_requests=settings.LIMIT_MAX_REQUESTS,
     )
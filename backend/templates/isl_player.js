@@ -0,0 +1,162 @@
+// ISL display player; per-page settings are set inline by index.html
+const displayConfig = window.islDisplayConfig || { playbackSpeed: 1, showText: false };
+const playbackSpeed = displayConfig.playbackSpeed;
+
+// Ensure video plays automatically with specified playback speed
+document.addEventListener('DOMContentLoaded', function() {
+    const video = document.getElementById('islVideo');
+    if (video) {
+        // Set playback speed immediately
+        video.playbackRate = playbackSpeed;
+        console.log('Video playback speed set to:', playbackSpeed + 'x');
+
+        // Also set playback speed when video is ready
+        video.addEventListener('loadedmetadata', function() {
+            video.playbackRate = playbackSpeed;
+            console.log('Playback speed re-applied on loadedmetadata:', playbackSpeed + 'x');
+        });
+
+        video.addEventListener('canplay', function() {
+            video.playbackRate = playbackSpeed;
+            console.log('Playback speed re-applied on canplay:', playbackSpeed + 'x');
+        });
+
+        video.play().catch(function(error) {
+            console.log('Autoplay failed:', error);
+            // Try to play again after user interaction
+            document.addEventListener('click', function() {
+                video.play();
+            }, { once: true });
+        });
+    }
+});
+
+// Additional safety: Set playback speed on any video event
+document.addEventListener('DOMContentLoaded', function() {
+    const video = document.getElementById('islVideo');
+    if (video) {
+        // Set playback speed on multiple events to ensure it sticks
+        const setPlaybackSpeed = function() {
+            video.playbackRate = playbackSpeed;
+            console.log('Playback speed enforced:', playbackSpeed + 'x');
+        };
+
+        video.addEventListener('loadstart', setPlaybackSpeed);
+        video.addEventListener('loadeddata', setPlaybackSpeed);
+        video.addEventListener('loadedmetadata', setPlaybackSpeed);
+        video.addEventListener('canplay', setPlaybackSpeed);
+        video.addEventListener('canplaythrough', setPlaybackSpeed);
+        video.addEventListener('play', setPlaybackSpeed);
+        video.addEventListener('playing', setPlaybackSpeed);
+    }
+});
+// Text rotation functionality
+let textMessages = [];
+let currentMessageIndex = 0;
+let currentLanguageIndex = 0;
+const languages = ['english', 'hindi', 'marathi', 'gujarati'];
+const languageColors = {
+    'english': '#ffffff',
+    'hindi': '#ffd700',
+    'marathi': '#00ff00',
+    'gujarati': '#ff6b6b'
+};
+
+function displayCurrentText() {
+    if (textMessages.length === 0) return;
+
+    const currentMessage = textMessages[currentMessageIndex];
+    const currentLanguage = languages[currentLanguageIndex];
+    const textElement = document.getElementById('textContent');
+
+    if (currentMessage[currentLanguage]) {
+        // Create the new text element
+        const newTextElement = document.createElement('div');
+        newTextElement.className = `language-text ${currentLanguage}`;
+        newTextElement.style.color = languageColors[currentLanguage];
+        newTextElement.textContent = currentMessage[currentLanguage];
+
+        // Add fade effect by removing the active class before replacing the text
+        const currentTextElement = textElement.querySelector('.language-text');
+        if (currentTextElement) {
+            currentTextElement.classList.remove('active');
+
+            // Wait for fade-out to complete before switching text
+            setTimeout(() => {
+                textElement.innerHTML = '';
+                textElement.appendChild(newTextElement);
+
+                // Make text visible again
+                setTimeout(() => {
+                    newTextElement.classList.add('active');
+                }, 50);
+            }, 500); // Fade-out time (in ms)
+        } else {
+            // First time - just add the text
+            textElement.appendChild(newTextElement);
+            setTimeout(() => {
+                newTextElement.classList.add('active');
+            }, 50);
+        }
+    } else {
+        // Find next available language for this message
+        let nextLanguageIndex = (currentLanguageIndex + 1) % languages.length;
+        let attempts = 0;
+        while (!currentMessage[languages[nextLanguageIndex]] && attempts < languages.length) {
+            nextLanguageIndex = (nextLanguageIndex + 1) % languages.length;
+            attempts++;
+        }
+
+        if (currentMessage[languages[nextLanguageIndex]]) {
+            currentLanguageIndex = nextLanguageIndex;
+            const language = languages[currentLanguageIndex];
+
+            // Create the new text element
+            const newTextElement = document.createElement('div');
+            newTextElement.className = `language-text ${language}`;
+            newTextElement.style.color = languageColors[language];
+            newTextElement.textContent = currentMessage[language];
+
+            // Add fade effect
+            const currentTextElement = textElement.querySelector('.language-text');
+            if (currentTextElement) {
+                currentTextElement.classList.remove('active');
+
+                setTimeout(() => {
+                    textElement.innerHTML = '';
+                    textElement.appendChild(newTextElement);
+
+                    setTimeout(() => {
+                        newTextElement.classList.add('active');
+                    }, 50);
+                }, 500);
+            } else {
+                textElement.appendChild(newTextElement);
+                setTimeout(() => {
+                    newTextElement.classList.add('active');
+                }, 50);
+            }
+        }
+    }
+
+    // Move to next language
+    currentLanguageIndex = (currentLanguageIndex + 1) % languages.length;
+
+    // If we've shown all languages for this message, move to next message
+    if (currentLanguageIndex === 0) {
+        currentMessageIndex = (currentMessageIndex + 1) % textMessages.length;
+    }
+}
+
+// Messages live in a sibling file so the page stays cacheable;
+// start text rotation once they arrive
+if (displayConfig.showText) {
+    fetch('messages.json?v=' + Date.now())
+        .then(response => response.json())
+        .then(messages => {
+            textMessages = messages;
+            displayCurrentText();
+            setInterval(displayCurrentText, 10000); // 10 seconds per language
+        })
+        .catch(error => console.log('Failed to load text messages:', error));
+}
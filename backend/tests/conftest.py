@@ -0,0 +1,73 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Register every table on Base.metadata
+import app.models  # noqa: F401
+import app.models.isl_announcement  # noqa: F401
+from app.db.database import Base, get_db
+from app.main import app
+from app.services import (
+    announcement_template_service,
+    general_announcement_service,
+    isl_announcement_service,
+    isl_video_service,
+)
+
+# Module-level read caches that would otherwise carry rows between test databases
+_DB_CACHES = (
+    announcement_template_service._categories_cache,
+    announcement_template_service._template_texts_cache,
+    general_announcement_service._count_cache,
+    general_announcement_service._statistics_cache,
+    general_announcement_service.response_cache,
+    isl_announcement_service._count_cache,
+    isl_announcement_service._statistics_cache,
+    isl_video_service._statistics_cache,
+)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client(anyio_backend):
+    # Run the app lifespan and build the transport once for the whole session
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Session factory bound to a fresh SQLite database for one test"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    for cache in _DB_CACHES:
+        cache.clear()
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    for cache in _DB_CACHES:
+        cache.clear()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def api_client(client, session_factory):
+    """The shared client with get_db pointed at the test database"""
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield client
+    app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.general_announcement import GeneralAnnouncementCreate, GeneralAnnouncementSearch
+from app.services.general_announcement_service import GeneralAnnouncementService
+
+pytestmark = pytest.mark.anyio
+
+
+def make_announcement(name, text="Attention please", **fields):
+    return GeneralAnnouncementCreate(
+        announcement_name=name,
+        category=fields.pop("category", "General"),
+        model=fields.pop("model", "male"),
+        announcement_text_english=text,
+        **fields,
+    )
+
+
+async def search(service, search_text):
+    announcements, total = await service.combined_search(
+        GeneralAnnouncementSearch(search_text=search_text, limit=100)
+    )
+    assert total == len(announcements)
+    return sorted(a.announcement_name for a in announcements)
+
+
+async def test_search_matches_partial_terms_across_texts(db):
+    service = GeneralAnnouncementService(db)
+    await service.create_announcement(make_announcement("arrival", "Train 12345 is Arriving on platform 2"))
+    await service.create_announcement(make_announcement("hindi", "Platform change", announcement_text_hindi="गाड़ी आ रही है"))
+    await service.create_announcement(make_announcement("cleaning", "Keep the station clean"))
+
+    assert await search(service, "arriv") == ["arrival"]
+    assert await search(service, "PLATFORM") == ["arrival", "hindi"]
+    assert await search(service, "आ रही") == ["hindi"]
+    # Partial names match too
+    assert await search(service, "clean") == ["cleaning"]
+    assert await search(service, "delayed") == []
+
+
+def test_postgresql_search_combines_full_text_and_trigram_substring():
+    # Compile-level only: tsvector and pg_trgm need a PostgreSQL server
+    dialect = postgresql.dialect()
+    service = GeneralAnnouncementService(SimpleNamespace(bind=SimpleNamespace(dialect=dialect)))
+
+    sql = str(service._text_search_condition("arriv").compile(dialect=dialect))
+
+    assert "search_tsv @@ websearch_to_tsquery" in sql
+    assert "coalesce(general_announcements.announcement_name, '') || ' ' ||" in sql
+    assert "ILIKE" in sql
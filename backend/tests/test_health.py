@@ -1,31 +1,21 @@
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.anyio
 
 
-def test_health_check():
-    response = client.get("/api/v1/health/")
+@pytest.mark.parametrize(
+    "path,expected_keys,expected_values",
+    [
+        ("/api/v1/health/", {"timestamp"}, {"status": "healthy", "service": "SignVerse API"}),
+        ("/api/v1/health/ready", {"timestamp"}, {"status": "ready", "service": "SignVerse API"}),
+        ("/", {"message", "version"}, {}),
+    ],
+    ids=["health_check", "readiness_check", "root_endpoint"],
+)
+async def test_endpoint(client, path, expected_keys, expected_values):
+    response = await client.get(path)
     assert response.status_code == 200
     data = response.json()
-    assert data["status"] == "healthy"
-    assert "timestamp" in data
-    assert data["service"] == "SignVerse API"
-
-
-def test_readiness_check():
-    response = client.get("/api/v1/health/ready")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "ready"
-    assert "timestamp" in data
-    assert data["service"] == "SignVerse API"
-
-
-def test_root_endpoint():
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
-    assert "message" in data
-    assert "version" in data
+    assert expected_keys <= data.keys()
+    for key, value in expected_values.items():
+        assert data[key] == value
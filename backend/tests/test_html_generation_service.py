@@ -0,0 +1,62 @@
+import errno
+import os
+
+from app.services import html_generation_service
+from app.services.html_generation_service import HTMLGenerationService
+
+
+def test_publishing_same_video_twice_links_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(html_generation_service, "_published_video", None)
+    links = []
+    real_link = os.link
+
+    def counting_link(src, dst):
+        links.append(src)
+        real_link(src, dst)
+
+    monkeypatch.setattr(html_generation_service.os, "link", counting_link)
+    source = tmp_path / "generated.mp4"
+    source.write_bytes(b"video")
+    destination = tmp_path / "isl.mp4"
+
+    assert HTMLGenerationService._sync_copy(source, destination)
+    assert HTMLGenerationService._sync_copy(source, destination)
+
+    assert len(links) == 1
+    assert os.path.samefile(source, destination)
+    assert not (tmp_path / ".isl.mp4.tmp").exists()
+
+
+def test_publish_video_copies_across_devices(tmp_path, monkeypatch):
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(html_generation_service.os, "link", cross_device_link)
+    source = tmp_path / "generated.mp4"
+    source.write_bytes(b"video" * 1000)
+    destination = tmp_path / "isl.mp4"
+    destination.write_bytes(b"previous")
+
+    html_generation_service._publish_video(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert not os.path.samefile(source, destination)
+    assert not (tmp_path / ".isl.mp4.tmp").exists()
+
+
+def test_identical_html_is_not_rewritten(tmp_path):
+    page = tmp_path / "index.html"
+    content = b"<html>ISL</html>"
+    assert html_generation_service._write_with_gzip(page, content)
+    gz_page = tmp_path / "index.html.gz"
+    os.utime(page, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(gz_page, ns=(1_000_000_000, 1_000_000_000))
+
+    assert not html_generation_service._write_with_gzip(page, content)
+
+    assert page.stat().st_mtime_ns == 1_000_000_000
+    assert gz_page.stat().st_mtime_ns == 1_000_000_000
+
+    assert html_generation_service._write_with_gzip(page, b"<html>changed</html>")
+    assert page.read_bytes() == b"<html>changed</html>"
+    assert page.stat().st_mtime_ns != 1_000_000_000
@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.isl_announcement import ISLAnnouncement
+from app.schemas.isl_announcement import ISLAnnouncementCreate, ISLAnnouncementSearch, ISLAnnouncementVideoUpdate
+from app.services.isl_announcement_service import ISLAnnouncementService
+
+pytestmark = pytest.mark.anyio
+
+
+def make_announcement(name, category="Arrival", model="male", user_id=1, **fields):
+    return ISLAnnouncementCreate(
+        announcement_name=name,
+        category=category,
+        model=model,
+        announcement_text_english=fields.pop("text", f"{name} text"),
+        user_id=user_id,
+        **fields,
+    )
+
+
+async def test_create_announcements_bulk_returns_inserted_rows(db):
+    service = ISLAnnouncementService(db)
+    items = [
+        make_announcement("first", category="Arrival", model="male", user_id=1),
+        make_announcement("second", category="Departure", model="female", user_id=2),
+        make_announcement("third", category="Arrival", model="female", user_id=1),
+    ]
+
+    created = await service.create_announcements_bulk(items)
+
+    assert [a.announcement_name for a in created] == ["first", "second", "third"]
+    assert len({a.id for a in created}) == 3
+    assert all(a.created_at is not None for a in created)
+    assert created[1].category == "Departure"
+    assert created[1].model == "female"
+    assert created[1].user_id == 2
+
+    stored = (await db.scalars(select(ISLAnnouncement).order_by(ISLAnnouncement.id))).all()
+    assert [(a.id, a.announcement_name) for a in stored] == [(a.id, a.announcement_name) for a in created]
+
+
+async def test_create_announcements_bulk_empty(db):
+    assert await ISLAnnouncementService(db).create_announcements_bulk([]) == []
+
+
+async def test_hard_delete_announcements_bulk(db, tmp_path):
+    service = ISLAnnouncementService(db)
+    created = await service.create_announcements_bulk([
+        make_announcement("keep", category="Arrival", user_id=1),
+        make_announcement("drop-a", category="Departure", user_id=2),
+        make_announcement("drop-b", category="Departure", model="female", user_id=2),
+    ])
+    keep, drop_a, drop_b = created
+    video_a = tmp_path / "drop-a.mp4"
+    video_a.write_bytes(b"video")
+    await service.update_video_info(drop_a.id, ISLAnnouncementVideoUpdate(final_video_path=str(video_a)))
+    # Cache the statistics so the deletion has to adjust them in place
+    await service.get_announcement_statistics()
+
+    deleted = await service.hard_delete_announcements_bulk([drop_a.id, drop_b.id, 9999])
+
+    assert deleted == 2
+    assert not video_a.exists()
+    statistics = await service.get_announcement_statistics()
+    assert statistics == await service._compute_announcement_statistics()
+    assert statistics.total_announcements == 1
+    assert statistics.announcements_by_category == {"Arrival": 1}
+    assert statistics.announcements_by_user == {"1": 1}
+    assert await service.get_announcement(keep.id) is not None
+    assert await service.hard_delete_announcements_bulk([drop_a.id]) == 0
+
+
+async def test_search_matches_partial_terms_across_texts(db):
+    service = ISLAnnouncementService(db)
+    await service.create_announcements_bulk([
+        make_announcement("arrival", text="Train 12345 is Arriving on platform 2"),
+        make_announcement("hindi", text="Platform change", announcement_text_hindi="गाड़ी आ रही है"),
+        make_announcement("cleaning", text="Keep the station clean"),
+    ])
+
+    async def search(search_text):
+        announcements, total = await service.combined_search(
+            ISLAnnouncementSearch(search_text=search_text, limit=100)
+        )
+        assert total == len(announcements)
+        return sorted(a.announcement_name for a in announcements)
+
+    assert await search("arriv") == ["arrival"]
+    assert await search("PLATFORM") == ["arrival", "hindi"]
+    assert await search("आ रही") == ["hindi"]
+    assert await search("delayed") == []
+
+
+def test_postgresql_search_combines_full_text_and_trigram_substring():
+    # Compile-level only: tsvector and pg_trgm need a PostgreSQL server
+    dialect = postgresql.dialect()
+    service = ISLAnnouncementService(SimpleNamespace(bind=SimpleNamespace(dialect=dialect)))
+
+    sql = str(service._text_search_condition("arriv").compile(dialect=dialect))
+
+    assert "search_tsv @@ websearch_to_tsquery" in sql
+    assert "coalesce(isl_announcements.announcement_name, '') || ' ' ||" in sql
+    assert "ILIKE" in sql
+
+
+async def test_statistics_overview_tracks_writes(api_client, db):
+    async def assert_overview_is_fresh():
+        response = await api_client.get("/api/v1/isl-announcements/statistics/overview")
+        assert response.status_code == 200
+        expected = await ISLAnnouncementService(db)._compute_announcement_statistics()
+        assert response.json() == expected.model_dump(mode="json")
+        return response.json()
+
+    ids = []
+    for name, category, user_id in [("one", "Arrival", 1), ("two", "Arrival", 2), ("three", "Departure", 1)]:
+        response = await api_client.post("/api/v1/isl-announcements/", json=make_announcement(
+            name, category=category, user_id=user_id
+        ).model_dump(mode="json"))
+        assert response.status_code == 200
+        ids.append(response.json()["id"])
+        await assert_overview_is_fresh()
+
+    response = await api_client.put(f"/api/v1/isl-announcements/{ids[0]}", json={"category": "Platform Change"})
+    assert response.status_code == 200
+    overview = await assert_overview_is_fresh()
+    assert overview["announcements_by_category"] == {"Arrival": 1, "Departure": 1, "Platform Change": 1}
+
+    response = await api_client.put(
+        f"/api/v1/isl-announcements/{ids[1]}/video", json={"video_generation_status": "completed"}
+    )
+    assert response.status_code == 200
+    overview = await assert_overview_is_fresh()
+    assert overview["announcements_by_status"] == {"pending": 2, "completed": 1}
+
+    response = await api_client.delete(f"/api/v1/isl-announcements/{ids[2]}")
+    assert response.status_code == 200
+    overview = await assert_overview_is_fresh()
+    assert overview["total_announcements"] == 2
+    assert overview["announcements_by_category"] == {"Arrival": 1, "Platform Change": 1}
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.isl_video import ISLVideo
+from app.schemas.isl_video import ISLVideoCreate
+from app.services.isl_video_service import ISLVideoService
+
+pytestmark = pytest.mark.anyio
+
+
+def make_video(name, model_type="male", file_size=1024, video_path=None):
+    return ISLVideoCreate(
+        filename=f"{name}.mp4",
+        display_name=name,
+        video_path=video_path or f"videos/{name}.mp4",
+        file_size=file_size,
+        model_type=model_type,
+    )
+
+
+async def test_create_isl_videos_bulk_returns_inserted_rows(db):
+    service = ISLVideoService(db)
+    items = [make_video("hello", "male", 100), make_video("train", "female", 200)]
+
+    created = await service.create_isl_videos_bulk(items)
+
+    assert [v.display_name for v in created] == ["hello", "train"]
+    assert len({v.id for v in created}) == 2
+    assert [v.model_type for v in created] == ["male", "female"]
+    assert [v.file_size for v in created] == [100, 200]
+    assert created[0].mime_type == "video/mp4"
+
+    stored = (await db.scalars(select(ISLVideo).order_by(ISLVideo.id))).all()
+    assert [v.id for v in stored] == [v.id for v in created]
+
+    statistics = await service.get_video_statistics()
+    assert statistics.total_videos == 2
+    assert statistics.total_size_bytes == 300
+
+
+async def test_hard_delete_isl_videos_bulk(db, tmp_path):
+    service = ISLVideoService(db)
+    files = []
+    for name in ("one", "two", "three"):
+        path = tmp_path / f"{name}.mp4"
+        path.write_bytes(b"video")
+        files.append(path)
+    created = await service.create_isl_videos_bulk([
+        make_video("one", "male", 100, str(files[0])),
+        make_video("two", "female", 200, str(files[1])),
+        make_video("three", "female", 300, str(files[2])),
+    ])
+    await service.get_video_statistics()
+
+    deleted = await service.hard_delete_isl_videos_bulk([created[1].id, created[2].id])
+
+    assert deleted == 2
+    assert [path.exists() for path in files] == [True, False, False]
+    statistics = await service.get_video_statistics()
+    assert statistics.total_videos == 1
+    assert statistics.female_videos == 0
+    assert statistics.total_size_bytes == 100
+    assert await service.hard_delete_isl_videos_bulk([created[1].id]) == 0
+
+
+async def test_duplicate_checks_report_the_oldest_match(db):
+    service = ISLVideoService(db)
+    first, second = await service.create_isl_videos_bulk([
+        make_video("hello", "male", 100, "videos/a/hello.mp4"),
+        make_video("hello", "male", 100, "videos/b/hello.mp4"),
+    ])
+
+    assert (await service.check_duplicate_video("hello.mp4", "male", 100)).id == first.id
+    assert (await service.check_duplicate_by_display_name("hello", "male")).id == first.id
+    assert await service.check_duplicate_video("hello.mp4", "female", 100) is None
@@ -0,0 +1,13 @@
+import logging
+import logging.handlers
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_startup_installs_queue_handler(client):
+    # The client fixture has run the app lifespan
+    handlers = logging.getLogger().handlers
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in handlers)
+    assert not any(type(h) is logging.StreamHandler for h in handlers)
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import text
+
+from app.schemas.general_announcement import GeneralAnnouncementCreate
+from app.schemas.isl_announcement import ISLAnnouncementCreate
+from app.services.general_announcement_service import GeneralAnnouncementService
+from app.services.isl_announcement_service import ISLAnnouncementService
+
+pytestmark = pytest.mark.anyio
+
+# CURRENT_TIMESTAMP format, as the server default stores it on SQLite
+TIED_CREATED_AT = "2026-01-01 12:00:00"
+
+
+async def test_general_announcements_keyset_pages(api_client, db):
+    service = GeneralAnnouncementService(db)
+    for i in range(5):
+        await service.create_announcement(GeneralAnnouncementCreate(
+            announcement_name=f"announcement {i}",
+            category="General",
+            model="male",
+            announcement_text_english="Attention please",
+        ))
+    # Identical created_at on every row: ordering falls back to id
+    await db.execute(text("UPDATE general_announcements SET created_at = :ts"), {"ts": TIED_CREATED_AT})
+    await db.commit()
+
+    response = await api_client.get("/api/v1/general-announcements/", params={"limit": 2})
+    assert response.status_code == 200
+    first = response.json()
+    assert first["total_count"] == 5
+    assert first["next_cursor"]
+
+    seen = [a["id"] for a in first["announcements"]]
+    cursor = first["next_cursor"]
+    pages = 1
+    while cursor:
+        response = await api_client.get(
+            "/api/v1/general-announcements/", params={"limit": 2, "cursor": cursor}
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen += [a["id"] for a in page["announcements"]]
+        cursor = page["next_cursor"]
+        pages += 1
+
+    assert pages == 3
+    # Last page had a single row, so it carried no cursor
+    assert len(page["announcements"]) == 1
+    assert seen == sorted(seen, reverse=True)
+    assert len(set(seen)) == 5
+
+
+async def test_malformed_cursor_is_rejected(api_client):
+    response = await api_client.get("/api/v1/general-announcements/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid cursor")
+
+
+async def test_user_isl_announcements_follow_next_cursor_header(api_client, db):
+    service = ISLAnnouncementService(db)
+    await service.create_announcements_bulk([
+        ISLAnnouncementCreate(
+            announcement_name=f"isl {i}",
+            category="General",
+            model="female",
+            announcement_text_english="Attention please",
+            user_id=7 if i < 3 else 8,
+        )
+        for i in range(4)
+    ])
+    await db.execute(text("UPDATE isl_announcements SET created_at = :ts"), {"ts": TIED_CREATED_AT})
+    await db.commit()
+
+    response = await api_client.get("/api/v1/isl-announcements/user/7", params={"limit": 2})
+    assert response.status_code == 200
+    first = [a["id"] for a in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await api_client.get(
+        "/api/v1/isl-announcements/user/7", params={"limit": 2, "cursor": cursor}
+    )
+    assert response.status_code == 200
+    second = [a["id"] for a in response.json()]
+    assert "X-Next-Cursor" not in response.headers
+
+    assert len(first) == 2 and len(second) == 1
+    assert first + second == sorted(first + second, reverse=True)
+    assert all(a["user_id"] == 7 for a in response.json())
+
+
+async def test_next_cursor_header_is_exposed_to_cors_clients(api_client):
+    response = await api_client.get(
+        "/api/v1/isl-announcements/user/1", headers={"Origin": "http://localhost:3000"}
+    )
+    assert "X-Next-Cursor" in response.headers["access-control-expose-headers"]
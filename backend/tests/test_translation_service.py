@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+from cachetools import LRUCache, TTLCache
+
+from app.api.v1.endpoints import translation as translation_endpoints
+from app.services import translation_service
+from app.services.translation_service import TranslationService
+
+pytestmark = pytest.mark.anyio
+
+
+class StubTranslationClient:
+    """Stands in for TranslationServiceAsyncClient"""
+
+    def __init__(self):
+        self.fail = False
+        self.language_calls = 0
+        self.translate_calls = []
+        self.failing_targets = set()
+
+    async def translate_text(self, contents, parent, mime_type, source_language_code, target_language_code):
+        self.translate_calls.append((target_language_code, list(contents)))
+        if target_language_code in self.failing_targets:
+            raise RuntimeError("quota exceeded")
+        return SimpleNamespace(translations=[SimpleNamespace(
+            translated_text=f"{target_language_code}:{text}", detected_language_code=source_language_code
+        ) for text in contents])
+
+    async def get_supported_languages(self, parent):
+        self.language_calls += 1
+        if self.fail:
+            raise RuntimeError("credentials revoked")
+        return SimpleNamespace(languages=[SimpleNamespace(
+            language_code="hi", display_name="Hindi", support_source=True, support_target=True
+        )])
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(translation_service, "_translation_cache", LRUCache(maxsize=100))
+    monkeypatch.setattr(translation_service, "_supported_languages_cache", TTLCache(maxsize=1, ttl=3600))
+    # Skip _initialize_client, which would load real GCP credentials
+    service = TranslationService.__new__(TranslationService)
+    service.project_id = "test-project"
+    service.client = StubTranslationClient()
+    monkeypatch.setattr(translation_endpoints, "get_translation_service", lambda: service)
+    return service
+
+
+async def test_health_check_bypasses_supported_languages_cache(client, service):
+    response = await client.get("/api/v1/translation/health")
+    assert response.json()["status"] == "healthy"
+    # A normal lookup is now served from the cache
+    assert await service.get_supported_languages()
+    assert service.client.language_calls == 1
+
+    service.client.fail = True
+    response = await client.get("/api/v1/translation/health")
+
+    assert response.json()["status"] == "warning"
+    assert service.client.language_calls == 2
+
+
+async def test_translate_batch_sends_each_distinct_string_once(service):
+    results = await service.translate_batch(["Mumbai", "Pune", "Mumbai", ""], "en", ["hi", "en", "hi"])
+
+    assert service.client.translate_calls == [("hi", ["Mumbai", "Pune"])]
+    assert results == {
+        "Mumbai": {"en": "Mumbai", "hi": "hi:Mumbai"},
+        "Pune": {"en": "Pune", "hi": "hi:Pune"},
+    }
+
+
+async def test_translate_batch_skips_cached_strings(service):
+    await service.translate_batch(["Mumbai"], "en", ["hi"])
+    service.client.translate_calls.clear()
+
+    results = await service.translate_batch(["Mumbai", "Pune"], "en", ["hi"])
+
+    assert service.client.translate_calls == [("hi", ["Pune"])]
+    assert results == {"Mumbai": {"hi": "hi:Mumbai"}, "Pune": {"hi": "hi:Pune"}}
+
+
+async def test_translate_batch_falls_back_to_source_text_on_failure(service):
+    service.client.failing_targets = {"mr"}
+
+    results = await service.translate_batch(["Mumbai", "Pune"], "en", ["hi", "mr"])
+
+    assert results == {
+        "Mumbai": {"hi": "hi:Mumbai", "mr": "Mumbai"},
+        "Pune": {"hi": "hi:Pune", "mr": "Pune"},
+    }
+    # Failures are not cached, so the next call retries them
+    service.client.failing_targets = set()
+    service.client.translate_calls.clear()
+    await service.translate_batch(["Mumbai", "Pune"], "en", ["hi", "mr"])
+    assert service.client.translate_calls == [("mr", ["Mumbai", "Pune"])]
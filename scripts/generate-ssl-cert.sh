@@ -77,7 +77,6 @@ generate_certificate() {
     # Create OpenSSL configuration file
     cat > "$config_file" << EOF
 [req]
-default_bits = 2048
 prompt = no
 default_md = sha256
 distinguished_name = dn
@@ -93,7 +92,7 @@ CN=$ip_address
 
 [v3_req]
 basicConstraints = CA:FALSE
-keyUsage = nonRepudiation, digitalSignature, keyEncipherment
+keyUsage = nonRepudiation, digitalSignature
 subjectAltName = @alt_names
 
 [alt_names]
@@ -103,8 +102,9 @@ IP.3 = ::1
 DNS.1 = localhost
 EOF
 
-    print_info "Generating private key..."
-    openssl genrsa -out "$key_file" 2048
+    # P-256 ECDSA signs handshakes far faster than RSA-2048 and yields a smaller certificate
+    print_info "Generating ECDSA P-256 private key..."
+    openssl ecparam -name prime256v1 -genkey -noout -out "$key_file"
     
     print_info "Generating certificate signing request..."
     openssl req -new -key "$key_file" -out "$cert_dir/server.csr" -config "$config_file"